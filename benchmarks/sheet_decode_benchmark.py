@@ -0,0 +1,63 @@
+"""
+get_dataframe_from_sheet 디코딩 경로 벤치마크 (행 단위 vs 열 단위)
+
+API 호출 없이 values().get 응답과 같은 형태의 2차원 문자열 리스트를 만들어
+두 디코딩 경로의 실행 시간을 비교합니다.
+
+    python benchmarks/sheet_decode_benchmark.py
+"""
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gs_utils.google.sheet_manager import _values_to_dataframe
+
+CELL_COUNTS = [10_000, 100_000, 1_000_000]
+COLUMN_COUNT = 20
+REPEAT = 3
+
+
+def make_values(cell_count, column_count=COLUMN_COUNT, seed=0):
+    """정수(천 단위 구분자 포함), 실수, 문자열, 날짜 열이 섞인 시트 값 생성"""
+    rng = random.Random(seed)
+    makers = [
+        lambda: f"{rng.randint(0, 10_000_000):,}",
+        lambda: f"{rng.uniform(0, 1000):.2f}",
+        lambda: rng.choice(['서울', '부산', '대구', '인천']),
+        lambda: f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+    ]
+    row_count = cell_count // column_count
+    headers = [f"col_{i}" for i in range(column_count)]
+    rows = [[makers[c % len(makers)]() for c in range(column_count)] for _ in range(row_count)]
+    return [headers] + rows
+
+
+def measure(values, columnar):
+    """REPEAT회 실행 중 가장 짧은 시간(초)을 반환"""
+    best = float('inf')
+    for _ in range(REPEAT):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            df = _values_to_dataframe(values, columnar=columnar)
+            best = min(best, time.perf_counter() - start)
+    return best, df
+
+
+def main():
+    print(f"{'cells':>10} | {'row (s)':>9} | {'columnar (s)':>12} | {'speedup':>7} | dtypes")
+    print('-' * 62)
+    for cell_count in CELL_COUNTS:
+        values = make_values(cell_count)
+        row_time, row_df = measure(values, columnar=False)
+        col_time, col_df = measure(values, columnar=True)
+        same_dtypes = row_df.dtypes.tolist() == col_df.dtypes.tolist()
+        print(f"{cell_count:>10,} | {row_time:>9.3f} | {col_time:>12.3f} | {row_time / col_time:>6.1f}x | {'same' if same_dtypes else 'DIFF'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+clear_and_set_worksheet 인코딩 경로 벤치마크 (기존 원소별 검사 vs dtype 기반 열 단위 변환)
+
+API 호출 없이 DataFrame을 values().update 요청 본문의 2차원 리스트로 변환하는
+두 경로의 실행 시간과 최대 메모리 사용량(tracemalloc)을 비교합니다.
+
+    python benchmarks/sheet_encode_benchmark.py
+"""
+import datetime
+import decimal
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gs_utils.google.sheet_manager import _dataframe_to_values
+
+CELL_COUNTS = [10_000, 100_000, 1_000_000]
+COLUMN_COUNT = 20
+REPEAT = 3
+
+
+def legacy_dataframe_to_values(df):
+    """변경 전 clear_and_set_worksheet의 변환 경로 (열마다 원소별 isinstance 검사 후 df.where)"""
+    df = df.apply(lambda col: col.astype(str) if col.apply(lambda x: isinstance(x, datetime.date)).any() else col)
+    df = df.apply(lambda col: col.astype(float) if col.apply(lambda x: isinstance(x, decimal.Decimal)).any() else col)
+    safe_df = df.where(pd.notnull(df), '')
+    return [safe_df.columns.tolist()] + safe_df.values.tolist()
+
+
+def make_dataframe(cell_count, column_count=COLUMN_COUNT, seed=0):
+    """정수, 결측값이 있는 실수, 문자열, datetime64, Decimal 열이 섞인 데이터프레임 생성"""
+    rng = np.random.default_rng(seed)
+    row_count = cell_count // column_count
+    makers = [
+        lambda: rng.integers(0, 10_000_000, row_count),
+        lambda: np.where(rng.random(row_count) < 0.1, np.nan, rng.random(row_count) * 1000),
+        lambda: rng.choice(['서울', '부산', '대구', '인천'], row_count).astype(object),
+        lambda: pd.Timestamp('2025-01-01') + pd.to_timedelta(rng.integers(0, 365, row_count), unit='D'),
+        lambda: [decimal.Decimal(int(value)) / 100 for value in rng.integers(0, 100_000, row_count)],
+    ]
+    return pd.DataFrame({f"col_{i}": makers[i % len(makers)]() for i in range(column_count)})
+
+
+def measure(convert, df):
+    """REPEAT회 실행 중 가장 짧은 시간(초)과 변환 중 최대 메모리 증가량(MB)을 반환"""
+    best = float('inf')
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        values = convert(df)
+        best = min(best, time.perf_counter() - start)
+        del values
+
+    tracemalloc.start()
+    values = convert(df)
+    peak = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+    tracemalloc.stop()
+    return best, peak, values
+
+
+def main():
+    print(f"{'cells':>10} | {'legacy (s)':>10} | {'dtype (s)':>9} | {'speedup':>7} | {'legacy MB':>9} | {'dtype MB':>8} | values")
+    print('-' * 80)
+    for cell_count in CELL_COUNTS:
+        df = make_dataframe(cell_count)
+        legacy_time, legacy_peak, legacy_values = measure(legacy_dataframe_to_values, df)
+        new_time, new_peak, new_values = measure(_dataframe_to_values, df)
+        same = legacy_values == new_values
+        print(f"{cell_count:>10,} | {legacy_time:>10.3f} | {new_time:>9.3f} | {legacy_time / new_time:>6.1f}x | "
+              f"{legacy_peak:>9.1f} | {new_peak:>8.1f} | {'same' if same else 'DIFF'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,25 +1,55 @@
 from .decorators import time_tracker
+from .profiling import profile, ProfileRegistry, profile_registry
 from .google import (
     GoogleBaseManager, 
     GoogleDriveManager, 
     GoogleSheetManager, 
+    AsyncGoogleSheetManager,
+    AsyncGoogleDriveManager,
+    AsyncSheetWriteBatch,
+    SheetReadCache,
+    SheetWriteBatch,
+    MetricsSink,
+    InMemoryMetricsSink,
+    LoggingMetricsSink,
+    set_verbose,
     retry_on_error,
+    RetryPolicy,
+    RetryError,
+    AmbiguousRequestError,
     extract_spreadsheet_id,
     convert_sheetid_to_url,
     convert_to_number,
+    convert_column_to_number,
     extract_googledrive_id,
     convert_googledrive_id_to_url
 )
 
 __all__ = [
     'time_tracker',
+    'profile',
+    'ProfileRegistry',
+    'profile_registry',
     'GoogleBaseManager',
     'GoogleDriveManager',
     'GoogleSheetManager',
+    'AsyncGoogleSheetManager',
+    'AsyncGoogleDriveManager',
+    'AsyncSheetWriteBatch',
+    'SheetReadCache',
+    'SheetWriteBatch',
+    'MetricsSink',
+    'InMemoryMetricsSink',
+    'LoggingMetricsSink',
+    'set_verbose',
     'retry_on_error',
+    'RetryPolicy',
+    'RetryError',
+    'AmbiguousRequestError',
     'extract_spreadsheet_id',
     'convert_sheetid_to_url',
     'convert_to_number',
+    'convert_column_to_number',
     'extract_googledrive_id',
     'convert_googledrive_id_to_url'
 ]
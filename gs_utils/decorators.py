@@ -1,16 +1,39 @@
+import functools
+import inspect
 import time
+from .profiling import profile_registry
 
 def time_tracker(func):
+    """
+    함수의 시작/종료 시각과 실행 시간을 콘솔에 출력하는 데코레이터 (코루틴 함수도 지원)
+    실행 시간은 profile_registry에도 집계됩니다. 출력 없이 측정만 하려면 profile을 사용하세요.
+    """
+    name = f"{func.__module__}.{func.__qualname__}"
+
+    def started():
+        print(f"⏳ Function '{func.__name__}' started at: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime())}")
+        return time.perf_counter_ns()
+
+    def finished(start_ns):
+        duration_ns = time.perf_counter_ns() - start_ns
+        profile_registry.record(name, duration_ns)
+        print(f"✅ Function '{func.__name__}' finished at: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime())}")
+        print(f"🕒 Total execution time: {duration_ns / 1e9:.4f} seconds\n{'-'*50}")
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            start_ns = started()
+            result = await func(*args, **kwargs)
+            finished(start_ns)
+            return result
+        return async_wrapper
+
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        """
-        이 데코레이터는 함수의 실행 시간을 추적하고 콘솔에 출력합니다.
-        """
-        start_time = time.time()
-        print(f"⏳ Function '{func.__name__}' started at: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(start_time))}")
+        start_ns = started()
         result = func(*args, **kwargs)
-        end_time = time.time()
-        print(f"✅ Function '{func.__name__}' finished at: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(end_time))}")
-        print(f"🕒 Total execution time: {end_time - start_time:.4f} seconds\n{'-'*50}")
+        finished(start_ns)
         return result
     return wrapper
 
@@ -31,4 +54,4 @@ def error_logger(raise_error=True):
                 if raise_error:
                     raise  # 에러를 다시 발생시켜 호출자에게 전달합니다.
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
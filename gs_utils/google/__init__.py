@@ -4,20 +4,38 @@ from .base_manager import (
     extract_spreadsheet_id,
     convert_sheetid_to_url,
     convert_to_number,
+    convert_column_to_number,
     extract_googledrive_id,
     convert_googledrive_id_to_url
 )
+from .retry_policy import RetryPolicy, RetryError, AmbiguousRequestError
 from .drive_manager import GoogleDriveManager
-from .sheet_manager import GoogleSheetManager
+from .sheet_manager import GoogleSheetManager, SheetWriteBatch
+from .read_cache import SheetReadCache
+from .metrics import MetricsSink, InMemoryMetricsSink, LoggingMetricsSink, set_verbose
+from .async_manager import AsyncGoogleSheetManager, AsyncGoogleDriveManager, AsyncSheetWriteBatch
 
 __all__ = [
     'GoogleBaseManager',
     'GoogleDriveManager', 
     'GoogleSheetManager',
+    'AsyncGoogleSheetManager',
+    'AsyncGoogleDriveManager',
+    'AsyncSheetWriteBatch',
+    'SheetReadCache',
+    'SheetWriteBatch',
+    'MetricsSink',
+    'InMemoryMetricsSink',
+    'LoggingMetricsSink',
+    'set_verbose',
     'retry_on_error',
+    'RetryPolicy',
+    'RetryError',
+    'AmbiguousRequestError',
     'extract_spreadsheet_id',
     'convert_sheetid_to_url',
     'extract_googledrive_id',
     'convert_googledrive_id_to_url',
-    'convert_to_number'
+    'convert_to_number',
+    'convert_column_to_number'
 ] 
\ No newline at end of file
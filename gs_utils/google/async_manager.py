@@ -0,0 +1,238 @@
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from .retry_policy import RetryPolicy, RetryError
+from .base_manager import _callable_name
+from .drive_manager import GoogleDriveManager
+from .sheet_manager import GoogleSheetManager
+
+
+# 제너레이터가 끝났음을 나타내는 값 (스레드 풀에서 next() 호출 시 StopIteration 대신 반환)
+_EXHAUSTED = object()
+
+
+class AsyncGoogleBaseManager:
+    """
+    동기 매니저의 메서드를 코루틴으로 제공하는 기본 클래스
+    API 요청은 스레드 풀에서 실행되어 이벤트 루프를 막지 않고, 동시에 실행되는 요청은 max_concurrency개의 슬롯으로 제한됩니다.
+    재시도 대기는 asyncio.sleep으로 수행하며, 동기 메서드 안에서 일어나는 재시도 대기(request_with_retry, batch_requests,
+    드라이브 메서드 등) 중에는 슬롯을 반환하므로 허용량 초과 오류가 몰려도 다른 요청이 계속 실행됩니다.
+    수천 개의 요청을 asyncio.gather로 한 번에 기다려도 동시에 실행되는 요청은 max_concurrency개로 제한됩니다.
+    제너레이터 메서드(iter_files, iter_sheet_chunks 등)는 다음 항목을 스레드 풀에서 가져오는 비동기 제너레이터로 제공합니다.
+    """
+
+    MANAGER_CLASS = None
+
+    def __init__(self, *args, max_concurrency=8, **kwargs):
+        """
+        비동기 매니저 초기화
+
+        Args:
+            *args, **kwargs: MANAGER_CLASS 생성자에 그대로 전달할 인자
+            max_concurrency (int, optional): 동시에 실행할 최대 요청 수. 기본값은 8
+        """
+        self.manager = self.MANAGER_CLASS(*args, **kwargs)
+        self.max_concurrency = max_concurrency
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        # 재시도 대기 중인 스레드는 슬롯을 반환하므로, 대기 중인 스레드가 있어도 max_concurrency개가 실행될 수 있도록 여유 스레드를 둠
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency * 4, thread_name_prefix=type(self).__name__)
+
+    def __getattr__(self, name):
+        """동기 매니저의 공개 메서드를 같은 이름의 코루틴 함수로 제공합니다."""
+        if name == 'manager':
+            raise AttributeError(name)
+        attribute = getattr(self.manager, name)
+        if name.startswith('_') or not callable(attribute):
+            return attribute
+
+        function = getattr(type(self.manager), name)
+
+        if inspect.isgeneratorfunction(inspect.unwrap(function)):
+            @functools.wraps(function)
+            async def generator_method(*args, **kwargs):
+                # 페이지 조회가 일어나는 next()를 스레드 풀에서 실행하여 이벤트 루프를 막지 않음
+                iterator = attribute(*args, **kwargs)
+                try:
+                    while True:
+                        item = await self._run_in_executor(functools.partial(next, iterator, _EXHAUSTED))
+                        if item is _EXHAUSTED:
+                            return
+                        yield item
+                finally:
+                    await self._run_in_executor(iterator.close)
+            return generator_method
+
+        @functools.wraps(function)
+        async def method(*args, **kwargs):
+            if getattr(function, 'retry_on_error', False):
+                # 재시도 데코레이터가 붙은 메서드는 원본 함수를 실행하고 재시도 루프는 비동기로 수행
+                return await self._run_with_retry(functools.partial(function.__wrapped__, self.manager, *args, **kwargs), name)
+            return await self._run_in_executor(functools.partial(attribute, *args, **kwargs))
+        return method
+
+    async def _run_in_executor(self, call):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(self._run_in_slot, call))
+
+    def _run_in_slot(self, call):
+        """작업 스레드에서 동시 실행 슬롯을 얻어 call()을 실행합니다. (call 안의 재시도 대기는 _sleep_without_slot으로 수행)"""
+        local = self.manager._local
+        self._slots.acquire()
+        local.sleep = self._sleep_without_slot
+        try:
+            return call()
+        finally:
+            local.sleep = None
+            self._slots.release()
+
+    def _sleep_without_slot(self, delay):
+        """재시도 대기 중에는 슬롯을 반환하여 다른 요청이 실행되게 합니다."""
+        self._slots.release()
+        try:
+            time.sleep(delay)
+        finally:
+            self._slots.acquire()
+
+    def _call_on_account(self, call, account_index, used):
+        """
+        작업 스레드에서 지정한 계정으로 전환한 뒤 call()을 실행합니다.
+        (사용한 계정 인덱스는 used['index']에 기록)
+        """
+        if account_index is not None and self.manager.account_index != account_index:
+            self.manager._build_service(account_index)
+        used['index'] = self.manager.account_index
+        return call()
+
+    async def _run_with_retry(self, call, name):
+        """
+        GoogleBaseManager._run_with_retry의 비동기 버전
+        같은 retry_policy로 오류를 분류하고, 대기는 asyncio.sleep으로 수행합니다.
+        """
+        manager = self.manager
+        max_attempts, deadline = manager._retry_limits()
+        account_index = None
+        start = time.perf_counter()
+        outcome = 'error'
+        try:
+            for attempt in range(max_attempts):
+                used = {}
+                try:
+                    result = await self._run_in_executor(functools.partial(self._call_on_account, call, account_index, used))
+                    outcome = 'ok'
+                    return result
+                except Exception as e:
+                    action, delay = manager._retry_decision(e, attempt, max_attempts, deadline, name)
+                    if action == RetryPolicy.RAISE:
+                        raise
+                    if action == RetryPolicy.ROTATE:
+                        manager._drain_account_on_quota_error(e, used.get('index'))
+                        account_index = (used.get('index', -1) + 1) % len(manager.json_files)
+                    await asyncio.sleep(delay)
+            raise RetryError(f"🔥 Request failed - exceeded maximum attempts. - {name}")
+        finally:
+            manager._observe('google_api_call_duration_seconds', time.perf_counter() - start, name=name, outcome=outcome)
+
+    async def request_with_retry(self, func_callable):
+        """
+        GoogleBaseManager.request_with_retry의 비동기 버전
+
+        Args:
+            func_callable (callable): 서비스 객체를 인자로 받아 API 요청을 수행하는 함수
+
+        Returns:
+            dict: API 요청의 결과로 반환된 데이터
+        """
+        return await self._run_with_retry(
+            lambda: func_callable(self.manager.service),
+            _callable_name(func_callable)
+        )
+
+    async def map_requests(self, callables, return_exceptions=True):
+        """
+        여러 API 요청을 동시에 실행합니다. (동시 실행 수는 max_concurrency로 제한)
+
+        Args:
+            callables (iterable): 서비스 객체를 인자로 받아 API 요청을 수행하는 함수 목록
+            return_exceptions (bool, optional): True이면 실패한 요청의 예외를 결과 자리에 담아 반환. 기본값은 True
+
+        Returns:
+            list: 입력 순서와 같은 순서의 결과 리스트
+        """
+        return await asyncio.gather(
+            *(self.request_with_retry(func_callable) for func_callable in callables),
+            return_exceptions=return_exceptions
+        )
+
+    def close(self):
+        """스레드 풀을 종료합니다."""
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class AsyncGoogleSheetManager(AsyncGoogleBaseManager):
+    """GoogleSheetManager의 비동기 버전 (같은 메서드를 코루틴으로 제공)"""
+
+    MANAGER_CLASS = GoogleSheetManager
+
+    def batch(self, *args, **kwargs):
+        """
+        GoogleSheetManager.batch의 비동기 버전 (async with로 사용)
+
+        Returns:
+            AsyncSheetWriteBatch: 쓰기 버퍼
+
+        * example:\n
+            async with sheet_manager.batch(spreadsheet_url) as batch:
+                await batch.update_values('요약', 'A1', [['항목', '값']])
+        """
+        return AsyncSheetWriteBatch(self, self.manager.batch(*args, **kwargs))
+
+
+class AsyncSheetWriteBatch:
+    """
+    SheetWriteBatch의 비동기 버전
+    요청 추가(시트 ID 조회, 자동 전송 포함)와 전송을 매니저의 스레드 풀에서 실행하여 이벤트 루프를 막지 않습니다.
+    async with 블록이 정상 종료되면 모아 둔 요청을 전송하고, 예외가 발생하면 버립니다.
+    """
+
+    def __init__(self, owner, batch):
+        """
+        Args:
+            owner (AsyncGoogleSheetManager): 스레드 풀을 제공하는 비동기 매니저
+            batch (SheetWriteBatch): 감쌀 동기 쓰기 버퍼
+        """
+        self.owner = owner
+        self.batch = batch
+
+    def __getattr__(self, name):
+        """SheetWriteBatch의 공개 메서드를 같은 이름의 코루틴 함수로 제공합니다."""
+        if name == 'batch':
+            raise AttributeError(name)
+        attribute = getattr(self.batch, name)
+        if name.startswith('_') or not callable(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        async def method(*args, **kwargs):
+            return await self.owner._run_in_executor(functools.partial(attribute, *args, **kwargs))
+        return method
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return await self.owner._run_in_executor(functools.partial(self.batch.__exit__, exc_type, exc, tb))
+
+
+class AsyncGoogleDriveManager(AsyncGoogleBaseManager):
+    """GoogleDriveManager의 비동기 버전 (같은 메서드를 코루틴으로 제공)"""
+
+    MANAGER_CLASS = GoogleDriveManager
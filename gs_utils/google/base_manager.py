@@ -1,31 +1,53 @@
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest, build_http
 from google.oauth2.service_account import Credentials
+import google_auth_httplib2
 import os
+import functools
+import json
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor
 import time
 import glob
 import inspect
-import socket
+import re
+import pandas as pd
+from .rate_limiter import AccountRateLimiter
+from .retry_policy import RetryPolicy, RetryError, AmbiguousRequestError
+from .metrics import console_print
+
+_INT_LITERAL = re.compile(r'\s*[+-]?[0-9]{1,18}\s*')
+
+# (service_name, version)별로 한 번만 파싱한 정적 discovery 문서
+_DISCOVERY_DOCUMENTS = {}
+
+def _get_discovery_document(service_name, version):
+    """
+    googleapiclient에 포함된 정적 discovery 문서를 파싱하여 캐시합니다. (네트워크 요청 없음)
+    
+    Returns:
+        dict: discovery 문서 (정적 문서가 없는 API는 None)
+    """
+    key = (service_name, version)
+    if key not in _DISCOVERY_DOCUMENTS:
+        document = get_static_doc(service_name, version)
+        _DISCOVERY_DOCUMENTS[key] = json.loads(document) if document else None
+    return _DISCOVERY_DOCUMENTS[key]
+
+def _callable_name(func_callable):
+    """오류 메시지와 지표 레이블에 사용할 요청 함수 이름 (람다는 'request_with_retry')"""
+    name = getattr(func_callable, '__name__', 'request_with_retry')
+    return 'request_with_retry' if name == '<lambda>' else name
 
 def retry_on_error(func):
-    """API 요청 실패 시 .json 파일을 바꿔서 재시도하는 데코레이터"""
+    """API 요청 실패 시 매니저의 retry_policy에 따라 재시도하는 데코레이터 (허용량 초과, 인증 오류는 .json 파일을 바꿔서 재시도)"""
+    @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
-        for attempt in range(self.max_attempts):
-            try:
-                return func(self, *args, **kwargs)
-            except HttpError as e:
-                print(f"⚠️ API quota error ({e.resp.status}) - retrying with next account... (attempt {attempt+1}/{self.max_attempts})")
-                self._build_next_service()
-                time.sleep(2)
-            except (TimeoutError, socket.timeout) as e:
-                print(f"⚠️ Timeout error - retrying with next account... (attempt {attempt+1}/{self.max_attempts})")
-                self._build_next_service()
-                time.sleep(2)
-            except Exception as e:
-                print(f"⚠️ Unexpected error - retrying with next account...  (attempt {attempt+1}/{self.max_attempts})\n - ℹ️ Error info: {e}")
-                self._build_next_service()
-                time.sleep(2)
-        raise RuntimeError(f"🔥 Request failed - exceeded maximum attempts. - {func.__name__}")
+        return self._run_with_retry(lambda: func(self, *args, **kwargs), func.__name__)
+    wrapper.retry_on_error = True  # 비동기 매니저가 재시도 루프를 직접 수행할 수 있도록 표시 (원본 함수는 __wrapped__)
     return wrapper
 
 def extract_spreadsheet_id(spreadsheet_url):
@@ -100,10 +122,113 @@ def convert_to_number(value):
             return value
     return value
 
+def convert_column_to_number(column):
+    """
+    한 열의 값을 열 단위로 한 번에 숫자 변환 (convert_to_number와 동일한 결과)
+    천 단위 구분자(,)를 제거한 뒤 pd.to_numeric으로 열 전체를 변환하고,
+    셀 단위 규칙과 결과가 다를 수 있는 열은 고유값 단위로 convert_to_number를 적용합니다.
+    
+    Args:
+        column (sequence): 변환할 열의 값
+        
+    Returns:
+        pandas.Series: 변환된 열
+    """
+    try:
+        text = [value.replace(',', '') for value in column]
+    except AttributeError:
+        # 문자열이 아닌 값(None 등)이 섞인 열
+        text = None
+
+    if text:
+        try:
+            numeric = pd.to_numeric(pd.Series(text, dtype=object))
+        except (ValueError, TypeError):
+            numeric = None
+
+        if numeric is not None and numeric.dtype == 'int64':
+            return numeric
+        if numeric is not None and numeric.dtype == 'float64' and not numeric.isna().any():
+            # '.'이 없는 셀은 int()로 변환되므로 int64 범위의 정수 표기인 경우에만 허용 (예: '1e5'는 문자열 유지)
+            if all(_INT_LITERAL.fullmatch(value) for value in text if '.' not in value):
+                return numeric
+
+    # 열 단위 변환이 불가능한 경우 고유값만 셀 단위로 변환
+    converted = {value: convert_to_number(value) for value in set(column)}
+    return pd.Series([converted[value] for value in column])
+
+def _body_size(body, headers=None):
+    """요청/응답 본문 크기(바이트) (문자열은 UTF-8 기준, 스트림 본문은 Content-Length 헤더 기준)"""
+    if not body:
+        return 0
+    if isinstance(body, str):
+        return len(body.encode('utf-8'))
+    if isinstance(body, (bytes, bytearray, memoryview)):
+        return len(body)
+    length = {key.lower(): value for key, value in (headers or {}).items()}.get('content-length')
+    return int(length) if length else 0
+
+class _MeasuredHttp:
+    """주고받은 본문 크기와 마지막 응답 상태 코드를 기록하는 http 래퍼 (미디어 청크 요청 계측용)"""
+
+    def __init__(self, http):
+        self.http = http
+        self.status = 'error'
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def request(self, uri, method='GET', body=None, headers=None, **kwargs):
+        response, content = self.http.request(uri, method, body=body, headers=headers, **kwargs)
+        self.status = response.status
+        self.request_bytes += _body_size(body, headers)
+        self.response_bytes += _body_size(content)
+        return response, content
+
+    def __getattr__(self, name):
+        return getattr(self.http, name)
+
+class _ManagedHttpRequest(HttpRequest):
+    """실행 직전에 매니저의 요청 훅(_before_execute)을 거치는 HttpRequest"""
+
+    def __init__(self, manager, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.manager = manager
+
+    def execute(self, http=None, num_retries=0):
+        if http is None:
+            http = self.manager._before_execute(self)
+        if not self.manager.metrics_sinks:
+            return super().execute(http=http, num_retries=num_retries)
+
+        # 응답 상태와 본문 크기는 postproc에서 기록
+        measured = {'status': 'error', 'response_bytes': 0}
+        postproc = self.postproc
+
+        def measure(resp, content):
+            measured['status'] = resp.status
+            measured['response_bytes'] = len(content or b'')
+            return postproc(resp, content)
+
+        self.postproc = measure
+        start = time.perf_counter()
+        try:
+            return super().execute(http=http, num_retries=num_retries)
+        except HttpError as e:
+            measured['status'] = e.resp.status
+            measured['response_bytes'] = len(e.content or b'')
+            raise
+        finally:
+            self.postproc = postproc
+            self.manager._record_request(self, measured['status'], time.perf_counter() - start, measured['response_bytes'])
+
 class GoogleBaseManager:
     """구글 API 서비스의 기본 기능을 제공하는 클래스"""
 
-    def __init__(self, service_name, version, scope, attempt_retry = 3, json_folder = None):
+    # 서비스 계정별 분당 요청 허용량 (None이면 제한 없음, 하위 클래스에서 API 할당량에 맞게 지정)
+    DEFAULT_READ_QUOTA_PER_MINUTE = None
+    DEFAULT_WRITE_QUOTA_PER_MINUTE = None
+
+    def __init__(self, service_name, version, scope, attempt_retry = 3, json_folder = None, read_quota_per_minute = None, write_quota_per_minute = None, retry_policy = None, metrics_sinks = None):
         """
         구글 API 서비스 초기화
         
@@ -113,6 +238,10 @@ class GoogleBaseManager:
             scope (list): API 스코프
             attempt_retry (int, optional): 재시도 횟수. 기본값은 3
             json_folder (str, optional): 서비스 계정 키 파일이 있는 폴더 경로. 기본값은 None
+            read_quota_per_minute (float, optional): 서비스 계정당 분당 읽기(GET) 요청 허용량. 기본값은 None (DEFAULT_READ_QUOTA_PER_MINUTE 사용)
+            write_quota_per_minute (float, optional): 서비스 계정당 분당 쓰기(GET 외) 요청 허용량. 기본값은 None (DEFAULT_WRITE_QUOTA_PER_MINUTE 사용)
+            retry_policy (RetryPolicy, optional): 재시도 정책. 기본값은 None (RetryPolicy() 사용)
+            metrics_sinks (list, optional): 요청 소요 시간, 재시도/계정 전환 횟수, 본문 크기를 기록할 MetricsSink 리스트. 기본값은 None (기록 안 함)
         """
         if json_folder is None:
             current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -124,36 +253,177 @@ class GoogleBaseManager:
         self.version = version
         self.scope = scope
         self.max_attempts = len(self.json_files) * attempt_retry
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.metrics_sinks = list(metrics_sinks) if metrics_sinks else []
 
         if not self.json_files:
             raise FileNotFoundError(f"No .json files found in {json_folder}")
 
-        self.current_index = 0
-        self.cycle_sleep_duration = 30  # Sleep duration in seconds after each full cycle
-        self._build_next_service()
+        # 계정별 토큰 버킷: 허용량이 남은 계정으로 요청을 배정하고, 필요한 만큼만 대기
+        if read_quota_per_minute is None:
+            read_quota_per_minute = self.DEFAULT_READ_QUOTA_PER_MINUTE
+        if write_quota_per_minute is None:
+            write_quota_per_minute = self.DEFAULT_WRITE_QUOTA_PER_MINUTE
+        self.rate_limiter = None
+        if read_quota_per_minute or write_quota_per_minute:
+            self.rate_limiter = AccountRateLimiter(len(self.json_files), read_quota_per_minute, write_quota_per_minute)
+
+        # 스레드별 서비스 상태: httplib2는 스레드 안전하지 않으므로 스레드마다 별도의 HTTP 연결과 서비스 풀을 사용
+        self._local = threading.local()
+        self._state_lock = threading.Lock()
+        self._thread_count = 0
+        self._thread_state()
+
+    def _thread_state(self):
+        """
+        현재 스레드의 서비스 상태를 반환합니다. 처음 접근한 스레드는 계정을 나누어 쓰도록 서로 다른 계정에서 시작합니다.
+        
+        Returns:
+            SimpleNamespace: service_pool(계정별 (credentials, http, service)), transport(공유 HTTP 연결),
+                current_index, account_index, credentials, http, service
+        """
+        state = getattr(self._local, 'state', None)
+        if state is None:
+            with self._state_lock:
+                offset = self._thread_count % len(self.json_files)
+                self._thread_count += 1
+            # 계정별 (credentials, http, service)를 한 번만 생성하여 재사용하고,
+            # 스레드 안의 모든 계정이 하나의 HTTP 연결(keep-alive)을 공유
+            state = self._local.state = types.SimpleNamespace(
+                service_pool={},
+                transport=build_http(),
+                current_index=offset,
+                account_index=None,
+                credentials=None,
+                http=None,
+                service=None,
+            )
+            self._build_next_service()
+        return state
+
+    @property
+    def service(self):
+        """현재 스레드의 API 서비스 객체"""
+        return self._thread_state().service
+
+    @property
+    def http(self):
+        """현재 스레드의 인증된 HTTP 객체"""
+        return self._thread_state().http
+
+    @property
+    def credentials(self):
+        """현재 스레드의 서비스 계정 인증 정보"""
+        return self._thread_state().credentials
+
+    @property
+    def current_index(self):
+        """현재 스레드에서 다음에 사용할 서비스 계정 인덱스"""
+        return self._thread_state().current_index
+
+    @current_index.setter
+    def current_index(self, value):
+        self._thread_state().current_index = value
+
+    @property
+    def account_index(self):
+        """현재 스레드에서 사용 중인 서비스 계정 인덱스"""
+        return self._thread_state().account_index
 
     def _get_next_json(self):
         """
-        다음 JSON 파일을 가져오고, 한 바퀴가 완료되면 대기 시간을 적용
+        다음 JSON 파일을 가져오고, 한 바퀴가 완료되면 처음 파일로 돌아감
+        (한 바퀴마다의 대기는 retry_policy의 백오프가 담당)
         
         Returns:
             str: 다음 JSON 파일 경로
         """
         if self.current_index >= len(self.json_files):
-            print(f"⏳ Cycle completed. Sleeping for {self.cycle_sleep_duration} seconds...")
-            time.sleep(self.cycle_sleep_duration)
             self.current_index = 0
 
         json_file = self.json_files[self.current_index]
         self.current_index += 1
         return json_file
 
+    def _create_service(self, index, transport, service_name=None, version=None):
+        """
+        index번째 서비스 계정의 API 서비스를 생성합니다.
+        정적 discovery 문서로 생성하므로 discovery 문서를 다시 받거나 파싱하지 않습니다.
+        
+        Args:
+            index (int): json_files 내 서비스 계정 인덱스
+            transport (httplib2.Http): 공유할 HTTP 연결
+            service_name (str, optional): 구글 API 서비스 이름. 기본값은 None (매니저의 service_name)
+            version (str, optional): API 버전. 기본값은 None (매니저의 version)
+        
+        Returns:
+            tuple: (credentials, http, service)
+        """
+        service_name = service_name or self.service_name
+        version = version or self.version
+        credentials = Credentials.from_service_account_file(self.json_files[index], scopes=self.scope)
+        http = google_auth_httplib2.AuthorizedHttp(credentials, http=transport)
+        request_builder = functools.partial(_ManagedHttpRequest, self)
+        document = _get_discovery_document(service_name, version)
+        if document is not None:
+            service = build_from_document(document, http=http, requestBuilder=request_builder)
+        else:
+            service = build(service_name, version, http=http, requestBuilder=request_builder)
+        return credentials, http, service
+
+    def _build_service(self, index):
+        """
+        index번째 서비스 계정으로 API 서비스 전환 (계정별로 처음 한 번만 생성하고 이후에는 재사용)
+        
+        Args:
+            index (int): json_files 내 서비스 계정 인덱스
+        """
+        state = self._thread_state()
+        if index not in state.service_pool:
+            state.service_pool[index] = self._create_service(index, state.transport)
+        state.credentials, state.http, state.service = state.service_pool[index]
+        state.account_index = index
+        console_print(f"🔁 Switched to service account: {os.path.basename(self.json_files[index])}")
+
     def _build_next_service(self):
         """다음 서비스 계정으로 API 서비스 재구성"""
-        current_json = self._get_next_json()
-        self.credentials = Credentials.from_service_account_file(current_json, scopes=self.scope)
-        self.service = build(self.service_name, self.version, credentials=self.credentials)
-        print(f"🔁 Switched to service account: {os.path.basename(current_json)}")
+        self._get_next_json()
+        self._build_service(self.current_index - 1)
+
+    def _before_execute(self, request):
+        """
+        API 요청 실행 직전에 호출됩니다.
+        요청 종류(GET은 읽기, 그 외는 쓰기)의 토큰을 가져오고, 현재 계정에 토큰이 없어 다른 계정에서 가져온 경우 그 계정으로 전환합니다.
+        
+        Args:
+            request (HttpRequest): 실행할 요청
+            
+        Returns:
+            httplib2.Http: 요청에 사용할 http 객체 (None이면 요청 생성 시의 http 사용)
+        """
+        if self.rate_limiter is None:
+            return None
+        kind = 'read' if request.method == 'GET' else 'write'
+        start = time.perf_counter()
+        index = self.rate_limiter.acquire(kind, self.account_index)
+        self._observe('google_api_quota_wait_seconds', time.perf_counter() - start, kind=kind)
+        if index == self.account_index:
+            return None
+        self._increment('google_api_account_rotations_total', reason='rate_limiter')
+        self._build_service(index)
+        self.current_index = index + 1
+        return self.http
+
+    def _drain_account_on_quota_error(self, error, index=None):
+        """
+        허용량 초과 응답(403, 429)을 받은 계정의 토큰을 비워 토큰이 다시 채워질 때까지 배정되지 않게 합니다.
+        
+        Args:
+            error (Exception): 발생한 예외
+            index (int, optional): 오류가 발생한 계정 인덱스. 기본값은 None (현재 스레드의 계정)
+        """
+        if self.rate_limiter is not None and isinstance(error, HttpError) and error.resp.status in (403, 429):
+            self.rate_limiter.drain(self.account_index if index is None else index)
 
     def request_with_retry(self, func_callable):
         """
@@ -168,7 +438,8 @@ class GoogleBaseManager:
             dict: API 요청의 결과로 반환된 데이터.
 
         Raises:
-            RuntimeError: 모든 계정에서 오류가 발생한 경우.
+            RetryError: 재시도 횟수 또는 제한 시간을 초과한 경우 (RuntimeError 하위 클래스).
+            Exception: 재시도 대상이 아닌 오류(잘못된 요청, 코드 오류 등)는 그대로 발생.
             
         * example 1: Google 스프레드시트에서 값 가져오기\n
             result = google_client_manager.request_with_retry(
@@ -187,22 +458,326 @@ class GoogleBaseManager:
                     body={'values': [['입력할 값']]}
                 ).execute()
             )
-            print(f"업데이트된 셀 수: {result['updatedCells']}")
+            console_print(f"업데이트된 셀 수: {result['updatedCells']}")
+
+        """
+        return self._run_with_retry(lambda: func_callable(self.service), _callable_name(func_callable))
+
+    def _run_with_retry(self, call, name):
+        """
+        retry_on_error와 request_with_retry가 공유하는 재시도 루프
+        retry_policy로 오류를 분류하여 허용량 초과/인증 오류는 계정을 바꿔서, 서버/네트워크 오류는 같은 계정으로
+        지수 백오프(full jitter, Retry-After 우선) 후 재시도하고, 그 외 오류는 바로 발생시킵니다.
+
+        Args:
+            call (callable): 인자 없이 호출할 요청 함수
+            name (str): 오류 메시지에 표시할 함수 이름
+
+        Returns:
+            call()의 반환값
+        """
+        max_attempts, deadline = self._retry_limits()
+        start = time.perf_counter()
+        outcome = 'error'
+        try:
+            for attempt in range(max_attempts):
+                try:
+                    result = call()
+                    outcome = 'ok'
+                    return result
+                except Exception as e:
+                    action, delay = self._retry_decision(e, attempt, max_attempts, deadline, name)
+                    if action == RetryPolicy.RAISE:
+                        raise
+                    if action == RetryPolicy.ROTATE:
+                        self._drain_account_on_quota_error(e)
+                        self._build_next_service()
+                    self._sleep(delay)
+            raise RetryError(f"🔥 Request failed - exceeded maximum attempts. - {name}")
+        finally:
+            self._observe('google_api_call_duration_seconds', time.perf_counter() - start, name=name, outcome=outcome)
+
+    def _sleep(self, delay):
+        """
+        재시도 전 대기
+        비동기 매니저가 작업 스레드에 대기 함수(_local.sleep)를 지정했으면 그 함수로 대기하여, 대기 중에는 동시 실행 슬롯을 반환합니다.
+        """
+        sleep = getattr(self._local, 'sleep', None)
+        (sleep or time.sleep)(delay)
+
+    def _retry_limits(self):
+        """
+        한 번의 호출에 적용할 재시도 한도를 반환합니다.
+        
+        Returns:
+            tuple: (최대 시도 횟수, 마감 시각(time.monotonic 기준, 없으면 None))
+        """
+        policy = self.retry_policy
+        max_attempts = policy.max_attempts or self.max_attempts
+        deadline = time.monotonic() + policy.deadline if policy.deadline else None
+        return max_attempts, deadline
+
+    def _retry_decision(self, error, attempt, max_attempts, deadline, name):
+        """
+        발생한 오류를 retry_policy로 분류하고 다음 시도 전 대기 시간을 계산합니다. (동기/비동기 재시도 루프 공용)
+        
+        Args:
+            error (Exception): 발생한 예외
+            attempt (int): 0부터 시작하는 시도 순번
+            max_attempts (int): 최대 시도 횟수
+            deadline (float): 마감 시각 (time.monotonic 기준, 없으면 None)
+            name (str): 오류 메시지에 표시할 함수 이름
+        
+        Returns:
+            tuple: (RetryPolicy.ROTATE / RETRY / RAISE, 대기 시간(초))
+        
+        Raises:
+            RetryError: 최대 시도 횟수 또는 마감 시각을 넘기는 경우
+        """
+        policy = self.retry_policy
+        action = policy.classify(error)
+        if action == RetryPolicy.RAISE:
+            return action, None
+        if attempt + 1 >= max_attempts:
+            raise RetryError(f"🔥 Request failed - exceeded maximum attempts. - {name}") from error
+
+        if action == RetryPolicy.ROTATE:
+            # 한 바퀴를 돌 때마다 대기 시간이 늘어나도록 계정 수 단위로 백오프
+            delay = policy.get_delay(attempt // len(self.json_files), error)
+        else:
+            delay = policy.get_delay(attempt, error)
+        if deadline is not None and time.monotonic() + delay > deadline:
+            raise RetryError(f"🔥 Request failed - exceeded deadline ({policy.deadline}s). - {name}") from error
 
+        status = error.resp.status if isinstance(error, HttpError) else type(error).__name__
+        self._increment('google_api_retries_total', name=name, action=action, status=status)
+        if action == RetryPolicy.ROTATE:
+            self._increment('google_api_account_rotations_total', reason='quota_error')
+            status = error.resp.status if isinstance(error, HttpError) else 'auth'
+            console_print(f"⚠️ API quota/auth error ({status}) - retrying with next account in {delay:.1f}s... (attempt {attempt+1}/{max_attempts})")
+        else:
+            console_print(f"⚠️ Retryable error - retrying in {delay:.1f}s... (attempt {attempt+1}/{max_attempts})\n - ℹ️ Error info: {error}")
+        return action, delay
+
+    def map_requests(self, callables, max_workers=4, return_exceptions=True):
         """
-        for attempt in range(self.max_attempts):
+        여러 API 요청을 스레드 풀에서 병렬로 실행합니다.
+        각 요청은 request_with_retry와 같은 방식으로 재시도되며, 작업 스레드마다 별도의 서비스 객체와 HTTP 연결을 사용합니다.
+
+        Args:
+            callables (iterable): 서비스 객체를 인자로 받아 API 요청을 수행하는 함수 목록
+            max_workers (int, optional): 동시에 실행할 스레드 수. 기본값은 4
+            return_exceptions (bool, optional): True이면 실패한 요청의 예외를 결과 자리에 담아 반환하고,
+                False이면 입력 순서상 첫 번째 실패 예외를 발생시킴. 기본값은 True
+
+        Returns:
+            list: 입력 순서와 같은 순서의 결과 리스트 (실패한 항목은 예외 객체)
+
+        * example: 여러 시트 값을 병렬로 가져오기\n
+            results = google_client_manager.map_requests(
+                [
+                    lambda service, name=name: service.spreadsheets().values().get(
+                        spreadsheetId="your_spreadsheet_id",
+                        range=f"{name}!A1:Z",
+                    ).execute()
+                    for name in ["Sheet1", "Sheet2", "Sheet3"]
+                ],
+                max_workers=3
+            )
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.request_with_retry, func_callable) for func_callable in callables]
+
+        results = []
+        failed = 0
+        for index, future in enumerate(futures):
             try:
-                return func_callable(self.service)
-            except HttpError as e:
-                print(f"⚠️ API quota error ({e.resp.status}) - retrying with next account... (attempt {attempt+1}/{self.max_attempts})")
-                self._build_next_service()
-                time.sleep(2)
-            except (TimeoutError, socket.timeout) as e:
-                print(f"⚠️ Timeout error - retrying with next account... (attempt {attempt+1}/{self.max_attempts})")
-                self._build_next_service()
-                time.sleep(2)
+                results.append(future.result())
             except Exception as e:
-                print(f"⚠️ Unexpected error - retrying with next account...  (attempt {attempt+1}/{self.max_attempts})\n - ℹ️ Error info: {e}")
+                if not return_exceptions:
+                    raise
+                failed += 1
+                console_print(f"⚠️ {inspect.currentframe().f_code.co_name} | #{index} 요청 실패: {e}")
+                results.append(e)
+        console_print(f"✅ 병렬 요청 완료 (성공: {len(results) - failed}, 실패: {failed})")
+        return results
+
+    def batch_requests(self, callables, batch_size=100, return_exceptions=True, idempotent=True):
+        """
+        여러 API 요청을 배치 엔드포인트로 묶어 batch_size개씩 한 번의 HTTP 요청으로 실행합니다.
+        항목별로 retry_policy를 적용하여 재시도 대상 오류가 난 항목만 모아 다음 배치에서 다시 요청합니다.
+        (허용량 초과/인증 오류가 있으면 다음 계정으로 전환한 뒤 재시도)
+        idempotent=False이면 서버/네트워크 오류(항목별 5xx, 시간 초과, 배치 요청 자체의 실패)처럼 요청이 이미 적용되었을 수 있는
+        항목은 다시 보내지 않고 AmbiguousRequestError로 실패 처리합니다. (허용량 초과/인증 오류처럼 적용되지 않은 것이 확실한 항목만 재시도)
+
+        Args:
+            callables (iterable): 서비스 객체를 인자로 받아 실행하지 않은 요청(HttpRequest)을 반환하는 함수 목록
+            batch_size (int, optional): 배치 하나에 담을 최대 요청 수 (Google API 최대 100). 기본값은 100
+            return_exceptions (bool, optional): True이면 실패한 요청의 예외를 결과 자리에 담아 반환하고,
+                False이면 입력 순서상 첫 번째 실패 예외를 발생시킴. 기본값은 True
+            idempotent (bool, optional): 같은 요청을 다시 보내도 결과가 같은지 여부. 생성/복사처럼 다시 보내면 중복이 생기는 요청은 False. 기본값은 True
+
+        Returns:
+            list: 입력 순서와 같은 순서의 결과 리스트 (실패한 항목은 예외 객체)
+
+        * example: 여러 파일 이름을 한 번에 변경\n
+            results = google_client_manager.batch_requests(
+                [
+                    lambda service, file_id=file_id: service.files().update(
+                        fileId=file_id,
+                        body={'name': f'{file_id}_backup'}
+                    )
+                    for file_id in file_ids
+                ]
+            )
+        """
+        callables = list(callables)
+        results = [None] * len(callables)
+        errors = {}
+        pending = list(range(len(callables)))
+        max_attempts, deadline = self._retry_limits()
+        policy = self.retry_policy
+
+        for attempt in range(max_attempts):
+            failures = {}
+            for start in range(0, len(pending), batch_size):
+                self._execute_batch(callables, pending[start:start + batch_size], results, failures)
+
+            pending = []
+            rotate = False
+            delay = 0.0
+            for index, error in sorted(failures.items()):
+                action = policy.classify(error)
+                if action == RetryPolicy.RAISE:
+                    errors[index] = error
+                    continue
+                if action == RetryPolicy.RETRY and not idempotent:
+                    # 서버가 요청을 이미 적용했을 수 있으므로 다시 보내면 중복 생성/복사가 생길 수 있음
+                    errors[index] = AmbiguousRequestError(f"⚠️ Batch: 요청 결과를 알 수 없어 재시도하지 않습니다. - batch #{index}")
+                    errors[index].__cause__ = error
+                    continue
+                if attempt + 1 >= max_attempts:
+                    errors[index] = RetryError(f"🔥 Request failed - exceeded maximum attempts. - batch #{index}")
+                    errors[index].__cause__ = error
+                    continue
+                if action == RetryPolicy.ROTATE:
+                    rotate = True
+                    self._drain_account_on_quota_error(error)
+                pending.append(index)
+                delay = max(delay, policy.get_delay(attempt, error))
+            if not pending:
+                break
+
+            if deadline is not None and time.monotonic() + delay > deadline:
+                for index in pending:
+                    errors[index] = RetryError(f"🔥 Request failed - exceeded deadline ({policy.deadline}s). - batch #{index}")
+                    errors[index].__cause__ = failures[index]
+                break
+            console_print(f"⚠️ Batch: {len(pending)}개 요청 재시도{' (next account)' if rotate else ''} in {delay:.1f}s... (attempt {attempt+1}/{max_attempts})\n - ℹ️ Error info: {failures[pending[0]]}")
+            if rotate:
                 self._build_next_service()
-                time.sleep(2)
-        raise RuntimeError(f"🔥 Request failed - exceeded maximum attempts. - {func_callable.__name__}")
\ No newline at end of file
+            self._sleep(delay)
+
+        for index, error in sorted(errors.items()):
+            if not return_exceptions:
+                raise error
+            console_print(f"⚠️ {inspect.currentframe().f_code.co_name} | #{index} 요청 실패: {error}")
+            results[index] = error
+        console_print(f"✅ 배치 요청 완료 (성공: {len(results) - len(errors)}, 실패: {len(errors)})")
+        return results
+
+    def _execute_batch(self, callables, indices, results, failures):
+        """
+        indices에 해당하는 요청을 하나의 배치로 실행하여 성공한 응답은 results에, 예외는 failures에 기록합니다.
+        배치 요청 자체가 실패하면 응답을 받지 못한 모든 항목을 그 예외로 기록합니다.
+        """
+        received = set()
+
+        def callback(request_id, response, exception):
+            index = int(request_id)
+            received.add(index)
+            if exception is None:
+                results[index] = response
+            else:
+                failures[index] = exception
+
+        batch = self.service.new_batch_http_request(callback=callback)
+        for index in indices:
+            request = callables[index](self.service)
+            # 배치 안의 요청도 각각 허용량 토큰을 사용
+            self._before_execute(request)
+            batch.add(request, request_id=str(index))
+        start = time.perf_counter()
+        status = 'ok'
+        try:
+            batch.execute(http=self.http)
+        except Exception as e:
+            status = e.resp.status if isinstance(e, HttpError) else 'error'
+            for index in indices:
+                if index not in received:
+                    failures[index] = e
+        finally:
+            self._observe(
+                'google_api_request_duration_seconds', time.perf_counter() - start,
+                endpoint='batch', method='POST', status=status, account=self._account_label()
+            )
+
+    def _account_label(self):
+        """지표 레이블에 사용할 현재 스레드의 서비스 계정 파일 이름"""
+        index = self.account_index
+        return os.path.basename(self.json_files[index]) if index is not None else ''
+
+    def _observe(self, metric, value, **labels):
+        """metrics_sinks에 히스토그램 값을 기록합니다."""
+        for sink in self.metrics_sinks:
+            sink.observe(metric, value, labels)
+
+    def _increment(self, metric, value=1, **labels):
+        """metrics_sinks의 카운터를 증가시킵니다."""
+        for sink in self.metrics_sinks:
+            sink.increment(metric, value, labels)
+
+    def _execute_media_chunk(self, request, send):
+        """
+        미디어 업로드/다운로드 청크 요청을 한 번 실행하며 소요 시간, 응답 상태, 주고받은 바이트 수를 기록합니다.
+        청크 요청(next_chunk, Range 요청)은 execute를 거치지 않으므로 _ManagedHttpRequest에서 기록되지 않습니다.
+
+        Args:
+            request (HttpRequest): 미디어 요청 (request.http로 전송, 지표의 endpoint/method 레이블에 사용)
+            send (callable): http 객체를 인자로 받아 청크를 주고받는 함수
+
+        Returns:
+            send()의 반환값
+        """
+        if not self.metrics_sinks:
+            return send(request.http)
+        measured = _MeasuredHttp(request.http)
+        start = time.perf_counter()
+        try:
+            return send(measured)
+        except HttpError as e:
+            measured.status = e.resp.status
+            raise
+        finally:
+            self._record_request(request, measured.status, time.perf_counter() - start, measured.response_bytes, measured.request_bytes)
+
+    def _record_request(self, request, status, elapsed, response_bytes, request_bytes=None):
+        """
+        HTTP 요청 1회의 소요 시간과 요청/응답 본문 크기를 기록합니다.
+
+        Args:
+            request (HttpRequest): 실행한 요청
+            status (int | str): 응답 상태 코드 (응답을 받지 못한 경우 'error')
+            elapsed (float): 소요 시간(초)
+            response_bytes (int): 응답 본문 크기(바이트)
+            request_bytes (int, optional): 요청 본문 크기(바이트). 기본값은 None (request.body 크기)
+        """
+        endpoint = request.methodId or request.method
+        if request_bytes is None:
+            request_bytes = _body_size(request.body)
+        self._observe(
+            'google_api_request_duration_seconds', elapsed,
+            endpoint=endpoint, method=request.method, status=status, account=self._account_label()
+        )
+        self._increment('google_api_request_bytes_total', request_bytes, endpoint=endpoint)
+        self._increment('google_api_response_bytes_total', response_bytes, endpoint=endpoint)
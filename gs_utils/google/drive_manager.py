@@ -1,11 +1,235 @@
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaFileUpload
-from googleapiclient.http import MediaIoBaseDownload
+from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload, MediaUpload
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
 import os
 import io
+import contextlib
 import time
+import hashlib
 import inspect
+import json
+import tempfile
+import threading
+import pandas as pd
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 from .base_manager import GoogleBaseManager, extract_googledrive_id
+from .retry_policy import AmbiguousRequestError
+from .metrics import console_print
+
+FOLDER_MIME_TYPE = 'application/vnd.google-apps.folder'
+GOOGLE_APPS_MIME_PREFIX = 'application/vnd.google-apps.'
+# download_files_in_folder가 진행 상황을 출력하는 파일 수 간격
+DOWNLOAD_PROGRESS_INTERVAL = 100
+# upload_dataframe 형식별 MIME 타입
+DATAFRAME_MIME_TYPES = {
+    'csv': 'text/csv',
+    'json': 'application/json',
+    'parquet': 'application/vnd.apache.parquet',
+    'excel': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+}
+# sync_folder가 파일별로 조회하는 필드
+SYNC_FILE_FIELDS = 'id, name, mimeType, modifiedTime, md5Checksum, size'
+
+def _escape_query_value(value):
+    """
+    Drive 검색 쿼리의 문자열 값에 들어갈 역슬래시와 작은따옴표를 이스케이프합니다.
+    """
+    return str(value).replace('\\', '\\\\').replace("'", "\\'")
+
+def _file_md5(file_path, block_size=1024 * 1024):
+    """
+    로컬 파일의 md5 체크섬(16진수 문자열)을 계산합니다.
+    """
+    md5 = hashlib.md5()
+    with open(file_path, 'rb') as fh:
+        for block in iter(lambda: fh.read(block_size), b''):
+            md5.update(block)
+    return md5.hexdigest()
+
+def _is_same_file(file_path, file):
+    """
+    로컬 파일이 드라이브 파일 정보(size, md5Checksum)와 같은지 확인합니다.
+    크기를 먼저 비교하고, 크기가 같을 때만 md5를 계산합니다.
+    """
+    if not os.path.isfile(file_path):
+        return False
+    if 'size' in file and os.path.getsize(file_path) != int(file['size']):
+        return False
+    if 'md5Checksum' in file:
+        return _file_md5(file_path) == file['md5Checksum']
+    return 'size' in file
+
+def _join_drive_path(parent_path, name):
+    """
+    매니페스트에 기록할 상대 경로('/' 구분)를 만듭니다. 이름 안의 '/'와 '\\'는 '_'로 바꿉니다.
+    """
+    name = name.replace('/', '_').replace('\\', '_')
+    return f"{parent_path}/{name}" if parent_path else name
+
+def _path_with_id(path, file_id):
+    """
+    같은 이름의 다른 파일과 구분하도록 확장자 앞에 파일 ID를 붙인 경로를 만듭니다. ('보고서.csv' -> '보고서 (<ID>).csv')
+    """
+    root, extension = os.path.splitext(path)
+    return f"{root} ({file_id}){extension}"
+
+def _manifest_entry(file, path, export_formats):
+    """
+    드라이브 파일 정보에서 매니페스트에 기록할 항목을 만듭니다.
+    path는 로컬 상대 경로로, 내보낼 구글 문서 형식 파일에는 내보내기 확장자를 붙입니다.
+    """
+    entry = {key: file[key] for key in ('id', 'name', 'mimeType', 'modifiedTime', 'md5Checksum', 'size') if key in file}
+    entry['path'] = path + export_formats[file['mimeType']][1] if file['mimeType'] in export_formats else path
+    return entry
+
+def _same_revision(old, new):
+    """
+    매니페스트 항목과 현재 파일 정보가 같은 내용인지 확인합니다.
+    (일반 파일은 md5Checksum, 구글 문서 형식은 modifiedTime으로 비교)
+    """
+    if 'md5Checksum' in new:
+        return old.get('md5Checksum') == new['md5Checksum']
+    return old.get('modifiedTime') == new.get('modifiedTime')
+
+def _load_manifest(manifest_path):
+    """
+    sync_folder 매니페스트를 읽습니다. 없거나 읽을 수 없으면 빈 dict를 반환합니다.
+    """
+    try:
+        with open(manifest_path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_manifest(manifest_path, manifest):
+    """
+    sync_folder 매니페스트를 임시 파일에 쓴 뒤 교체하여 중간에 중단되어도 이전 매니페스트가 깨지지 않게 합니다.
+    """
+    # 여러 프로세스가 같은 파일을 저장해도 서로의 임시 파일을 덮어쓰지 않도록 임시 파일 이름을 매번 새로 만듦
+    directory, name = os.path.split(os.path.abspath(manifest_path))
+    fd, temp_path = tempfile.mkstemp(prefix=f"{name}.", suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1)
+        os.replace(temp_path, manifest_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+@contextlib.contextmanager
+def _file_lock(path):
+    """
+    path + '.lock' 파일로 다른 프로세스와 공유하는 배타 잠금을 겁니다. (블록을 벗어나면 해제)
+    """
+    with open(f"{path}.lock", 'a+b') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            # LK_LOCK은 약 10초 동안 잠금을 얻지 못하면 OSError를 발생시키므로 얻을 때까지 반복
+            while True:
+                try:
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+class _UploadSessionStore:
+    """
+    재개 가능 업로드의 세션 URI를 JSON 파일에 저장하는 저장소
+    같은 파일을 쓰는 다른 스레드/프로세스의 기록을 지우지 않도록 파일 잠금을 건 상태에서 파일을 다시 읽어 갱신하고,
+    임시 파일에 쓴 뒤 교체하므로 읽는 쪽은 항상 완전한 파일을 봅니다.
+    """
+
+    _lock = threading.Lock()
+
+    def __init__(self, path):
+        self.path = path
+
+    def get(self, key):
+        return _load_manifest(self.path).get(key)
+
+    @contextlib.contextmanager
+    def _locked(self):
+        with self._lock, _file_lock(self.path):
+            yield
+
+    def set(self, key, session):
+        with self._locked():
+            sessions = _load_manifest(self.path)
+            sessions[key] = session
+            _save_manifest(self.path, sessions)
+
+    def pop(self, key):
+        with self._locked():
+            sessions = _load_manifest(self.path)
+            if sessions.pop(key, None) is not None:
+                _save_manifest(self.path, sessions)
+
+class _IterableMediaUpload(MediaUpload):
+    """
+    bytes/str 조각을 내는 iterable을 재개 가능 업로드의 내용으로 사용하는 MediaUpload
+    현재 청크와 다음 청크 분량만 버퍼에 두며, 조각을 모두 읽으면 전체 크기를 알려 마지막 청크에서 업로드를 끝냅니다.
+    """
+
+    def __init__(self, chunks, mimetype, chunksize):
+        self._chunks = iter(chunks)
+        self._mimetype = mimetype
+        self._chunksize = chunksize
+        self._buffer = bytearray()
+        self._offset = 0   # _buffer[0]의 전체 내용 기준 위치
+        self._next = 0     # 다음 청크 시작 위치
+        self._size = None  # 조각을 모두 읽은 뒤에 정해지는 전체 크기
+
+    def chunksize(self):
+        return self._chunksize
+
+    def mimetype(self):
+        return self._mimetype
+
+    def resumable(self):
+        return True
+
+    def has_stream(self):
+        return False
+
+    def size(self):
+        # 다음 청크보다 1바이트 더 읽어 두어, 내용이 청크 크기의 배수로 끝나도 마지막 청크를 보낼 때 전체 크기를 알 수 있게 함
+        self._fill(self._next + self._chunksize + 1)
+        return self._size
+
+    def _fill(self, end):
+        while self._size is None and self._offset + len(self._buffer) < end:
+            try:
+                chunk = next(self._chunks)
+            except StopIteration:
+                self._size = self._offset + len(self._buffer)
+                break
+            self._buffer += chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+
+    def getbytes(self, begin, length):
+        if begin < self._offset:
+            raise ValueError(f"이미 보낸 위치({begin})로 되돌아갈 수 없습니다. (버퍼 시작 위치: {self._offset})")
+        del self._buffer[:begin - self._offset]
+        self._offset = begin
+        self._fill(begin + length)
+        data = bytes(self._buffer[:length])
+        self._next = begin + len(data)
+        return data
 
 class GoogleDriveManager(GoogleBaseManager):
     """구글 드라이브 관리를 위한 클래스"""
@@ -16,8 +240,26 @@ class GoogleDriveManager(GoogleBaseManager):
     ]
     DEFAULT_SERVICE = 'drive'
     DEFAULT_VERSION = 'v3'
+    # 서비스 계정당 분당 요청 허용량 (Drive API: 사용자당 60초에 12,000회, 쓰기는 계정당 초당 3회 수준 유지)
+    DEFAULT_READ_QUOTA_PER_MINUTE = 12000
+    DEFAULT_WRITE_QUOTA_PER_MINUTE = 180
+    # 파일 다운로드 시 요청 한 번에 받을 바이트 수 (중단 시 이 단위로 이어받음)
+    DEFAULT_DOWNLOAD_CHUNK_SIZE = 32 * 1024 * 1024
+    # sync_folder가 구글 문서 형식 파일을 내보낼 형식 {mimeType: (내보낼 mimeType, 확장자)}
+    DEFAULT_EXPORT_FORMATS = {
+        'application/vnd.google-apps.document': ('application/vnd.openxmlformats-officedocument.wordprocessingml.document', '.docx'),
+        'application/vnd.google-apps.spreadsheet': ('application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', '.xlsx'),
+        'application/vnd.google-apps.presentation': ('application/vnd.openxmlformats-officedocument.presentationml.presentation', '.pptx'),
+        'application/vnd.google-apps.drawing': ('image/png', '.png'),
+    }
+    # 파일 업로드 시 요청 한 번에 올릴 바이트 수 (256KB의 배수, 중단 시 이 단위로 이어서 업로드)
+    DEFAULT_UPLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+    # 재개 가능 업로드 세션 URI를 저장하는 파일 (프로세스가 중단되어도 이어서 업로드)
+    DEFAULT_UPLOAD_SESSION_FILE = os.path.join(tempfile.gettempdir(), 'gs_utils_upload_sessions.json')
+    # sync_folder가 local_dir에 저장하는 매니페스트 파일 이름
+    SYNC_MANIFEST_NAME = '.gs_sync_manifest.json'
     
-    def __init__(self, json_folder = None, scopes = None, version = None, service_name = None):
+    def __init__(self, json_folder = None, scopes = None, version = None, service_name = None, read_quota_per_minute = None, write_quota_per_minute = None, retry_policy = None, folder_cache_path = None, metrics_sinks = None):
         """
         구글 드라이브 API 서비스 초기화
         
@@ -26,6 +268,11 @@ class GoogleDriveManager(GoogleBaseManager):
             scopes (list, optional): API 스코프 목록. 기본값은 None (DEFAULT_SCOPES 사용)
             version (str, optional): API 버전. 기본값은 None (DEFAULT_VERSION 사용)
             service_name (str, optional): 서비스 이름. 기본값은 None (DEFAULT_SERVICE 사용)
+            read_quota_per_minute (float, optional): 서비스 계정당 분당 읽기 요청 허용량. 기본값은 None (DEFAULT_READ_QUOTA_PER_MINUTE 사용)
+            write_quota_per_minute (float, optional): 서비스 계정당 분당 쓰기 요청 허용량. 기본값은 None (DEFAULT_WRITE_QUOTA_PER_MINUTE 사용)
+            retry_policy (RetryPolicy, optional): 재시도 정책. 기본값은 None (RetryPolicy() 사용)
+            folder_cache_path (str, optional): 폴더 ID 캐시를 저장할 JSON 파일 경로. 지정하면 실행 간에도 캐시를 유지. 기본값은 None (메모리에만 유지)
+            metrics_sinks (list, optional): 요청 지표를 기록할 MetricsSink 리스트. 기본값은 None (기록 안 함)
         """
         # 기본값 설정
         if scopes is None:
@@ -39,38 +286,122 @@ class GoogleDriveManager(GoogleBaseManager):
             service_name=service_name,
             version=version,
             scope=scopes,
-            json_folder=json_folder
+            json_folder=json_folder,
+            read_quota_per_minute=read_quota_per_minute,
+            write_quota_per_minute=write_quota_per_minute,
+            retry_policy=retry_policy,
+            metrics_sinks=metrics_sinks
         )
 
+        # (상위 폴더 ID, 폴더 이름) → 폴더 ID 캐시 {상위 폴더 ID: {폴더 이름: 폴더 ID}}
+        self.folder_cache_path = folder_cache_path
+        self._folder_cache = _load_manifest(folder_cache_path) if folder_cache_path else {}
+        self._folder_cache_lock = threading.Lock()
+
+    def _cache_folders(self, parent_folder_id, folders):
+        """
+        상위 폴더의 하위 폴더 {이름: ID}를 캐시에 기록하고, folder_cache_path가 있으면 파일에도 저장합니다.
+        (같은 이름의 폴더가 여러 개면 먼저 기록된 폴더를 사용)
+        """
+        with self._folder_cache_lock:
+            children = self._folder_cache.setdefault(parent_folder_id, {})
+            added = False
+            for name, folder_id in folders.items():
+                if name not in children:
+                    children[name] = folder_id
+                    added = True
+            if added and self.folder_cache_path:
+                _save_manifest(self.folder_cache_path, self._folder_cache)
+
+    def _cached_folder(self, parent_folder_id, folder_name):
+        with self._folder_cache_lock:
+            return self._folder_cache.get(parent_folder_id, {}).get(folder_name)
+
+    def invalidate_folder_cache(self, parent_folder_id=None):
+        """
+        폴더 ID 캐시를 비웁니다. (캐시된 폴더가 드라이브에서 삭제/이동된 경우)
+
+        Args:
+            parent_folder_id (str, optional): 이 상위 폴더의 항목만 비움. 기본값은 None (전체)
+        """
+        with self._folder_cache_lock:
+            if parent_folder_id is None:
+                self._folder_cache.clear()
+            else:
+                self._folder_cache.pop(extract_googledrive_id(parent_folder_id), None)
+            if self.folder_cache_path:
+                _save_manifest(self.folder_cache_path, self._folder_cache)
+
+    def _list_child_folders(self, parent_folder_id):
+        """
+        상위 폴더의 하위 폴더를 한 번의 목록 조회로 가져와 모두 캐시에 기록합니다.
+
+        Returns:
+            dict: {폴더 이름: 폴더 ID}
+        """
+        folders = {}
+        for folder in self.iter_files(parent_folder_id, fields='id, name', query=f"mimeType='{FOLDER_MIME_TYPE}' and trashed=false"):
+            folders.setdefault(folder['name'], folder['id'])
+        self._cache_folders(parent_folder_id, folders)
+        return folders
+
+
+    def iter_files(self, parent_folder_id, fields='id, name, mimeType', page_size=1000, query=None):
+        """
+        주어진 상위 폴더 안의 파일을 하나씩 반환하는 제너레이터
+        nextPageToken을 따라 모든 페이지를 필요할 때마다 조회하므로 파일 수와 관계없이 메모리 사용량이 일정합니다.
+        
+        Args:
+            parent_folder_id (str): 검색할 상위 폴더의 ID 또는 URL
+            fields (str, optional): 파일별로 가져올 필드 (files(...) 안의 field mask). 기본값은 'id, name, mimeType'
+            page_size (int, optional): 페이지당 최대 파일 수 (최대 1000). 기본값은 1000
+            query (str, optional): 추가 검색 조건 (예: "trashed=false"). 기본값은 None
+            
+        Yields:
+            dict: 파일 정보
+        """
+        parent_folder_id = extract_googledrive_id(parent_folder_id)
+        q = f"'{parent_folder_id}' in parents"
+        if query:
+            q = f"{q} and ({query})"
+
+        page_token = None
+        while True:
+            response = self.request_with_retry(
+                lambda service: service.files().list(
+                    q=q,
+                    supportsAllDrives=True,
+                    includeItemsFromAllDrives=True,
+                    fields=f"nextPageToken, files({fields})",
+                    pageSize=page_size,
+                    pageToken=page_token
+                ).execute()
+            )
+            yield from response.get('files', [])
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                break
 
     # 파일 목록 검색 함수: 주어진 상위 폴더 ID 내에서 파일을 검색합니다.
     def search_file_list_in_parent(self, parent_folder_id, pageSize=500):
         """
-        주어진 상위 폴더 ID 내에서 파일을 검색합니다.
+        주어진 상위 폴더 ID 내에서 파일을 검색합니다. (모든 페이지 조회)
         
         Args:
             parent_folder_id (str): 검색할 상위 폴더의 ID
+            pageSize (int, optional): 한 번의 요청으로 가져올 파일 수. 기본값은 500
             
         Returns:
             list: 검색된 파일의 리스트 (ID와 이름 포함)
         """
-        parent_folder_id = self.extract_googledrive_id(parent_folder_id)
-        query = f"'{parent_folder_id}' in parents"
-        results = self.service.files().list(
-            q=query,
-            supportsAllDrives=True,
-            includeItemsFromAllDrives=True,
-            fields="files(id, name, mimeType)",
-            pageSize=pageSize
-        ).execute()
-        
-        items = results.get("files", [])
+        parent_folder_id = extract_googledrive_id(parent_folder_id)
+        items = list(self.iter_files(parent_folder_id, fields='id, name, mimeType', page_size=pageSize))
         
         if not items:
-            print(f"⚠️ No files found in the folder '{parent_folder_id}'.")
+            console_print(f"⚠️ No files found in the folder '{parent_folder_id}'.")
             return []
         else:
-            print(f"✅ Found {len(items)} file(s) in the folder '{parent_folder_id}':")
+            console_print(f"✅ Found {len(items)} file(s) in the folder '{parent_folder_id}':")
             return items
 
     # 파일 또는 폴더 검색 함수: parent_folder_id 안에서 특정 이름의 파일 또는 폴더를 검색합니다.
@@ -87,74 +418,401 @@ class GoogleDriveManager(GoogleBaseManager):
             list: 찾은 파일 또는 폴더의 ID 리스트 또는 빈 리스트 (없을 경우)
         """
 
-        parent_folder_id = self.extract_googledrive_id(parent_folder_id)
-        mime_type = 'application/vnd.google-apps.folder' if is_folder else 'application/octet-stream'
-        query = f"name='{item_name}' and mimeType='{mime_type}' and '{parent_folder_id}' in parents"
-        results = self.service.files().list(
-                q=query,
-                supportsAllDrives=True,
-                includeItemsFromAllDrives=True,
-                fields="files(id, name)",
-                ).execute()
-        items = results.get("files", [])
+        parent_folder_id = extract_googledrive_id(parent_folder_id)
+        mime_type = FOLDER_MIME_TYPE if is_folder else 'application/octet-stream'
+        query = f"name='{_escape_query_value(item_name)}' and mimeType='{mime_type}'"
+        items = list(self.iter_files(parent_folder_id, fields='id, name', query=query))
 
         if not items:
             item_type = "folder" if is_folder else "file"
-            print(f"⚠️ {inspect.currentframe().f_code.co_name} | No {item_type}s found with the name '{item_name}' in the folder '{parent_folder_id}'.")
+            console_print(f"⚠️ {inspect.currentframe().f_code.co_name} | No {item_type}s found with the name '{item_name}' in the folder '{parent_folder_id}'.")
             return []
         else:
             item_type = "folder" if is_folder else "file"
             item_ids = [item['id'] for item in items]
-            print(f"✅ Found {len(item_ids)} {item_type}(s): {', '.join([item['name'] for item in items])} (IDs: {', '.join(item_ids)})")
+            console_print(f"✅ Found {len(item_ids)} {item_type}(s): {', '.join([item['name'] for item in items])} (IDs: {', '.join(item_ids)})")
             return item_ids
 
     # 파일 다운로드 함수: 특정 폴더에 있는 모든 파일 다운로드
-    def download_files_in_folder(self, folder_id, save_path):
+    def download_files_in_folder(self, folder_id, save_path, max_workers=4, chunk_size=None, skip_existing=True):
         """
-        주어진 폴더 ID 내의 모든 파일을 다운로드합니다.
+        주어진 폴더 ID 내의 모든 파일을 병렬로 다운로드합니다.
+        파일은 '<파일명>.<파일ID>.part'에 청크 단위로 받은 뒤 크기와 md5Checksum을 확인하고 원래 이름으로 바꾸며,
+        실패한 파일은 retry_policy에 따라 받은 위치부터 이어서 다시 받습니다. (중단 후 다시 호출해도 .part부터 이어받음)
+        폴더에 이름이 같은 파일이 여러 개면 두 번째 파일부터 '<이름> (<파일ID>).<확장자>'로 저장합니다.
         
         Args:
             folder_id (str): 다운로드할 파일이 있는 폴더의 ID
             save_path (str): 파일을 저장할 경로
+            max_workers (int, optional): 동시에 다운로드할 파일 수. 기본값은 4
+            chunk_size (int, optional): 요청 한 번에 받을 바이트 수. 기본값은 None (DEFAULT_DOWNLOAD_CHUNK_SIZE 사용)
+            skip_existing (bool, optional): True이면 로컬 파일의 크기와 md5가 같은 파일은 건너뜀. 기본값은 True
             
         Returns:
-            None
-        """
-        query = f"'{folder_id}' in parents"
-        results = self.service.files().list(
-                q=query,
-                supportsAllDrives=True,
-                includeItemsFromAllDrives=True,
-                fields="files(id, name)",
-                ).execute()
-        files = results.get('files', [])
-        print(files)
+            dict: 다운로드 결과 요약
+                - downloaded (int): 다운로드한 파일 수
+                - skipped (int): 이미 최신이거나 다운로드할 수 없는 형식(구글 문서 등)이라 건너뛴 파일 수
+                - failed (list): 실패한 파일 이름 리스트
+                - bytes (int): 이번 호출에서 받은 바이트 수
+                - elapsed (float): 소요 시간(초)
+                - bytes_per_second (float): 평균 처리량
+        """
+        if chunk_size is None:
+            chunk_size = self.DEFAULT_DOWNLOAD_CHUNK_SIZE
+        os.makedirs(save_path, exist_ok=True)
+
+        start_time = time.time()
+        summary = {'downloaded': 0, 'skipped': 0, 'failed': [], 'bytes': 0}
+        summary_lock = threading.Lock()
+
+        def download(file, file_path):
+            try:
+                received = self._download_file(file, file_path, chunk_size, skip_existing)
+            except Exception as e:
+                console_print(f"⚠️ download_files_in_folder | 파일 다운로드 실패: {file['name']} ({file['id']}) - {e}")
+                with summary_lock:
+                    summary['failed'].append(file['name'])
+                return
+            with summary_lock:
+                if received is None:
+                    summary['skipped'] += 1
+                    return
+                summary['downloaded'] += 1
+                summary['bytes'] += received
+                if summary['downloaded'] % DOWNLOAD_PROGRESS_INTERVAL == 0:
+                    elapsed = time.time() - start_time
+                    console_print(f"📥 {summary['downloaded']}개 다운로드 ({summary['bytes'] / 1024 ** 2:,.1f} MB, {summary['bytes'] / 1024 ** 2 / max(elapsed, 1e-9):,.1f} MB/s)")
+
+        # 파일 목록은 페이지 단위로 조회하며 바로 작업 스레드에 배정
+        file_count = 0
+        local_names = set()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for file in self.iter_files(folder_id, fields='id, name, mimeType, size, md5Checksum'):
+                file_count += 1
+                local_name = file['name']
+                if local_name in local_names:
+                    # 같은 이름의 파일이 이미 있으면 덮어쓰지 않도록 파일 ID를 붙인 이름으로 저장
+                    local_name = _path_with_id(local_name, file['id'])
+                local_names.add(local_name)
+                executor.submit(download, file, os.path.join(save_path, local_name))
+
+        if not file_count:
+            console_print(f"⚠️ {inspect.currentframe().f_code.co_name} | No files found in folder with ID '{folder_id}'.")
+
+        summary['elapsed'] = time.time() - start_time
+        summary['bytes_per_second'] = summary['bytes'] / summary['elapsed'] if summary['elapsed'] > 0 else 0.0
+        console_print(
+            f"✅ Done: {summary['downloaded']}개의 파일 다운로드 완료 (건너뜀: {summary['skipped']}, 실패: {len(summary['failed'])}) "
+            f"- {summary['bytes'] / 1024 ** 2:,.1f} MB, {summary['elapsed']:.1f}초, {summary['bytes_per_second'] / 1024 ** 2:,.1f} MB/s"
+        )
+        return summary
+
+    def _download_file(self, file, file_path, chunk_size, skip_existing=True):
+        """
+        파일 하나를 file_path에 다운로드합니다. (download_files_in_folder의 작업 단위)
         
-        if not files:
-            print(f"⚠️ {inspect.currentframe().f_code.co_name} | No files found in folder with ID '{folder_id}'.")
+        Args:
+            file (dict): id, name, mimeType, size, md5Checksum을 포함한 파일 정보
+            file_path (str): 저장할 경로
+            chunk_size (int): 요청 한 번에 받을 바이트 수
+            skip_existing (bool, optional): True이면 로컬 파일의 크기와 md5가 같을 때 건너뜀. 기본값은 True
+            
+        Returns:
+            int: 이번에 받은 바이트 수 (건너뛴 경우 None)
+        """
+        if file.get('mimeType', '').startswith(GOOGLE_APPS_MIME_PREFIX):
+            console_print(f"⚠️ {inspect.currentframe().f_code.co_name} | 구글 문서 형식은 다운로드할 수 없어 건너뜁니다: {file['name']} ({file['mimeType']})")
+            return None
+        if skip_existing and _is_same_file(file_path, file):
+            return None
+
+        part_path = f"{file_path}.{file['id']}.part"
+        resumed = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        self._run_with_retry(lambda: self._download_to_part(file, part_path, chunk_size), file['name'])
+
+        if not _is_same_file(part_path, file):
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise RuntimeError(f"다운로드한 파일의 크기 또는 md5Checksum이 일치하지 않습니다: {file['name']}")
+        os.replace(part_path, file_path)
+        return os.path.getsize(file_path) - resumed
+
+    def _download_to_part(self, file, part_path, chunk_size):
+        """
+        part_path에 이미 받은 바이트 뒤부터 파일 끝까지 청크 단위로 이어받습니다.
+        재시도 시 다시 호출되며, 그때마다 현재 스레드의 (전환된) 계정으로 요청을 새로 만듭니다.
+        """
+        # 빈 파일(크기 0)도 확인할 수 있도록 받기 전에 .part 파일을 만들어 둠
+        open(part_path, 'ab').close()
+        offset = os.path.getsize(part_path)
+        if 'size' in file and offset >= int(file['size']):
             return
+        request = self.service.files().get_media(fileId=file['id'], supportsAllDrives=True)
+        with open(part_path, 'ab') as fh:
+            self._download_request(request, fh, chunk_size, offset)
+
+    def _download_request(self, request, fh, chunk_size, offset=0):
+        """
+        미디어 요청(get_media, export_media)의 응답을 offset 바이트부터 청크 단위로 fh에 씁니다.
+        """
+        done = False
+        while not done:
+            offset, done = self._download_chunk(request, fh, chunk_size, offset)
+
+    def _download_chunk(self, request, fh, chunk_size, offset):
+        """
+        미디어 요청의 offset 바이트부터 chunk_size 바이트를 받아 fh에 씁니다.
+        받을 구간은 Range 헤더로 직접 지정하며, 구간 요청을 무시하고 전체 내용을 보낸 응답(200)은 이미 받은 offset 바이트를 건너뛰고 씁니다.
+        (fh를 되감거나 자르지 않으므로 fh의 현재 위치 앞에 있던 내용은 그대로 유지)
+
+        Returns:
+            tuple: (다음 offset, 파일 끝까지 받았는지 여부)
+        """
+        # 청크 요청마다 읽기 토큰을 가져오고, 다른 계정에서 가져온 경우 그 계정의 http 사용
+        request.http = self._before_execute(request) or self.http
+        headers = dict(request.headers, range=f'bytes={offset}-{offset + chunk_size - 1}')
+        response, content = self._execute_media_chunk(
+            request, lambda http: http.request(request.uri, request.method, headers=headers)
+        )
+        if response.status == 416:
+            # offset이 이미 파일 끝
+            return offset, True
+        if response.status >= 300:
+            raise HttpError(response, content, uri=request.uri)
+        if response.status != 206:
+            fh.write(content[offset:])
+            return max(offset, len(content)), True
+        fh.write(content)
+        offset += len(content)
+        total = response.get('content-range', '').rpartition('/')[2]
+        return offset, not content or not total.isdigit() or offset >= int(total)
+
+    def sync_folder(self, folder_id, local_dir, max_workers=4, chunk_size=None, use_changes=False, export_formats=None, delete_removed=True):
+        """
+        드라이브 폴더 트리 전체를 local_dir에 미러링합니다.
+        하위 폴더까지 재귀적으로 조회하여 local_dir의 매니페스트(SYNC_MANIFEST_NAME)에 파일별 id, modifiedTime, md5, 경로를 기록하고,
+        다음 실행부터는 새로 생기거나 바뀐 파일만 받습니다. (이름/위치만 바뀐 파일은 로컬에서 옮기고, 드라이브에서 사라진 파일은 삭제)
         
-        # 저장 경로가 없으면 생성
-        if not os.path.exists(save_path):
-            os.makedirs(save_path)
-
-        # 다운로드 시작
-        for file in files:
-            file_id = file['id']
-            file_name = file['name']
-            request = self.service.files().get_media(fileId=file_id)
-            file_path = os.path.join(save_path, file_name)
-            
-            with io.FileIO(file_path, 'wb') as fh:
-                downloader = MediaIoBaseDownload(fh, request)
-                done = False
-                while not done:
-                    status, done = downloader.next_chunk()
-                    print(f"Downloading {file_name}: {int(status.progress() * 100)}% complete")
-            print(f"📥 Downloaded file: {file_name} to {file_path}")
+        Args:
+            folder_id (str): 미러링할 최상위 폴더의 ID 또는 URL
+            local_dir (str): 저장할 로컬 폴더 경로
+            max_workers (int, optional): 동시에 다운로드할 파일 수. 기본값은 4
+            chunk_size (int, optional): 요청 한 번에 받을 바이트 수. 기본값은 None (DEFAULT_DOWNLOAD_CHUNK_SIZE 사용)
+            use_changes (bool, optional): True이면 Changes API로 지난 실행 이후 바뀐 항목만 확인하고,
+                폴더 구조가 바뀐 경우에만 트리 전체를 다시 조회. 기본값은 False
+                (변경 내역은 요청에 사용된 서비스 계정이 볼 수 있는 항목 기준)
+            export_formats (dict, optional): 구글 문서 형식별 내보내기 형식 {mimeType: (내보낼 mimeType, 확장자)}.
+                기본값은 None (DEFAULT_EXPORT_FORMATS 사용). 목록에 없는 형식은 건너뜀
+            delete_removed (bool, optional): True이면 드라이브에서 삭제되었거나 트리 밖으로 옮겨진 파일을 로컬에서도 삭제. 기본값은 True
             
-        print(f'✅ Done: {len(files)}개의 파일 다운로드 완료')
-    
+        Returns:
+            dict: 동기화 결과 요약
+                - downloaded (int): 다운로드 또는 내보내기한 파일 수
+                - moved (int): 로컬에서 이름/위치만 바꾼 파일 수
+                - deleted (int): 로컬에서 삭제한 파일 수
+                - unchanged (int): 바뀌지 않아 건너뛴 파일 수
+                - failed (list): 실패한 파일 경로 리스트 (다음 실행 때 다시 시도)
+                - bytes (int): 받은 바이트 수
+                - elapsed (float): 소요 시간(초)
+        """
+        folder_id = extract_googledrive_id(folder_id)
+        if chunk_size is None:
+            chunk_size = self.DEFAULT_DOWNLOAD_CHUNK_SIZE
+        if export_formats is None:
+            export_formats = self.DEFAULT_EXPORT_FORMATS
+        os.makedirs(local_dir, exist_ok=True)
+        manifest_path = os.path.join(local_dir, self.SYNC_MANIFEST_NAME)
+        manifest = _load_manifest(manifest_path)
+        if manifest.get('folder_id') != folder_id:
+            manifest = {'folder_id': folder_id, 'start_page_token': None, 'folders': {}, 'files': {}}
+
+        start_time = time.time()
+        remote = None
+        start_page_token = None
+        if use_changes and manifest['start_page_token']:
+            remote, start_page_token = self._apply_folder_changes(manifest, export_formats)
+        if remote is None:
+            # 트리를 조회하기 전에 토큰을 받아 두어야 조회 중 바뀐 항목도 다음 실행에서 잡힘
+            if use_changes:
+                start_page_token = self.request_with_retry(
+                    lambda service: service.changes().getStartPageToken(supportsAllDrives=True).execute()
+                )['startPageToken']
+            remote = self._walk_folder(folder_id, export_formats)
+        folders, files = remote
+
+        # 내보내기 형식이 없는 구글 문서 형식(설문지, 바로가기 등)은 제외
+        targets = {
+            file_id: file for file_id, file in files.items()
+            if not file['mimeType'].startswith(GOOGLE_APPS_MIME_PREFIX) or file['mimeType'] in export_formats
+        }
+
+        # 같은 폴더에 이름이 같은 파일이 여러 개면 서로 덮어쓰지 않도록 모두 파일 ID를 붙인 경로에 저장
+        path_counts = Counter(file['path'] for file in targets.values())
+        targets = {
+            file_id: dict(file, path=_path_with_id(file['path'], file_id)) if path_counts[file['path']] > 1 else file
+            for file_id, file in targets.items()
+        }
+
+        summary = {'downloaded': 0, 'moved': 0, 'deleted': 0, 'unchanged': 0, 'failed': [], 'bytes': 0}
+        synced = {}
+        pending = []
+        for file_id, file in targets.items():
+            local_path = os.path.join(local_dir, *file['path'].split('/'))
+            old = manifest['files'].get(file_id)
+            if old is not None and _same_revision(old, file):
+                old_path = os.path.join(local_dir, *old['path'].split('/'))
+                if old['path'] != file['path'] and os.path.isfile(old_path) and not os.path.exists(local_path):
+                    os.makedirs(os.path.dirname(local_path), exist_ok=True)
+                    os.replace(old_path, local_path)
+                    summary['moved'] += 1
+                    synced[file_id] = file
+                    continue
+                if os.path.isfile(local_path):
+                    summary['unchanged'] += 1
+                    synced[file_id] = file
+                    continue
+            pending.append((file, local_path))
+
+        # 사라진 파일 삭제 (새 파일이 같은 경로를 쓰는 경우는 제외)
+        if delete_removed:
+            kept_paths = {file['path'] for file in targets.values()}
+            for file_id, old in manifest['files'].items():
+                if file_id in targets or old['path'] in kept_paths:
+                    continue
+                old_path = os.path.join(local_dir, *old['path'].split('/'))
+                if os.path.isfile(old_path):
+                    os.remove(old_path)
+                    summary['deleted'] += 1
+            for path in sorted(set(manifest['folders'].values()) - set(folders.values()), key=len, reverse=True):
+                try:
+                    os.rmdir(os.path.join(local_dir, *path.split('/')))
+                except OSError:
+                    pass
+        else:
+            synced.update({file_id: old for file_id, old in manifest['files'].items() if file_id not in targets})
+
+        summary_lock = threading.Lock()
+
+        def download(file, local_path):
+            try:
+                os.makedirs(os.path.dirname(local_path), exist_ok=True)
+                if file['mimeType'].startswith(GOOGLE_APPS_MIME_PREFIX):
+                    received = self._export_file(file, local_path, export_formats[file['mimeType']][0], chunk_size)
+                else:
+                    received = self._download_file(file, local_path, chunk_size)
+            except Exception as e:
+                console_print(f"⚠️ sync_folder | 파일 동기화 실패: {file['path']} ({file['id']}) - {e}")
+                with summary_lock:
+                    summary['failed'].append(file['path'])
+                    # 이전 기록을 유지하여 다음 실행 때 다시 받음
+                    if file['id'] in manifest['files']:
+                        synced[file['id']] = manifest['files'][file['id']]
+                return
+            with summary_lock:
+                synced[file['id']] = file
+                if received is None:
+                    # 매니페스트에는 없지만 로컬 파일의 크기와 md5가 이미 같은 경우
+                    summary['unchanged'] += 1
+                    return
+                summary['downloaded'] += 1
+                summary['bytes'] += received
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for file, local_path in pending:
+                executor.submit(download, file, local_path)
+
+        _save_manifest(manifest_path, {
+            'folder_id': folder_id,
+            'start_page_token': start_page_token,
+            'folders': folders,
+            'files': synced,
+        })
+
+        summary['elapsed'] = time.time() - start_time
+        console_print(
+            f"✅ 폴더 동기화 완료: {local_dir} (다운로드: {summary['downloaded']}, 이동: {summary['moved']}, 삭제: {summary['deleted']}, "
+            f"변경 없음: {summary['unchanged']}, 실패: {len(summary['failed'])}) - {summary['bytes'] / 1024 ** 2:,.1f} MB, {summary['elapsed']:.1f}초"
+        )
+        return summary
+
+    def _walk_folder(self, folder_id, export_formats):
+        """
+        폴더 트리를 너비 우선으로 조회합니다.
+        
+        Returns:
+            tuple: ({하위 폴더 ID: 상대 경로}, {파일 ID: 매니페스트 항목(path는 로컬 상대 경로)})
+        """
+        folders = {}
+        files = {}
+        queue = [(folder_id, '')]
+        while queue:
+            parent_id, parent_path = queue.pop(0)
+            for item in self.iter_files(parent_id, fields=SYNC_FILE_FIELDS, query='trashed=false'):
+                path = _join_drive_path(parent_path, item['name'])
+                if item['mimeType'] == FOLDER_MIME_TYPE:
+                    folders[item['id']] = path
+                    queue.append((item['id'], path))
+                else:
+                    files[item['id']] = _manifest_entry(item, path, export_formats)
+        return folders, files
+
+    def _apply_folder_changes(self, manifest, export_formats):
+        """
+        매니페스트의 start_page_token 이후 변경 내역을 매니페스트에 반영합니다.
+        
+        Returns:
+            tuple: ((폴더 dict, 파일 dict), 다음 start_page_token).
+                트리 안의 폴더가 생성/변경/삭제된 경우 (None, None)을 반환하여 트리 전체를 다시 조회하게 합니다.
+        """
+        folders = dict(manifest['folders'])
+        files = dict(manifest['files'])
+        known_folders = dict(folders, **{manifest['folder_id']: ''})
+
+        page_token = manifest['start_page_token']
+        while True:
+            response = self.request_with_retry(
+                lambda service: service.changes().list(
+                    pageToken=page_token,
+                    supportsAllDrives=True,
+                    includeItemsFromAllDrives=True,
+                    pageSize=1000,
+                    fields=f"nextPageToken, newStartPageToken, changes(fileId, removed, file({SYNC_FILE_FIELDS}, parents, trashed))"
+                ).execute()
+            )
+            for change in response.get('changes', []):
+                file_id = change.get('fileId')
+                item = change.get('file') or {}
+                parent_id = next((parent for parent in item.get('parents', []) if parent in known_folders), None)
+                if file_id in known_folders or (item.get('mimeType') == FOLDER_MIME_TYPE and parent_id is not None):
+                    console_print("ℹ️ 폴더 구조 변경이 감지되어 폴더 트리 전체를 다시 조회합니다.")
+                    return None, None
+                if change.get('removed') or item.get('trashed') or parent_id is None:
+                    files.pop(file_id, None)
+                else:
+                    files[file_id] = _manifest_entry(item, _join_drive_path(known_folders[parent_id], item['name']), export_formats)
+            if 'newStartPageToken' in response:
+                return (folders, files), response['newStartPageToken']
+            page_token = response['nextPageToken']
+
+    def _export_file(self, file, file_path, mime_type, chunk_size):
+        """
+        구글 문서 형식 파일을 mime_type으로 내보내 file_path에 저장합니다.
+        
+        Returns:
+            int: 받은 바이트 수
+        """
+        part_path = f"{file_path}.{file['id']}.part"
+
+        def export():
+            request = self.service.files().export_media(fileId=file['id'], mimeType=mime_type)
+            # 내보내기 응답은 이어받을 수 없으므로 매번 처음부터 받음
+            with open(part_path, 'wb') as fh:
+                self._download_request(request, fh, chunk_size)
+
+        self._run_with_retry(export, file['name'])
+        os.replace(part_path, file_path)
+        return os.path.getsize(file_path)
+
     def clone_file(self, file_id, new_title):
         """
         구글 스프레드시트를 복제하고 새 이름 지정
@@ -166,21 +824,48 @@ class GoogleDriveManager(GoogleBaseManager):
         Returns:
             str: 복제된 파일의 ID 또는 None (실패 시)
         """
-        break_point = 0
-        while True:
-            try:
-                copied_file = self.service.files().copy(
+        try:
+            copied_file = self.request_with_retry(
+                lambda service: service.files().copy(
                     fileId=file_id,
                     supportsAllDrives=True,
                     body={"name": new_title}
                 ).execute()
-                return copied_file['id']
-            except HttpError as error:
-                print(f"⚠️ {inspect.currentframe().f_code.co_name} | 파일 복제 중 오류 발생: {error}")
-                break_point = break_point + 1
-                time.sleep(10)
-                if break_point == 5:
-                    return None
+            )
+            return copied_file['id']
+        except Exception as error:
+            console_print(f"⚠️ {inspect.currentframe().f_code.co_name} | 파일 복제 중 오류 발생: {error}")
+            return None
+
+    def clone_files(self, items, parent_folder_id=None, batch_size=100):
+        """
+        여러 파일을 배치 요청으로 한 번에 복제합니다. (배치당 최대 100개, 실패한 항목만 재시도)
+        복제는 멱등이 아니므로 서버/네트워크 오류로 결과를 알 수 없는 항목은 중복 복제를 막기 위해 재시도하지 않고 None으로 반환합니다.
+        
+        Args:
+            items (iterable): (복제할 파일 ID, 새 파일 이름) 튜플 목록
+            parent_folder_id (str, optional): 복제본을 만들 폴더 ID. 기본값은 None (원본과 같은 폴더)
+            batch_size (int, optional): 배치 하나에 담을 최대 요청 수. 기본값은 100
+            
+        Returns:
+            list: 입력 순서와 같은 순서의 복제된 파일 ID 리스트 (실패한 항목은 None)
+        """
+        items = list(items)
+        parents = {'parents': [extract_googledrive_id(parent_folder_id)]} if parent_folder_id else {}
+        results = self.batch_requests(
+            [
+                lambda service, file_id=file_id, new_title=new_title: service.files().copy(
+                    fileId=extract_googledrive_id(file_id),
+                    supportsAllDrives=True,
+                    fields='id',
+                    body={'name': new_title, **parents}
+                )
+                for file_id, new_title in items
+            ],
+            batch_size=batch_size,
+            idempotent=False
+        )
+        return [None if isinstance(result, Exception) else result['id'] for result in results]
 
     def delete_file(self, file_id):
         """
@@ -191,9 +876,36 @@ class GoogleDriveManager(GoogleBaseManager):
         """
         try:
             self.service.files().delete(fileId=file_id).execute()
-            print(f"✅ 파일 ID {file_id}: 삭제 완료")
+            console_print(f"✅ 파일 ID {file_id}: 삭제 완료")
         except HttpError as error:
-            print(f"⚠️ {inspect.currentframe().f_code.co_name} | 파일 삭제 중 오류 발생: {error}")
+            console_print(f"⚠️ {inspect.currentframe().f_code.co_name} | 파일 삭제 중 오류 발생: {error}")
+
+    def delete_files(self, file_ids, batch_size=100):
+        """
+        여러 파일을 배치 요청으로 한 번에 삭제합니다. (배치당 최대 100개, 실패한 항목만 재시도)
+        이미 삭제되어 찾을 수 없는 파일(404)은 삭제된 것으로 봅니다.
+        
+        Args:
+            file_ids (iterable): 삭제할 파일 ID 또는 URL 목록
+            batch_size (int, optional): 배치 하나에 담을 최대 요청 수. 기본값은 100
+            
+        Returns:
+            list: 입력 순서와 같은 순서의 삭제 성공 여부 리스트
+        """
+        results = self.batch_requests(
+            [
+                lambda service, file_id=file_id: service.files().delete(
+                    fileId=extract_googledrive_id(file_id),
+                    supportsAllDrives=True
+                )
+                for file_id in file_ids
+            ],
+            batch_size=batch_size
+        )
+        return [
+            not isinstance(result, Exception) or (isinstance(result, HttpError) and result.resp.status == 404)
+            for result in results
+        ]
 
     def create_folder(self, folder_name, parent_folder_id):
         """
@@ -205,52 +917,476 @@ class GoogleDriveManager(GoogleBaseManager):
         Returns:
             str: 폴더 ID
         """
-        query = (
-            f"'{parent_folder_id}' in parents and "
-            f"mimeType='application/vnd.google-apps.folder' and "
-            f"name='{folder_name}' and trashed=false"
-        )
-        response = self.service.files().list(
-            q=query,
-            spaces='drive',
-            includeItemsFromAllDrives=True,
-            fields='files(id, name)',
-            supportsAllDrives=True
-        ).execute()
-        files = response.get('files', [])
-        if files:
-            folder_id = files[0].get('id')
-            print(f"✅ 폴더 '{folder_name}' 이미 존재 - ID: {folder_id}")
+        parent_folder_id = extract_googledrive_id(parent_folder_id)
+        folder_id = self._cached_folder(parent_folder_id, folder_name)
+        if folder_id is None:
+            query = f"mimeType='{FOLDER_MIME_TYPE}' and name='{_escape_query_value(folder_name)}' and trashed=false"
+            folder = next(self.iter_files(parent_folder_id, fields='id, name', page_size=1, query=query), None)
+            folder_id = folder.get('id') if folder is not None else None
+        if folder_id is not None:
+            self._cache_folders(parent_folder_id, {folder_name: folder_id})
+            console_print(f"✅ 폴더 '{folder_name}' 이미 존재 - ID: {folder_id}")
             return folder_id
+        folder_id = self._create_folder(folder_name, parent_folder_id)
+        console_print(f"✅ 폴더 '{folder_name}' 생성 완료 - ID: {folder_id}")
+        return folder_id
+
+    def _create_folder(self, folder_name, parent_folder_id):
+        """
+        확인 없이 폴더를 생성하고 캐시에 기록합니다.
+
+        Returns:
+            str: 생성된 폴더 ID
+        """
         file_metadata = {
             'name': folder_name,
-            'mimeType': 'application/vnd.google-apps.folder',
+            'mimeType': FOLDER_MIME_TYPE,
             'parents': [parent_folder_id],
         }
-        folder = self.service.files().create(
-            body=file_metadata, fields='id', supportsAllDrives=True
-        ).execute()
-        print(f"✅ 폴더 '{folder_name}' 생성 완료 - ID: {folder.get('id')}")
-        return folder.get('id')
+        folder = self.request_with_retry(
+            lambda service: service.files().create(
+                body=file_metadata, fields='id', supportsAllDrives=True
+            ).execute()
+        )
+        self._cache_folders(parent_folder_id, {folder_name: folder['id']})
+        return folder['id']
 
-    def upload_file(self, file_path, parent_folder_id):
+    def ensure_path(self, root_folder_id, path):
+        """
+        root_folder_id 아래에 'a/b/c' 형태의 중첩 폴더 경로가 있는지 확인하고, 없는 부분만 생성합니다.
+        (상위 폴더 ID, 폴더 이름) → 폴더 ID 캐시를 사용하므로 이미 확인한 경로는 API 호출 없이 반환하고,
+        캐시에 없는 단계는 단계당 목록 조회 1회로 하위 폴더를 모두 캐시한 뒤 없는 폴더부터 끝까지 생성합니다.
+
+        Args:
+            root_folder_id (str): 기준 폴더 ID 또는 URL
+            path (str): '/'로 구분한 하위 폴더 경로 (예: 'reports/2026/10/18')
+
+        Returns:
+            str: 마지막 폴더의 ID
+
+        * example: 날짜별 보고서 폴더 확인/생성
+
+            folder_id = drive_manager.ensure_path('루트_폴더_ID', f'reports/{date:%Y/%m/%d}')
+        """
+        root_folder_id = extract_googledrive_id(root_folder_id)
+        names = [name for name in path.split('/') if name]
+        try:
+            return self._resolve_path(root_folder_id, names)
+        except HttpError as error:
+            # 캐시된 폴더가 삭제/이동되어 하위 폴더를 만들 수 없는 경우 캐시를 비우고 한 번 더 시도
+            if error.resp.status != 404:
+                raise
+            console_print(f"⚠️ {inspect.currentframe().f_code.co_name} | 캐시된 폴더를 찾을 수 없어 캐시를 비우고 다시 확인합니다: {path}")
+            self.invalidate_folder_cache()
+            return self._resolve_path(root_folder_id, names)
+
+    def _resolve_path(self, root_folder_id, names):
+        folder_id = root_folder_id
+        created = False
+        for name in names:
+            child_id = None if created else self._cached_folder(folder_id, name)
+            if child_id is None and not created:
+                child_id = self._list_child_folders(folder_id).get(name)
+            if child_id is None:
+                # 이 단계부터는 상위 폴더를 새로 만들었으므로 조회 없이 생성
+                child_id = self._create_folder(name, folder_id)
+                created = True
+            folder_id = child_id
+        return folder_id
+
+    def ensure_folders(self, folder_names, parent_folder_id, batch_size=100):
+        """
+        상위 폴더 안에 여러 폴더가 있는지 한 번에 확인하고, 없는 폴더만 배치 요청으로 생성합니다.
+        (폴더 수와 관계없이 목록 조회 1회 + 100개당 생성 요청 1회, 모두 폴더 ID 캐시에 있으면 API 호출 없음)
+        서버/네트워크 오류로 생성 결과를 알 수 없는 폴더는 목록을 다시 조회하여, 없는 폴더만 한 번 더 생성합니다. (중복 폴더 방지)
+        
+        Args:
+            folder_names (iterable): 폴더 이름 목록
+            parent_folder_id (str): 상위 폴더 ID 또는 URL
+            batch_size (int, optional): 배치 하나에 담을 최대 요청 수. 기본값은 100
+            
+        Returns:
+            dict: {폴더 이름: 폴더 ID} (생성에 실패한 폴더는 None)
+        """
+        parent_folder_id = extract_googledrive_id(parent_folder_id)
+        folder_names = list(dict.fromkeys(folder_names))
+        folder_ids = {name: self._cached_folder(parent_folder_id, name) for name in folder_names}
+        if None in folder_ids.values():
+            children = self._list_child_folders(parent_folder_id)
+            folder_ids = {name: children[name] for name in folder_names if name in children}
+
+        missing = [name for name in folder_names if name not in folder_ids]
+        if missing:
+            created = self._create_folders(missing, parent_folder_id, batch_size)
+            ambiguous = [name for name in missing if isinstance(created[name], AmbiguousRequestError)]
+            if ambiguous:
+                # 생성 요청이 이미 적용되었을 수 있으므로 다시 조회하여 있는 폴더는 그대로 사용하고 없는 폴더만 다시 생성
+                children = self._list_child_folders(parent_folder_id)
+                retry_names = [name for name in ambiguous if name not in children]
+                created.update({name: children[name] for name in ambiguous if name in children})
+                if retry_names:
+                    created.update(self._create_folders(retry_names, parent_folder_id, batch_size))
+            for name in missing:
+                folder_ids[name] = None if isinstance(created[name], Exception) else created[name]
+            self._cache_folders(parent_folder_id, {name: folder_ids[name] for name in missing if folder_ids[name] is not None})
+        console_print(f"✅ 폴더 {len(folder_names)}개 확인 완료 (생성: {sum(folder_ids[name] is not None for name in missing)}, 실패: {sum(folder_ids[name] is None for name in missing)})")
+        return {name: folder_ids[name] for name in folder_names}
+
+    def _create_folders(self, folder_names, parent_folder_id, batch_size):
+        """
+        폴더를 확인 없이 배치 요청으로 생성합니다. (결과를 알 수 없는 생성 요청은 다시 보내지 않음)
+
+        Returns:
+            dict: {폴더 이름: 생성된 폴더 ID 또는 예외 객체}
+        """
+        results = self.batch_requests(
+            [
+                lambda service, name=name: service.files().create(
+                    body={'name': name, 'mimeType': FOLDER_MIME_TYPE, 'parents': [parent_folder_id]},
+                    fields='id',
+                    supportsAllDrives=True
+                )
+                for name in folder_names
+            ],
+            batch_size=batch_size,
+            idempotent=False
+        )
+        return {name: result if isinstance(result, Exception) else result['id'] for name, result in zip(folder_names, results)}
+
+    def upload_file(self, file_path, parent_folder_id, chunk_size=None, session_file=None):
         """
         구글 드라이브에 파일을 업로드합니다.
+        청크 단위 재개 가능 업로드를 사용하며, 실패 시 retry_policy에 따라 업로드 세션을 이어서 재시도합니다.
 
         Args:
             file_path (str): 업로드할 파일 경로
             parent_folder_id (str): 상위 폴더 ID
+            chunk_size (int, optional): 요청 한 번에 올릴 바이트 수 (256KB의 배수). 기본값은 None (DEFAULT_UPLOAD_CHUNK_SIZE 사용)
+            session_file (str, optional): 업로드 세션 URI를 저장할 파일 경로. 기본값은 None (DEFAULT_UPLOAD_SESSION_FILE 사용)
         Returns:
             str: 업로드된 파일의 ID
         """
+        if chunk_size is None:
+            chunk_size = self.DEFAULT_UPLOAD_CHUNK_SIZE
+        sessions = _UploadSessionStore(session_file or self.DEFAULT_UPLOAD_SESSION_FILE)
         file_name = os.path.basename(file_path)
-        media = MediaFileUpload(file_path, resumable=True)
-        file_metadata = {
-            'name': file_name,
-            'parents': [parent_folder_id],
-        }
-        file = self.service.files().create(
-            body=file_metadata, media_body=media, fields='id', supportsAllDrives=True
-        ).execute()
-        print(f"✅ 파일 '{file_name}' 업로드 완료 - ID: {file.get('id')}")
-        return file.get('id')
\ No newline at end of file
+        file = self._upload_with_session(file_path, extract_googledrive_id(parent_folder_id), chunk_size, sessions)
+        console_print(f"✅ 파일 '{file_name}' 업로드 완료 - ID: {file.get('id')}")
+        return file.get('id')
+
+    def upload_stream(self, stream, file_name, parent_folder_id, mime_type='application/octet-stream', chunk_size=None):
+        """
+        임시 파일 없이 메모리 버퍼, 파일 객체 또는 바이트 제너레이터의 내용을 드라이브에 업로드합니다.
+        청크 단위 재개 가능 업로드를 사용하며, 실패한 청크는 서버에 받은 위치를 물어본 뒤 그 위치부터 다시 보냅니다.
+        제너레이터는 청크 하나 분량만 메모리에 두고 보내므로 전체 내용을 한 번 더 복사하지 않습니다.
+
+        Args:
+            stream (bytes | file-like | iterable): 업로드할 내용.
+                bytes/bytearray/memoryview, seek 가능한 파일 객체(처음부터 업로드), 또는 bytes/str 조각을 내는 iterable
+            file_name (str): 드라이브에 만들 파일 이름
+            parent_folder_id (str): 상위 폴더 ID 또는 URL
+            mime_type (str, optional): 파일 MIME 타입. 기본값은 'application/octet-stream'
+            chunk_size (int, optional): 요청 한 번에 올릴 바이트 수 (256KB의 배수). 기본값은 None (DEFAULT_UPLOAD_CHUNK_SIZE 사용)
+
+        Returns:
+            str: 업로드된 파일의 ID
+        """
+        if chunk_size is None:
+            chunk_size = self.DEFAULT_UPLOAD_CHUNK_SIZE
+        if isinstance(stream, (bytes, bytearray, memoryview)):
+            stream = io.BytesIO(stream)
+        if hasattr(stream, 'read'):
+            if stream.seekable():
+                media = MediaIoBaseUpload(stream, mime_type, chunksize=chunk_size, resumable=True)
+            else:
+                media = _IterableMediaUpload(iter(lambda: stream.read(chunk_size), b''), mime_type, chunk_size)
+        else:
+            media = _IterableMediaUpload(stream, mime_type, chunk_size)
+
+        request = self.service.files().create(
+            body={'name': file_name, 'parents': [extract_googledrive_id(parent_folder_id)]},
+            media_body=media, fields='id, name', supportsAllDrives=True
+        )
+
+        def next_chunk():
+            # 업로드 세션 시작 요청에서만 쓰기 토큰을 사용하고, 계정이 바뀐 경우 현재 계정의 http 사용
+            if request.resumable_uri is None:
+                request.http = self._before_execute(request) or self.http
+            return self._execute_media_chunk(request, lambda http: request.next_chunk(http=http))
+
+        response = None
+        while response is None:
+            _, response = self._run_with_retry(next_chunk, file_name)
+        console_print(f"✅ 파일 '{file_name}' 업로드 완료 - ID: {response.get('id')}")
+        return response.get('id')
+
+    def download_stream(self, file_id, buffer=None, mime_type=None, chunk_size=None):
+        """
+        드라이브 파일을 디스크에 쓰지 않고 버퍼(쓰기 가능한 파일 객체)에 청크 단위로 받습니다.
+        청크마다 retry_policy에 따라 재시도하며, 이미 받은 청크는 다시 받지 않습니다.
+
+        Args:
+            file_id (str): 파일 ID 또는 URL
+            buffer (file-like, optional): 받은 내용을 쓸 객체. 현재 위치부터 쓰며 기존 내용은 지우지 않음. 기본값은 None (새 io.BytesIO 사용)
+            mime_type (str, optional): 구글 문서 형식 파일을 내보낼 MIME 타입 (예: 'text/csv'). 기본값은 None (원본 그대로 받음)
+            chunk_size (int, optional): 요청 한 번에 받을 바이트 수. 기본값은 None (DEFAULT_DOWNLOAD_CHUNK_SIZE 사용)
+
+        Returns:
+            file-like: 내용을 쓴 buffer (새로 만든 io.BytesIO는 처음 위치로 되돌려 반환)
+        """
+        file_id = extract_googledrive_id(file_id)
+        if chunk_size is None:
+            chunk_size = self.DEFAULT_DOWNLOAD_CHUNK_SIZE
+        created = buffer is None
+        if created:
+            buffer = io.BytesIO()
+
+        if mime_type is None:
+            request = self.service.files().get_media(fileId=file_id, supportsAllDrives=True)
+        else:
+            request = self.service.files().export_media(fileId=file_id, mimeType=mime_type)
+        offset = 0
+        done = False
+        while not done:
+            offset, done = self._run_with_retry(lambda: self._download_chunk(request, buffer, chunk_size, offset), file_id)
+        if created:
+            buffer.seek(0)
+        return buffer
+
+    def upload_dataframe(self, df, file_name, parent_folder_id, file_format='csv', chunk_size=None, rows_per_chunk=100000, **write_kwargs):
+        """
+        데이터프레임을 임시 파일 없이 드라이브 파일로 업로드합니다.
+        CSV는 rows_per_chunk행씩 변환하면서 바로 보내므로 전체 CSV 문자열을 메모리에 만들지 않고,
+        그 외 형식은 메모리 버퍼 하나에 쓴 뒤 그 버퍼에서 바로 업로드합니다.
+
+        Args:
+            df (pd.DataFrame): 업로드할 데이터프레임
+            file_name (str): 드라이브에 만들 파일 이름
+            parent_folder_id (str): 상위 폴더 ID 또는 URL
+            file_format (str, optional): 'csv' 또는 DataFrame.to_<format>을 지원하는 형식 (예: 'parquet', 'feather', 'excel'). 기본값은 'csv'
+            chunk_size (int, optional): 요청 한 번에 올릴 바이트 수 (256KB의 배수). 기본값은 None (DEFAULT_UPLOAD_CHUNK_SIZE 사용)
+            rows_per_chunk (int, optional): CSV로 한 번에 변환할 행 수. 기본값은 100000
+            **write_kwargs: DataFrame.to_<format>에 전달할 인자 (CSV는 기본값 index=False)
+
+        Returns:
+            str: 업로드된 파일의 ID
+        """
+        mime_type = DATAFRAME_MIME_TYPES.get(file_format, 'application/octet-stream')
+        if file_format == 'csv':
+            write_kwargs.setdefault('index', False)
+            header = write_kwargs.pop('header', True)
+
+            def csv_chunks():
+                for start in range(0, max(len(df), 1), rows_per_chunk):
+                    yield df.iloc[start:start + rows_per_chunk].to_csv(header=header if start == 0 else False, **write_kwargs).encode('utf-8')
+
+            return self.upload_stream(csv_chunks(), file_name, parent_folder_id, mime_type=mime_type, chunk_size=chunk_size)
+
+        buffer = io.BytesIO()
+        getattr(df, f'to_{file_format}')(buffer, **write_kwargs)
+        buffer.seek(0)
+        return self.upload_stream(buffer, file_name, parent_folder_id, mime_type=mime_type, chunk_size=chunk_size)
+
+    def read_dataframe(self, file_id, file_format='csv', mime_type=None, chunk_size=None, **read_kwargs):
+        """
+        드라이브 파일을 디스크에 쓰지 않고 메모리 버퍼로 받아 pandas.read_<format>으로 읽습니다.
+
+        Args:
+            file_id (str): 파일 ID 또는 URL
+            file_format (str, optional): pandas.read_<format>의 형식 (예: 'csv', 'parquet', 'feather', 'excel', 'json'). 기본값은 'csv'
+            mime_type (str, optional): 구글 문서 형식 파일을 내보낼 MIME 타입 (예: 구글 시트는 'text/csv'). 기본값은 None (원본 그대로 받음)
+            chunk_size (int, optional): 요청 한 번에 받을 바이트 수. 기본값은 None (DEFAULT_DOWNLOAD_CHUNK_SIZE 사용)
+            **read_kwargs: pandas.read_<format>에 전달할 인자
+
+        Returns:
+            pd.DataFrame: 읽은 데이터프레임
+        """
+        buffer = self.download_stream(file_id, mime_type=mime_type, chunk_size=chunk_size)
+        return getattr(pd, f'read_{file_format}')(buffer, **read_kwargs)
+
+    def upload_files(self, paths, parent_folder_id, max_workers=4, chunk_size=None, skip_existing=True, base_dir=None, session_file=None):
+        """
+        여러 파일을 병렬로 업로드합니다.
+        업로드 세션 URI를 session_file에 저장하므로, 프로세스가 중단된 뒤 같은 파일을 다시 올리면 받은 위치부터 이어서 업로드합니다.
+
+        Args:
+            paths (iterable): 업로드할 로컬 파일 경로 목록
+            parent_folder_id (str): 상위 폴더 ID 또는 URL
+            max_workers (int, optional): 동시에 업로드할 파일 수. 기본값은 4
+            chunk_size (int, optional): 요청 한 번에 올릴 바이트 수 (256KB의 배수). 기본값은 None (DEFAULT_UPLOAD_CHUNK_SIZE 사용)
+            skip_existing (bool, optional): True이면 대상 폴더에 이름과 md5가 같은 파일이 이미 있을 때 건너뜀. 기본값은 True
+            base_dir (str, optional): 지정하면 base_dir 기준 하위 폴더 구조를 parent_folder_id 아래에 만들고 그 위치에 업로드.
+                기본값은 None (모든 파일을 parent_folder_id에 바로 업로드). base_dir 밖의 파일이 있으면 ValueError 발생
+            session_file (str, optional): 업로드 세션 URI를 저장할 파일 경로. 기본값은 None (DEFAULT_UPLOAD_SESSION_FILE 사용)
+
+        Returns:
+            dict: 업로드 결과 요약
+                - uploaded (int): 업로드한 파일 수
+                - skipped (int): 이미 있어 건너뛴 파일 수
+                - failed (list): 실패한 파일 경로 리스트
+                - file_ids (dict): {로컬 경로: 드라이브 파일 ID} (건너뛴 파일은 기존 파일 ID)
+                - bytes (int): 업로드한 바이트 수
+                - elapsed (float): 소요 시간(초)
+                - bytes_per_second (float): 평균 처리량
+
+        * example: 폴더 구조를 유지하며 CSV 업로드\n
+            summary = drive_manager.upload_files(
+                glob.glob('exports/**/*.csv', recursive=True),
+                parent_folder_id='폴더_ID',
+                base_dir='exports',
+                max_workers=8
+            )
+        """
+        parent_folder_id = extract_googledrive_id(parent_folder_id)
+        if chunk_size is None:
+            chunk_size = self.DEFAULT_UPLOAD_CHUNK_SIZE
+        sessions = _UploadSessionStore(session_file or self.DEFAULT_UPLOAD_SESSION_FILE)
+        start_time = time.time()
+
+        # 업로드할 폴더 구조를 먼저 한 번에 생성
+        targets = []
+        folder_ids = {'': parent_folder_id}
+        for path in paths:
+            relative_dir = ''
+            if base_dir is not None:
+                relative_dir = os.path.dirname(os.path.relpath(path, base_dir)).replace(os.sep, '/')
+                if '..' in relative_dir.split('/'):
+                    raise ValueError(f"⚠️ upload_files | base_dir 밖에 있는 파일입니다: {path} (base_dir: {base_dir})")
+            targets.append((path, relative_dir))
+        relative_dirs = set()
+        for _, relative_dir in targets:
+            while relative_dir and relative_dir not in relative_dirs:
+                relative_dirs.add(relative_dir)
+                relative_dir = relative_dir.rpartition('/')[0]
+        # 깊이별로 같은 상위 폴더의 하위 폴더를 묶어 ensure_folders 한 번으로 확인/생성
+        for depth in sorted({relative_dir.count('/') for relative_dir in relative_dirs}):
+            children = {}
+            for relative_dir in relative_dirs:
+                if relative_dir.count('/') == depth:
+                    parent_dir, _, folder_name = relative_dir.rpartition('/')
+                    children.setdefault(parent_dir, []).append(folder_name)
+            for parent_dir, folder_names in children.items():
+                if folder_ids.get(parent_dir) is None:
+                    continue
+                for folder_name, folder_id in self.ensure_folders(folder_names, folder_ids[parent_dir]).items():
+                    folder_ids[_join_drive_path(parent_dir, folder_name)] = folder_id
+
+        # 대상 폴더별 기존 파일 {이름: [(md5, ID), ...]}
+        existing = {}
+        if skip_existing:
+            for folder_id in set(folder_ids.values()) - {None}:
+                existing[folder_id] = {}
+                for file in self.iter_files(folder_id, fields='id, name, md5Checksum', query='trashed=false'):
+                    existing[folder_id].setdefault(file['name'], []).append((file.get('md5Checksum'), file['id']))
+
+        summary = {'uploaded': 0, 'skipped': 0, 'failed': [], 'file_ids': {}, 'bytes': 0}
+        summary_lock = threading.Lock()
+
+        def upload(path, folder_id):
+            try:
+                matches = existing.get(folder_id, {}).get(os.path.basename(path))
+                if matches:
+                    md5 = _file_md5(path)
+                    file_id = next((file_id for checksum, file_id in matches if checksum == md5), None)
+                    if file_id is not None:
+                        with summary_lock:
+                            summary['skipped'] += 1
+                            summary['file_ids'][path] = file_id
+                        return
+                file = self._upload_with_session(path, folder_id, chunk_size, sessions)
+            except Exception as e:
+                console_print(f"⚠️ upload_files | 파일 업로드 실패: {path} - {e}")
+                with summary_lock:
+                    summary['failed'].append(path)
+                return
+            with summary_lock:
+                summary['uploaded'] += 1
+                summary['file_ids'][path] = file['id']
+                summary['bytes'] += os.path.getsize(path)
+                if summary['uploaded'] % DOWNLOAD_PROGRESS_INTERVAL == 0:
+                    elapsed = time.time() - start_time
+                    console_print(f"📤 {summary['uploaded']}개 업로드 ({summary['bytes'] / 1024 ** 2:,.1f} MB, {summary['bytes'] / 1024 ** 2 / max(elapsed, 1e-9):,.1f} MB/s)")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for path, relative_dir in targets:
+                if folder_ids.get(relative_dir) is None:
+                    console_print(f"⚠️ upload_files | 상위 폴더를 만들지 못해 건너뜁니다: {path}")
+                    with summary_lock:
+                        summary['failed'].append(path)
+                    continue
+                executor.submit(upload, path, folder_ids[relative_dir])
+
+        summary['elapsed'] = time.time() - start_time
+        summary['bytes_per_second'] = summary['bytes'] / summary['elapsed'] if summary['elapsed'] > 0 else 0.0
+        console_print(
+            f"✅ Done: {summary['uploaded']}개의 파일 업로드 완료 (건너뜀: {summary['skipped']}, 실패: {len(summary['failed'])}) "
+            f"- {summary['bytes'] / 1024 ** 2:,.1f} MB, {summary['elapsed']:.1f}초, {summary['bytes_per_second'] / 1024 ** 2:,.1f} MB/s"
+        )
+        return summary
+
+    def _upload_with_session(self, file_path, parent_folder_id, chunk_size, sessions):
+        """
+        파일 하나를 재개 가능 업로드로 올립니다. (upload_file, upload_files의 작업 단위)
+        세션 URI를 sessions에 저장해 두고, 재시도하거나 다시 호출하면 서버에 받은 위치를 물어본 뒤 그 위치부터 이어서 올립니다.
+
+        Returns:
+            dict: 업로드된 파일 정보 (id, name)
+        """
+        stat = os.stat(file_path)
+        key = f"{os.path.abspath(file_path)}|{parent_folder_id}"
+        fingerprint = [stat.st_size, stat.st_mtime]
+
+        def upload():
+            media = MediaFileUpload(file_path, chunksize=chunk_size, resumable=True)
+            request = self.service.files().create(
+                body={'name': os.path.basename(file_path), 'parents': [parent_folder_id]},
+                media_body=media, fields='id, name', supportsAllDrives=True
+            )
+            session = sessions.get(key)
+            resumed = session is not None and session['fingerprint'] == fingerprint
+            response = None
+            try:
+                if resumed:
+                    # 서버에 받은 위치를 물어본 뒤 그 위치부터 이어서 올림
+                    response = self._query_upload_session(request, session['uri'], stat.st_size)
+                while response is None:
+                    if request.resumable_uri is None:
+                        http = self._before_execute(request)
+                        if http is not None:
+                            request.http = http
+                    _, response = self._execute_media_chunk(request, lambda http: request.next_chunk(http=http))
+                    if not resumed and request.resumable_uri is not None:
+                        sessions.set(key, {'uri': request.resumable_uri, 'fingerprint': fingerprint})
+                        resumed = True
+            except HttpError as error:
+                # 만료되었거나 잘못된 세션은 버리고 다음 시도에서 새 세션으로 업로드
+                if error.resp.status in (404, 410):
+                    sessions.pop(key)
+                    raise ConnectionError(f"업로드 세션이 만료되어 새로 시작합니다: {file_path}") from error
+                raise
+            sessions.pop(key)
+            return response
+
+        return self._run_with_retry(upload, os.path.basename(file_path))
+
+    def _query_upload_session(self, request, session_uri, size):
+        """
+        재개 가능 업로드 세션에 서버가 받은 위치를 물어봅니다. (빈 본문 PUT, 'Content-Range: bytes */<크기>')
+        request의 resumable_uri와 resumable_progress를 서버가 받은 위치로 맞춥니다.
+
+        Returns:
+            dict: 이미 업로드가 끝난 세션이면 업로드된 파일 정보, 이어서 올려야 하면 None
+        """
+        response, content = request.http.request(
+            session_uri, 'PUT', body='',
+            headers={'Content-Length': '0', 'Content-Range': f'bytes */{size}'}
+        )
+        if response.status in (200, 201):
+            return request.postproc(response, content)
+        if response.status != 308:
+            raise HttpError(response, content, uri=session_uri)
+        # 308 응답의 Range 헤더('bytes=0-<마지막 바이트>')가 없으면 아직 받은 바이트가 없음
+        received = response.get('range')
+        request.resumable_uri = response.get('location', session_uri)
+        request.resumable_progress = int(received.rpartition('-')[2]) + 1 if received else 0
+        return None
@@ -0,0 +1,187 @@
+import builtins
+import bisect
+import logging
+import threading
+
+# 시간(초) 히스토그램의 기본 구간 상한
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_verbose = True
+
+
+def set_verbose(enabled):
+    """
+    라이브러리의 콘솔 출력(요청 완료, 재시도, 계정 전환 메시지 등)을 켜거나 끕니다.
+
+    Args:
+        enabled (bool): False이면 출력하지 않음
+    """
+    global _verbose
+    _verbose = bool(enabled)
+
+
+def console_print(*args, **kwargs):
+    """set_verbose(False)로 끈 경우 출력하지 않는 print"""
+    if _verbose:
+        builtins.print(*args, **kwargs)
+
+
+class MetricsSink:
+    """
+    매니저의 계측 값을 받는 싱크의 기본 클래스
+    observe(히스토그램 값), increment(카운터 증가)를 재정의한 하위 클래스를 매니저의 metrics_sinks로 지정합니다.
+
+    매니저가 기록하는 지표:
+        google_api_request_duration_seconds (히스토그램): HTTP 요청 1회 소요 시간 {endpoint, method, status, account}
+        google_api_request_bytes_total, google_api_response_bytes_total (카운터): 요청/응답 본문 크기 {endpoint}
+        google_api_call_duration_seconds (히스토그램): 재시도를 포함한 호출 전체 소요 시간 {name, outcome}
+        google_api_retries_total (카운터): 재시도 횟수 {name, action, status}
+        google_api_account_rotations_total (카운터): 서비스 계정 전환 횟수 {reason}
+        google_api_quota_wait_seconds (히스토그램): 요청 허용량(토큰) 대기 시간 {kind}
+    """
+
+    def observe(self, name, value, labels):
+        """
+        히스토그램 값을 기록합니다.
+
+        Args:
+            name (str): 지표 이름
+            value (float): 값
+            labels (dict): 레이블
+        """
+
+    def increment(self, name, value, labels):
+        """
+        카운터를 증가시킵니다.
+
+        Args:
+            name (str): 지표 이름
+            value (float): 증가량
+            labels (dict): 레이블
+        """
+
+
+class InMemoryMetricsSink(MetricsSink):
+    """지표를 메모리에 집계하고 snapshot() 또는 Prometheus 텍스트 형식(to_prometheus())으로 제공하는 싱크"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        """
+        메모리 싱크 초기화
+
+        Args:
+            buckets (tuple, optional): 히스토그램 구간 상한 (오름차순). 기본값은 DEFAULT_BUCKETS
+        """
+        self.buckets = tuple(buckets)
+        self._histograms = {}  # {(이름, 레이블 튜플): {'counts': [...], 'sum': 합계, 'count': 개수}}
+        self._counters = {}    # {(이름, 레이블 튜플): 값}
+        self._lock = threading.Lock()
+
+    def observe(self, name, value, labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = {'counts': [0] * (len(self.buckets) + 1), 'sum': 0.0, 'count': 0}
+            histogram['counts'][bisect.bisect_left(self.buckets, value)] += 1
+            histogram['sum'] += value
+            histogram['count'] += 1
+
+    def increment(self, name, value, labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def snapshot(self):
+        """
+        현재까지 집계한 지표를 반환합니다.
+
+        Returns:
+            dict: {'histograms': [{'name', 'labels', 'count', 'sum', 'buckets': {상한: 누적 개수}}, ...],
+                   'counters': [{'name', 'labels', 'value'}, ...]}
+        """
+        with self._lock:
+            histograms = [
+                {
+                    'name': name,
+                    'labels': dict(labels),
+                    'count': histogram['count'],
+                    'sum': histogram['sum'],
+                    'buckets': dict(zip(self.buckets + (float('inf'),), _cumulative(histogram['counts']))),
+                }
+                for (name, labels), histogram in self._histograms.items()
+            ]
+            counters = [{'name': name, 'labels': dict(labels), 'value': value} for (name, labels), value in self._counters.items()]
+        return {'histograms': histograms, 'counters': counters}
+
+    def reset(self):
+        """집계한 지표를 모두 지웁니다."""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def to_prometheus(self):
+        """
+        집계한 지표를 Prometheus 텍스트 형식으로 반환합니다.
+
+        Returns:
+            str: Prometheus text exposition format 문자열
+        """
+        snapshot = self.snapshot()
+        lines = []
+        for name in sorted({histogram['name'] for histogram in snapshot['histograms']}):
+            lines.append(f"# TYPE {name} histogram")
+            for histogram in snapshot['histograms']:
+                if histogram['name'] != name:
+                    continue
+                for upper, count in histogram['buckets'].items():
+                    le = '+Inf' if upper == float('inf') else repr(float(upper))
+                    lines.append(f"{name}_bucket{_format_labels(dict(histogram['labels'], le=le))} {count}")
+                lines.append(f"{name}_sum{_format_labels(histogram['labels'])} {histogram['sum']}")
+                lines.append(f"{name}_count{_format_labels(histogram['labels'])} {histogram['count']}")
+        for name in sorted({counter['name'] for counter in snapshot['counters']}):
+            lines.append(f"# TYPE {name} counter")
+            for counter in snapshot['counters']:
+                if counter['name'] == name:
+                    lines.append(f"{name}{_format_labels(counter['labels'])} {counter['value']}")
+        return '\n'.join(lines) + '\n'
+
+
+class LoggingMetricsSink(MetricsSink):
+    """지표를 기록할 때마다 logging으로 남기는 싱크"""
+
+    def __init__(self, logger=None, level=logging.DEBUG):
+        """
+        로깅 싱크 초기화
+
+        Args:
+            logger (logging.Logger, optional): 사용할 로거. 기본값은 None ('gs_utils.metrics' 로거)
+            level (int, optional): 로그 레벨. 기본값은 logging.DEBUG
+        """
+        self.logger = logger if logger is not None else logging.getLogger('gs_utils.metrics')
+        self.level = level
+
+    def observe(self, name, value, labels):
+        self.logger.log(self.level, "%s%s %.6f", name, _format_labels(labels), value)
+
+    def increment(self, name, value, labels):
+        self.logger.log(self.level, "%s%s +%s", name, _format_labels(labels), value)
+
+
+def _cumulative(counts):
+    total = 0
+    cumulative = []
+    for count in counts:
+        total += count
+        cumulative.append(total)
+    return cumulative
+
+
+def _format_labels(labels):
+    """{'a': 1} -> '{a="1"}' (Prometheus 레이블 형식, 레이블이 없으면 빈 문자열)"""
+    if not labels:
+        return ''
+    escaped = (
+        f'{key}="' + str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"') + '"'
+        for key, value in labels.items()
+    )
+    return '{' + ','.join(escaped) + '}'
@@ -0,0 +1,98 @@
+import time
+import threading
+
+
+class TokenBucket:
+    """분당 허용량만큼 토큰을 일정한 속도로 채우는 토큰 버킷"""
+
+    def __init__(self, rate_per_minute, capacity=None):
+        """
+        토큰 버킷 초기화
+
+        Args:
+            rate_per_minute (float): 분당 채워지는 토큰 수
+            capacity (float, optional): 버킷 최대 토큰 수. 기본값은 None (rate_per_minute와 동일)
+        """
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self, tokens=1):
+        """
+        토큰을 가져옵니다.
+
+        Returns:
+            float: 0이면 토큰 획득 성공, 그 외에는 토큰이 채워질 때까지 기다려야 하는 시간(초)
+        """
+        with self._lock:
+            self._refill()
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return 0.0
+            return (tokens - self.tokens) / self.rate
+
+    def drain(self):
+        """남은 토큰을 모두 비웁니다. (서버에서 허용량 초과 응답을 받은 경우)"""
+        with self._lock:
+            self._refill()
+            self.tokens = 0.0
+
+
+class AccountRateLimiter:
+    """서비스 계정별 읽기/쓰기 토큰 버킷을 관리하고, 토큰이 남은 계정으로 요청을 배정하는 클래스"""
+
+    def __init__(self, account_count, read_per_minute=None, write_per_minute=None):
+        """
+        계정별 토큰 버킷 초기화
+
+        Args:
+            account_count (int): 서비스 계정 수
+            read_per_minute (float, optional): 계정당 분당 읽기 요청 허용량. None이면 제한 없음
+            write_per_minute (float, optional): 계정당 분당 쓰기 요청 허용량. None이면 제한 없음
+        """
+        self.buckets = [
+            {
+                'read': TokenBucket(read_per_minute) if read_per_minute else None,
+                'write': TokenBucket(write_per_minute) if write_per_minute else None,
+            }
+            for _ in range(account_count)
+        ]
+
+    def acquire(self, kind, preferred):
+        """
+        요청 하나에 대한 토큰을 가져옵니다.
+        preferred 계정에 토큰이 있으면 그 계정을, 없으면 토큰이 남은 다른 계정을 사용하고,
+        모든 계정에 토큰이 없으면 가장 먼저 채워지는 시간만큼만 기다립니다.
+
+        Args:
+            kind (str): 'read' 또는 'write'
+            preferred (int): 우선 사용할 계정 인덱스
+
+        Returns:
+            int: 토큰을 가져온 계정 인덱스
+        """
+        order = [preferred] + [index for index in range(len(self.buckets)) if index != preferred]
+        while True:
+            waits = []
+            for index in order:
+                bucket = self.buckets[index][kind]
+                if bucket is None:
+                    return index
+                wait = bucket.try_acquire()
+                if wait == 0:
+                    return index
+                waits.append(wait)
+            time.sleep(min(waits))
+
+    def drain(self, index):
+        """해당 계정의 읽기/쓰기 토큰을 모두 비워 토큰이 다시 채워질 때까지 배정되지 않게 합니다."""
+        for bucket in self.buckets[index].values():
+            if bucket is not None:
+                bucket.drain()
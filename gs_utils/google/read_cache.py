@@ -0,0 +1,149 @@
+import hashlib
+import importlib.util
+import json
+import os
+import threading
+import time
+import pandas as pd
+from .metrics import console_print
+
+# 형식별 (저장 함수, 읽기 함수, 확장자)
+_FORMATS = {
+    'parquet': (lambda df, path: df.to_parquet(path), pd.read_parquet, '.parquet'),
+    'feather': (lambda df, path: df.reset_index(drop=True).to_feather(path), pd.read_feather, '.feather'),
+    'pickle': (lambda df, path: df.to_pickle(path), pd.read_pickle, '.pkl'),
+}
+
+
+class SheetReadCache:
+    """
+    시트 값을 변환한 DataFrame을 디스크에 저장하는 읽기 캐시
+    항목은 (스프레드시트 ID, 시트, 범위, 읽기 옵션)을 키로, 드라이브 파일 버전을 함께 저장하며
+    버전이 같을 때만 캐시를 사용합니다. 전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 지웁니다.
+    """
+
+    INDEX_NAME = 'index.json'
+
+    def __init__(self, cache_dir, max_bytes=512 * 1024 * 1024, file_format='parquet'):
+        """
+        읽기 캐시 초기화
+
+        Args:
+            cache_dir (str): 캐시 파일을 저장할 폴더 경로
+            max_bytes (int, optional): 캐시 파일 전체 크기 상한(바이트). 기본값은 512MB
+            file_format (str, optional): 'parquet', 'feather', 'pickle' 중 하나. 기본값은 'parquet'
+                (parquet/feather는 pyarrow가 필요하며, 없으면 pickle 사용)
+        """
+        if file_format not in _FORMATS:
+            raise ValueError(f"지원하지 않는 캐시 형식입니다: {file_format} (가능한 형식: {', '.join(_FORMATS)})")
+        if file_format in ('parquet', 'feather') and importlib.util.find_spec('pyarrow') is None:
+            console_print(f"⚠️ SheetReadCache | pyarrow가 설치되어 있지 않아 '{file_format}' 대신 'pickle' 형식으로 저장합니다.")
+            file_format = 'pickle'
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.file_format = file_format
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self._index_path = os.path.join(cache_dir, self.INDEX_NAME)
+        try:
+            with open(self._index_path, encoding='utf-8') as f:
+                self._index = json.load(f)
+        except (OSError, ValueError):
+            self._index = {}
+
+    @staticmethod
+    def make_key(*parts):
+        """키 구성 요소로 캐시 항목 이름(해시)을 만듭니다."""
+        return hashlib.sha1(json.dumps(parts, ensure_ascii=False, default=str).encode('utf-8')).hexdigest()
+
+    def get(self, key, version):
+        """
+        버전이 같은 캐시 항목이 있으면 DataFrame을, 없거나 버전이 다르면 None을 반환합니다.
+
+        Args:
+            key (str): make_key로 만든 항목 이름
+            version (str): 현재 드라이브 파일 버전
+        """
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None or entry['version'] != version:
+                self.misses += 1
+                return None
+            path = os.path.join(self.cache_dir, entry['file'])
+            try:
+                df = _FORMATS[entry['format']][1](path)
+            except Exception as e:
+                console_print(f"⚠️ SheetReadCache | 캐시 파일을 읽을 수 없어 삭제합니다: {entry['file']} - {e}")
+                self._remove(key)
+                self._save_index()
+                self.misses += 1
+                return None
+            entry['last_used'] = time.time()
+            self._save_index()
+            self.hits += 1
+            return df
+
+    def put(self, key, version, df):
+        """
+        DataFrame을 캐시에 저장하고 크기 상한을 넘으면 오래된 항목을 지웁니다.
+        선택한 형식으로 저장할 수 없는 DataFrame(여러 타입이 섞인 열 등)은 pickle로 저장합니다.
+
+        Args:
+            key (str): make_key로 만든 항목 이름
+            version (str): 현재 드라이브 파일 버전
+            df (pd.DataFrame): 저장할 데이터프레임
+        """
+        with self._lock:
+            self._remove(key)
+            for file_format in dict.fromkeys([self.file_format, 'pickle']):
+                writer, _, extension = _FORMATS[file_format]
+                file_name = key + extension
+                path = os.path.join(self.cache_dir, file_name)
+                try:
+                    writer(df, path)
+                    break
+                except Exception:
+                    if os.path.exists(path):
+                        os.remove(path)
+            else:
+                return
+            self._index[key] = {
+                'version': version,
+                'file': file_name,
+                'format': file_format,
+                'size': os.path.getsize(path),
+                'last_used': time.time(),
+            }
+            self._evict()
+            self._save_index()
+
+    def clear(self):
+        """캐시 항목을 모두 지웁니다."""
+        with self._lock:
+            for key in list(self._index):
+                self._remove(key)
+            self._save_index()
+
+    def _evict(self):
+        total = sum(entry['size'] for entry in self._index.values())
+        for key in sorted(self._index, key=lambda key: self._index[key]['last_used']):
+            if total <= self.max_bytes:
+                break
+            total -= self._index[key]['size']
+            self._remove(key)
+
+    def _remove(self, key):
+        entry = self._index.pop(key, None)
+        if entry is not None:
+            try:
+                os.remove(os.path.join(self.cache_dir, entry['file']))
+            except OSError:
+                pass
+
+    def _save_index(self):
+        temp_path = f"{self._index_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f)
+        os.replace(temp_path, self._index_path)
@@ -0,0 +1,105 @@
+from googleapiclient.errors import HttpError
+from google.auth.exceptions import RefreshError, TransportError
+from email.utils import parsedate_to_datetime
+import datetime
+import random
+import socket
+import ssl
+import httplib2
+
+
+class RetryError(RuntimeError):
+    """재시도 횟수 또는 제한 시간을 초과하여 요청이 최종 실패한 경우 발생하는 예외"""
+
+
+class AmbiguousRequestError(RuntimeError):
+    """멱등이 아닌 요청이 서버/네트워크 오류로 실패하여 적용 여부를 알 수 없어 재시도하지 않은 경우의 예외 (원인은 __cause__)"""
+
+
+class RetryPolicy:
+    """
+    API 요청 실패 시 재시도 여부와 대기 시간을 결정하는 정책
+    classify, get_delay를 재정의한 하위 클래스를 매니저의 retry_policy로 지정하여 동작을 바꿀 수 있습니다.
+    """
+
+    ROTATE = 'rotate'  # 다른 서비스 계정으로 전환 후 재시도 (허용량 초과, 인증 오류)
+    RETRY = 'retry'    # 같은 계정으로 재시도 (서버 오류, 네트워크 오류)
+    RAISE = 'raise'    # 재시도하지 않고 바로 예외 발생 (잘못된 요청, 코드 오류)
+
+    ROTATE_STATUSES = (401, 403, 429)
+    RETRY_STATUSES = (408, 500, 502, 503, 504)
+    RETRY_EXCEPTIONS = (TimeoutError, socket.timeout, ConnectionError, ssl.SSLError, httplib2.HttpLib2Error, TransportError)
+
+    def __init__(self, max_attempts=None, base_delay=1.0, max_delay=60.0, deadline=600):
+        """
+        재시도 정책 초기화
+
+        Args:
+            max_attempts (int, optional): 최대 시도 횟수. 기본값은 None (매니저의 max_attempts 사용)
+            base_delay (float, optional): 지수 백오프 기본 대기 시간(초). 기본값은 1.0
+            max_delay (float, optional): 한 번에 대기할 최대 시간(초). 기본값은 60.0
+            deadline (float, optional): 한 번의 호출에 허용하는 전체 시간(초). None이면 제한 없음. 기본값은 600
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+
+    def classify(self, error):
+        """
+        오류를 재시도 방식으로 분류합니다.
+
+        Args:
+            error (Exception): 발생한 예외
+
+        Returns:
+            str: RetryPolicy.ROTATE, RetryPolicy.RETRY, RetryPolicy.RAISE 중 하나
+        """
+        if isinstance(error, HttpError):
+            if error.resp.status in self.ROTATE_STATUSES:
+                return self.ROTATE
+            if error.resp.status in self.RETRY_STATUSES:
+                return self.RETRY
+            return self.RAISE
+        if isinstance(error, RefreshError):
+            return self.ROTATE
+        if isinstance(error, self.RETRY_EXCEPTIONS):
+            return self.RETRY
+        return self.RAISE
+
+    def get_delay(self, retry_number, error=None):
+        """
+        다음 시도 전 대기 시간을 계산합니다.
+        Retry-After 헤더가 있으면 그 값을, 없으면 full jitter 지수 백오프 값을 사용합니다.
+
+        Args:
+            retry_number (int): 0부터 시작하는 재시도 순번
+            error (Exception, optional): 발생한 예외
+
+        Returns:
+            float: 대기 시간(초)
+        """
+        retry_after = _parse_retry_after(error)
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** retry_number)))
+
+
+def _parse_retry_after(error):
+    """HttpError 응답의 Retry-After 헤더(초 또는 HTTP 날짜)를 초 단위로 변환합니다. 없으면 None을 반환합니다."""
+    if not isinstance(error, HttpError):
+        return None
+    value = error.resp.get('retry-after')
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+    return max((retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds(), 0.0)
@@ -1,15 +1,504 @@
 import pandas as pd
+import numpy as np
+import time
 import datetime
 import decimal
 import inspect
-from collections import Counter
+import re
+import threading
+import json
+import hashlib
+import urllib.parse
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from googleapiclient.errors import HttpError
+from .read_cache import SheetReadCache
+from .retry_policy import RetryPolicy
 from .base_manager import (
     GoogleBaseManager, 
     retry_on_error, 
     extract_spreadsheet_id, 
     convert_sheetid_to_url, 
-    convert_to_number
+    convert_to_number,
+    convert_column_to_number
 )
+from .metrics import console_print
+
+def _split_cell_name(cell_name):
+    """
+    'B3' 형태의 셀 이름을 열 문자와 행 번호로 분리합니다. (예: 'B3' -> ('B', 3))
+    """
+    match = re.fullmatch(r'([A-Za-z]+)([0-9]*)', cell_name)
+    if match is None:
+        raise ValueError(f"⚠️ 잘못된 셀 이름입니다: {cell_name}")
+    return match.group(1).upper(), int(match.group(2) or 1)
+
+def _column_index(column_letter):
+    """
+    열 문자를 0부터 시작하는 열 번호로 변환합니다. (예: 'A' -> 0, 'AA' -> 26)
+    """
+    index = 0
+    for char in column_letter:
+        index = index * 26 + (ord(char) - ord('A') + 1)
+    return index - 1
+
+def _column_letter(column_index):
+    """
+    0부터 시작하는 열 번호를 열 문자로 변환합니다. (예: 0 -> 'A', 26 -> 'AA')
+    """
+    letters = ''
+    column_index += 1
+    while column_index:
+        column_index, remainder = divmod(column_index - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+def _sheet_grid_range(sheet, grid_range=None):
+    """
+    시트 속성으로 sheetId를 포함한 GridRange를 만듭니다. (grid_range가 없으면 시트의 실제 그리드 전체)
+    """
+    if grid_range is None:
+        grid = sheet.get('gridProperties', {})
+        grid_range = {
+            'startRowIndex': 0,
+            'endRowIndex': grid.get('rowCount', 0),
+            'startColumnIndex': 0,
+            'endColumnIndex': grid.get('columnCount', 0)
+        }
+    return dict(grid_range, sheetId=sheet['sheetId'])
+
+def _blocks_overlap(first, second):
+    """
+    두 값 범위({'row', 'column', 'width', 'values'})가 겹치는지 확인합니다.
+    """
+    return (first['row'] < second['row'] + len(second['values']) and second['row'] < first['row'] + len(first['values'])
+            and first['column'] < second['column'] + second['width'] and second['column'] < first['column'] + first['width'])
+
+def _encode_value(value):
+    """
+    여러 타입이 섞인 object 열의 값 하나를 JSON으로 보낼 수 있는 값으로 변환합니다.
+    """
+    if isinstance(value, np.datetime64):
+        return str(pd.Timestamp(value))
+    if isinstance(value, (datetime.date, datetime.time, datetime.timedelta)):
+        return str(value)
+    if isinstance(value, decimal.Decimal):
+        return float(value)
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+def _encode_column(column):
+    """
+    열의 dtype에 따라 열 전체를 한 번에 변환한 값 리스트를 반환합니다. (날짜는 문자열, Decimal은 float, 결측값은 빈 문자열)
+    원소별 검사는 여러 타입이 섞인 object 열에서만 수행합니다.
+    """
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        column = column.astype(object)
+    dtype = column.dtype
+    if (pd.api.types.is_datetime64_any_dtype(dtype) or pd.api.types.is_timedelta64_dtype(dtype)
+            or isinstance(dtype, pd.PeriodDtype)):
+        values = column.astype(str).to_numpy(dtype=object)
+    elif dtype == object:
+        kind = pd.api.types.infer_dtype(column, skipna=True)
+        if kind in ('string', 'empty'):
+            values = column.to_numpy(dtype=object)
+        elif kind in ('date', 'datetime'):
+            values = column.astype(str).to_numpy(dtype=object)
+        elif kind == 'decimal':
+            values = column.astype(float).to_numpy(dtype=object)
+        else:
+            values = np.array([_encode_value(value) for value in column], dtype=object)
+    else:
+        # 숫자/불리언/문자열 dtype은 to_numpy(object)가 파이썬 기본 타입으로 변환
+        values = column.to_numpy(dtype=object)
+
+    missing = column.isna().to_numpy()
+    if missing.any():
+        values = np.where(missing, '', values)
+    return values.tolist()
+
+def _dataframe_to_values(df, header=True):
+    """
+    DataFrame을 헤더를 포함한 2차원 리스트로 변환합니다. (날짜는 문자열, Decimal은 float, 결측값은 빈 문자열)
+    열 단위로 dtype에 맞게 변환한 뒤 행으로 묶습니다.
+
+    Args:
+        df (pd.DataFrame): 변환할 데이터프레임
+        header (bool, optional): False이면 헤더 행을 제외. 기본값은 True
+    """
+    columns = [_encode_column(df.iloc[:, index]) for index in range(df.shape[1])]
+    rows = [df.columns.tolist()] if header else []
+    rows.extend(map(list, zip(*columns)))
+    return rows
+
+def _dataframe_fingerprint(df):
+    """
+    데이터프레임 내용(행 순서 포함)과 컬럼명으로 만든 지문 (같은 내용이면 다른 객체여도 같은 값)
+    """
+    try:
+        row_hashes = pd.util.hash_pandas_object(df, index=False)
+    except TypeError:
+        # 리스트 등 해시할 수 없는 값이 섞인 경우 문자열로 바꿔서 계산
+        row_hashes = pd.util.hash_pandas_object(df.astype(str), index=False)
+    digest = hashlib.sha1(row_hashes.to_numpy().tobytes())
+    digest.update(json.dumps([str(column) for column in df.columns], ensure_ascii=False).encode('utf-8'))
+    return digest.hexdigest(), df.shape
+
+# 스프레드시트 날짜 일련번호의 기준일
+_SHEETS_EPOCH = datetime.datetime(1899, 12, 30)
+_DATE_STRING = re.compile(r'\d{4}-\d{2}-\d{2}(?: \d{2}:\d{2}:\d{2}(?:\.\d+)?)?')
+
+def _user_entered_value(value):
+    """
+    USER_ENTERED로 입력한 값이 시트에 저장되는 값으로 변환합니다.
+    숫자 문자열은 숫자로(convert_to_number), _dataframe_to_values가 만드는 날짜 문자열은 날짜 일련번호로 바꿉니다.
+    """
+    if not isinstance(value, str):
+        return value
+    if _DATE_STRING.fullmatch(value):
+        try:
+            delta = datetime.datetime.fromisoformat(value) - _SHEETS_EPOCH
+        except ValueError:
+            return value
+        return delta.days + (delta.seconds + delta.microseconds / 1e6) / 86400
+    return convert_to_number(value)
+
+def _cell_hash(value):
+    """
+    시트 값 비교용 셀 해시 (1과 1.0, None과 빈 문자열을 같은 값으로 취급)
+    시트에서 읽은 값과 보낼 값 모두 _user_entered_value로 바꾼 뒤 비교하므로 숫자/날짜 문자열도 저장된 값과 같게 취급합니다.
+    """
+    if hasattr(value, 'item'):
+        value = value.item()
+    value = _user_entered_value(value)
+    if value is None:
+        value = ''
+    elif isinstance(value, float) and value.is_integer():
+        value = int(value)
+    # 타입을 함께 해시하여 0과 빈 문자열, 1과 True 등을 구분
+    return hash((type(value), value))
+
+def _row_hashes(values, width):
+    """
+    각 행을 width 열로 맞춘 셀 해시 튜플 리스트를 반환합니다. (빈 셀은 빈 문자열로 취급)
+    """
+    empty = _cell_hash('')
+    return [tuple(_cell_hash(value) for value in row[:width]) + (empty,) * (width - len(row)) for row in values]
+
+def _unique_headers(headers):
+    """
+    중복된 컬럼명에 '_1', '_2' 등을 붙여 유니크하게 만들고, 중복이 있으면 경고 메시지를 출력합니다.
+    """
+    header_counts = Counter(headers)
+    unique_headers = []
+    header_seen = {}
+    for h in headers:
+        if header_counts[h] > 1:
+            header_seen[h] = header_seen.get(h, 0) + 1
+            unique_headers.append(f"{h}_{header_seen[h]}")
+        else:
+            unique_headers.append(h)
+
+    # 중복된 컬럼명이 있을 경우 경고 메시지 출력
+    if any(count > 1 for count in header_counts.values()):
+        duplicate_headers = [h for h in header_counts if header_counts[h] > 1]
+        console_print(f"⚠️ 중복된 컬럼명 발견: {', '.join(duplicate_headers)} (총 {len(duplicate_headers)}개 중복됨)")
+    return unique_headers
+
+def _align_dtypes(df, dtypes):
+    """
+    df의 열 타입을 dtypes({컬럼명: dtype})에 맞춥니다. 변환할 수 없는 열은 그대로 두고 컬럼명 리스트로 반환합니다.
+    """
+    mismatched = []
+    for column, dtype in dtypes.items():
+        if df[column].dtype == dtype:
+            continue
+        try:
+            df[column] = df[column].astype(dtype)
+        except (ValueError, TypeError):
+            mismatched.append(column)
+    return mismatched
+
+def _values_to_dataframe(values, skip_rows=0, columnar=False, sheet_name=None, spreadsheet_url=None):
+    """
+    values().get 응답의 2차원 리스트를 DataFrame으로 변환합니다.
+    중복 컬럼명은 '_1', '_2' 등을 붙여 유니크하게 만들고, 각 행의 길이를 헤더에 맞게 조정합니다.
+
+    Args:
+        values (list): 시트 값 2차원 리스트 (헤더 포함)
+        skip_rows (int, optional): 헤더 앞에서 건너뛸 행 수 (기본값: 0)
+        columnar (bool, optional): True이면 행을 한 번에 전치한 뒤 열 단위 벡터화 연산으로 숫자 변환 (기본값: False)
+        sheet_name (str, optional): 경고 메시지에 표시할 시트 이름
+        spreadsheet_url (str, optional): 경고 메시지에 표시할 스프레드시트 URL
+
+    Returns:
+        pandas.DataFrame: 변환된 데이터프레임
+    """
+    # 첫 행을 컬럼명으로 사용
+    unique_headers = _unique_headers(values[skip_rows])
+
+    data = values[skip_rows+1:]
+
+    # 각 행의 길이를 헤더에 맞게 조정
+    header_len = len(unique_headers)
+    max_row_len = max([len(row) for row in data])
+    is_mismatched = max_row_len != header_len
+    if is_mismatched:
+        console_print(f"⚠️ {inspect.currentframe().f_code.co_name} | 데이터와 컬럼명의 열 개수 상이 - sheet_name: {sheet_name}, URL: {spreadsheet_url}")
+
+    if columnar:
+        # 행 길이를 맞춘 뒤 한 번에 전치하여 열 단위로 변환
+        # (열 개수가 같을 때 짧은 행의 빈 칸은 기존 방식과 동일하게 None으로 채움)
+        fill_value = '' if is_mismatched else None
+        padded = [row[:header_len] if len(row) >= header_len else row + [fill_value] * (header_len - len(row)) for row in data]
+        columns = zip(*padded) if padded else [()] * header_len
+        df = pd.DataFrame({i: convert_column_to_number(column) for i, column in enumerate(columns)})
+        df.columns = unique_headers
+        return df
+
+    fixed_data = []
+    if is_mismatched:
+        for row in data:
+            # 부족하면 빈 문자열로 채우기
+            if len(row) < header_len:
+                row = row + [''] * (header_len - len(row))
+            # 넘치면 자르기
+            elif len(row) > header_len:
+                row = row[:header_len]
+            fixed_data.append([convert_to_number(cell) for cell in row])
+    else:
+        fixed_data = [[convert_to_number(cell) for cell in row] for row in data]
+
+    # 데이터프레임 생성
+    return pd.DataFrame(fixed_data, columns=unique_headers)
+
+def _a1_to_grid_range(a1_range, sheet_id):
+    """
+    'A1:C10', 'A:C', 'A2:Z', 'B3' 형태의 범위를 GridRange로 변환합니다. (범위가 열려 있는 쪽의 인덱스는 생략)
+    """
+    grid_range = {'sheetId': sheet_id}
+    start, _, end = a1_range.partition(':')
+    for cell, bound in ((start, 'start'), (end or start, 'end')):
+        match = re.fullmatch(r'([A-Za-z]*)([0-9]*)', cell)
+        if match is None or not any(match.groups()):
+            raise ValueError(f"⚠️ 잘못된 범위입니다: {a1_range}")
+        column, row = match.groups()
+        if column:
+            grid_range[f'{bound}ColumnIndex'] = _column_index(column.upper()) + (bound == 'end')
+        if row:
+            grid_range[f'{bound}RowIndex'] = int(row) - (bound == 'start')
+    return grid_range
+
+
+class SheetWriteBatch:
+    """
+    한 스프레드시트에 대한 값 쓰기와 batchUpdate 요청을 모아 두었다가 최소한의 API 호출로 전송하는 쓰기 버퍼
+    GoogleSheetManager.batch()로 생성하며, with 블록이 정상 종료되거나 max_cells/max_requests를 넘으면 전송합니다.
+    요청은 추가한 순서대로 적용되도록 같은 종류가 연속된 구간(batchUpdate 요청 / 값 쓰기)마다 한 번씩 호출하고,
+    같은 시트에서 이어지는 값 범위(아래쪽 또는 오른쪽으로 맞닿은 범위)는 하나의 범위로 합칩니다.
+    """
+
+    def __init__(self, manager, spreadsheet_id, value_input_option='USER_ENTERED', max_cells=50000, max_requests=500):
+        """
+        쓰기 버퍼 초기화
+
+        Args:
+            manager (GoogleSheetManager): 요청을 보낼 매니저
+            spreadsheet_id (str): 구글 스프레드시트 ID
+            value_input_option (str, optional): 값 쓰기의 valueInputOption. 기본값은 'USER_ENTERED'
+            max_cells (int, optional): 모아 둔 값 셀 수가 이 값 이상이면 바로 전송. 기본값은 50000
+            max_requests (int, optional): 모아 둔 batchUpdate 요청 수가 이 값 이상이면 바로 전송. 기본값은 500
+        """
+        self.manager = manager
+        self.spreadsheet_id = spreadsheet_id
+        self.value_input_option = value_input_option
+        self.max_cells = max_cells
+        self.max_requests = max_requests
+        self.stats = {'queued': 0, 'api_calls': 0, 'merged_ranges': 0}
+        self._segments = []  # [('requests', [요청, ...]) 또는 ('values', [값 범위, ...]), ...]
+        self._queued_cells = 0
+        self._queued_requests = 0
+        self._added_sheet_ids = {}  # 이 버퍼에서 추가한 시트 {이름: sheetId}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            if self._segments:
+                console_print(f"⚠️ SheetWriteBatch | 블록에서 오류가 발생하여 전송하지 않은 요청 {self._queued_requests}개, 값 {self._queued_cells}셀을 버립니다.")
+            self._segments = []
+            return False
+        self.flush()
+        return False
+
+    def _segment(self, kind):
+        """마지막 구간이 kind이면 그 구간을, 아니면 새 구간을 반환합니다."""
+        if not self._segments or self._segments[-1][0] != kind:
+            self._segments.append((kind, []))
+        return self._segments[-1][1]
+
+    def _sheet_id(self, sheet_name):
+        sheet_id = self._added_sheet_ids.get(sheet_name)
+        if sheet_id is None:
+            sheet_id = self.manager._find_sheet_id(self.spreadsheet_id, sheet_name)
+        if sheet_id is None:
+            sheet_id = self.manager._find_sheet_id(self.spreadsheet_id, sheet_name, refresh=True)
+        if sheet_id is None:
+            raise ValueError(f"⚠️ SheetWriteBatch | 시트 '{sheet_name}'를 찾을 수 없습니다. - ID: {self.spreadsheet_id}")
+        return sheet_id
+
+    def update_values(self, sheet_name, cell_name, values):
+        """
+        cell_name부터 values를 쓰는 요청을 추가합니다. (None인 셀은 기존 값을 유지)
+
+        Args:
+            sheet_name (str): 시트 이름
+            cell_name (str): 시작 셀 (예: 'A1')
+            values (list): 2차원 값 리스트
+        """
+        if not values:
+            return
+        column_letter, row = _split_cell_name(cell_name)
+        block = {'sheet': sheet_name, 'row': row, 'column': _column_index(column_letter), 'values': [list(value_row) for value_row in values]}
+        block['width'] = max(len(value_row) for value_row in block['values'])
+        cell_count = sum(len(value_row) for value_row in block['values'])
+
+        blocks = self._segment('values')
+        last = next((queued for queued in reversed(blocks) if queued['sheet'] == sheet_name), None)
+        if last is not None and last['column'] == block['column'] and last['row'] + len(last['values']) == block['row']:
+            # 바로 아래에 이어지는 범위
+            last['values'].extend(block['values'])
+            last['width'] = max(last['width'], block['width'])
+            self.stats['merged_ranges'] += 1
+        elif last is not None and last['row'] == block['row'] and len(last['values']) == len(block['values']) and last['column'] + last['width'] == block['column']:
+            # 바로 오른쪽에 이어지는 범위 (짧은 행은 None으로 채워 기존 값 유지)
+            for last_row, new_row in zip(last['values'], block['values']):
+                last_row.extend([None] * (last['width'] - len(last_row)) + new_row)
+            last['width'] += block['width']
+            self.stats['merged_ranges'] += 1
+        else:
+            if any(queued['sheet'] == sheet_name and _blocks_overlap(queued, block) for queued in blocks):
+                # 겹치는 범위는 나중에 추가한 값이 적용되도록 다음 호출로 분리
+                self._segments.append(('values', [block]))
+            else:
+                blocks.append(block)
+        self.stats['queued'] += 1
+        self._queued_cells += cell_count
+        if self._queued_cells >= self.max_cells:
+            self.flush()
+
+    def update_dataframe(self, sheet_name, df, cell_name='A1'):
+        """
+        데이터프레임을 헤더와 함께 cell_name부터 쓰는 요청을 추가합니다.
+        """
+        self.update_values(sheet_name, cell_name, _dataframe_to_values(df))
+
+    def add_request(self, request):
+        """
+        spreadsheets.batchUpdate 요청(dict)을 그대로 추가합니다.
+
+        Args:
+            request (dict): batchUpdate 요청 (예: {'repeatCell': {...}})
+        """
+        self._segment('requests').append(request)
+        self.stats['queued'] += 1
+        self._queued_requests += 1
+        if self._queued_requests >= self.max_requests:
+            self.flush()
+
+    def add_sheet(self, sheet_name, row_count=1000, column_count=26):
+        """
+        시트를 추가하는 요청을 추가하고, 미리 정한 sheetId를 반환합니다. (같은 버퍼에서 이 시트 이름으로 이어서 요청 가능)
+        """
+        used_ids = {sheet['sheetId'] for sheet in self.manager._get_sheet_properties(self.spreadsheet_id)} | set(self._added_sheet_ids.values())
+        sheet_id = max(used_ids, default=0) + 1
+        self._added_sheet_ids[sheet_name] = sheet_id
+        self.add_request({
+            'addSheet': {
+                'properties': {
+                    'sheetId': sheet_id,
+                    'title': sheet_name,
+                    'gridProperties': {'rowCount': row_count, 'columnCount': column_count}
+                }
+            }
+        })
+        return sheet_id
+
+    def clear(self, sheet_name, range_name=None):
+        """
+        범위의 값을 지우는 요청을 추가합니다. (서식은 유지)
+
+        Args:
+            sheet_name (str): 시트 이름
+            range_name (str, optional): 지울 범위 (예: 'A2:D'). 기본값은 None (시트 전체)
+        """
+        sheet_id = self._sheet_id(sheet_name)
+        self.add_request({
+            'updateCells': {
+                'range': _a1_to_grid_range(range_name, sheet_id) if range_name else {'sheetId': sheet_id},
+                'fields': 'userEnteredValue'
+            }
+        })
+
+    def copy_paste(self, source_sheet_name, source_range, target_sheet_name, target_range, paste_type='PASTE_NORMAL'):
+        """
+        같은 스프레드시트 안에서 범위를 복사하여 붙여넣는 요청을 추가합니다.
+
+        Args:
+            source_sheet_name (str): 원본 시트 이름
+            source_range (str): 원본 범위 (예: 'A1:D10')
+            target_sheet_name (str): 대상 시트 이름
+            target_range (str): 붙여넣을 범위 또는 시작 셀 (예: 'A1')
+            paste_type (str, optional): copyPaste의 pasteType. 기본값은 'PASTE_NORMAL'
+        """
+        self.add_request({
+            'copyPaste': {
+                'source': _a1_to_grid_range(source_range, self._sheet_id(source_sheet_name)),
+                'destination': _a1_to_grid_range(target_range, self._sheet_id(target_sheet_name)),
+                'pasteType': paste_type
+            }
+        })
+
+    def flush(self):
+        """
+        모아 둔 요청을 추가한 순서대로 전송합니다.
+
+        Returns:
+            list: 호출별 API 응답 리스트
+        """
+        segments, self._segments = self._segments, []
+        self._queued_cells = 0
+        self._queued_requests = 0
+        responses = []
+        spreadsheet_id = self.spreadsheet_id
+        for kind, items in segments:
+            if kind == 'requests':
+                response = self.manager.request_with_retry(
+                    lambda service: service.spreadsheets().batchUpdate(
+                        spreadsheetId=spreadsheet_id, body={'requests': items}
+                    ).execute()
+                )
+                self.manager.invalidate_metadata_cache(spreadsheet_id)
+            else:
+                data = [
+                    {'range': f"{block['sheet']}!{_column_letter(block['column'])}{block['row']}", 'values': block['values']}
+                    for block in items
+                ]
+                response = self.manager.request_with_retry(
+                    lambda service: service.spreadsheets().values().batchUpdate(
+                        spreadsheetId=spreadsheet_id,
+                        body={'valueInputOption': self.value_input_option, 'data': data}
+                    ).execute()
+                )
+            responses.append(response)
+        self._added_sheet_ids = {}
+        if responses:
+            self.stats['api_calls'] += len(responses)
+            console_print(f"📤 배치 전송 완료 (추가한 요청: {self.stats['queued']}개, 합친 범위: {self.stats['merged_ranges']}개, API 호출: {self.stats['api_calls']}회) - ID: {spreadsheet_id}")
+        return responses
+
 
 class GoogleSheetManager(GoogleBaseManager):
     """구글 스프레드시트 관리를 위한 클래스"""
@@ -20,8 +509,13 @@ class GoogleSheetManager(GoogleBaseManager):
     ]
     DEFAULT_SERVICE = 'sheets'
     DEFAULT_VERSION = 'v4'
+    # 서비스 계정당 분당 요청 허용량 (Sheets API: 사용자당 분당 읽기 60회, 쓰기 60회)
+    DEFAULT_READ_QUOTA_PER_MINUTE = 60
+    DEFAULT_WRITE_QUOTA_PER_MINUTE = 60
+    # 읽기 캐시 사용 시 스프레드시트 버전 확인(Drive files.get)에 필요한 스코프
+    DRIVE_METADATA_SCOPE = 'https://www.googleapis.com/auth/drive.metadata.readonly'
     
-    def __init__(self, json_folder = None, scopes = None, version = None, service_name = None):
+    def __init__(self, json_folder = None, scopes = None, version = None, service_name = None, metadata_cache_ttl = 60, metadata_cache_size = 32, read_quota_per_minute = None, write_quota_per_minute = None, retry_policy = None, read_cache_dir = None, read_cache_max_bytes = 512 * 1024 * 1024, read_cache_format = 'parquet', metrics_sinks = None):
         """
         구글 스프레드시트 API 서비스 초기화
         
@@ -30,6 +524,16 @@ class GoogleSheetManager(GoogleBaseManager):
             scopes (list, optional): API 스코프 목록. 기본값은 None (DEFAULT_SCOPES 사용)
             version (str, optional): API 버전. 기본값은 None (DEFAULT_VERSION 사용)
             service_name (str, optional): 서비스 이름. 기본값은 None (DEFAULT_SERVICE 사용)
+            metadata_cache_ttl (float, optional): 시트 메타데이터 캐시 유지 시간(초). 0이면 캐시 사용 안 함. 기본값은 60
+            metadata_cache_size (int, optional): 캐시할 스프레드시트 최대 개수 (초과 시 가장 오래 사용하지 않은 항목 제거). 기본값은 32
+            read_quota_per_minute (float, optional): 서비스 계정당 분당 읽기 요청 허용량. 기본값은 None (DEFAULT_READ_QUOTA_PER_MINUTE 사용)
+            write_quota_per_minute (float, optional): 서비스 계정당 분당 쓰기 요청 허용량. 기본값은 None (DEFAULT_WRITE_QUOTA_PER_MINUTE 사용)
+            retry_policy (RetryPolicy, optional): 재시도 정책. 기본값은 None (RetryPolicy() 사용)
+            read_cache_dir (str, optional): 지정하면 읽은 시트 값을 이 폴더에 캐시하고, 스프레드시트가 바뀌지 않았으면 캐시에서 읽음.
+                버전 확인(Drive files.get)을 위해 이 경우에만 scopes에 DRIVE_METADATA_SCOPE를 추가합니다. 기본값은 None (캐시 사용 안 함)
+            read_cache_max_bytes (int, optional): 읽기 캐시 전체 크기 상한(바이트). 기본값은 512MB
+            read_cache_format (str, optional): 읽기 캐시 저장 형식 ('parquet', 'feather', 'pickle'). 기본값은 'parquet'
+            metrics_sinks (list, optional): 요청 지표를 기록할 MetricsSink 리스트. 기본값은 None (기록 안 함)
         """
         # 기본값 설정
         if scopes is None:
@@ -38,13 +542,151 @@ class GoogleSheetManager(GoogleBaseManager):
             version = self.DEFAULT_VERSION
         if service_name is None:
             service_name = self.DEFAULT_SERVICE
+        if read_cache_dir is not None and self.DRIVE_METADATA_SCOPE not in scopes:
+            scopes = list(scopes) + [self.DRIVE_METADATA_SCOPE]
             
         super().__init__(
             service_name=service_name,
             version=version,
             scope=scopes,
-            json_folder=json_folder
+            json_folder=json_folder,
+            read_quota_per_minute=read_quota_per_minute,
+            write_quota_per_minute=write_quota_per_minute,
+            retry_policy=retry_policy,
+            metrics_sinks=metrics_sinks
+        )
+
+        # 스프레드시트 ID별 시트 메타데이터 캐시 (LRU)
+        self.metadata_cache_ttl = metadata_cache_ttl
+        self.metadata_cache_size = metadata_cache_size
+        self.metadata_cache_hits = 0
+        self.metadata_cache_misses = 0
+        self._metadata_cache = OrderedDict()
+        self._metadata_cache_lock = threading.Lock()
+
+        # clear_and_set_worksheet 청크 전송 진행 상황 {(spreadsheet_id, sheet_name, cell_name): {...}}
+        self._chunk_write_progress = {}
+
+        # sync_dataframe_to_sheet 마지막 동기화 스냅샷 {(spreadsheet_id, sheet_name, cell_name): [셀 해시 튜플, ...]}
+        self._sync_snapshots = {}
+
+        # map_requests 등 여러 스레드에서 호출해도 위 두 상태를 안전하게 읽고 쓰도록 보호
+        self._write_state_lock = threading.Lock()
+
+        # 스프레드시트 버전 기준 디스크 읽기 캐시
+        self.read_cache = SheetReadCache(read_cache_dir, read_cache_max_bytes, read_cache_format) if read_cache_dir is not None else None
+
+    def _get_sheet_properties(self, spreadsheet_id, refresh=False):
+        """
+        스프레드시트의 시트 속성 리스트를 반환합니다.
+        캐시에 없거나 TTL이 지났으면 sheets.properties 필드만 요청하여 캐시를 갱신합니다.
+
+        Args:
+            spreadsheet_id (str): 구글 스프레드시트 ID
+            refresh (bool, optional): True이면 캐시를 무시하고 다시 조회 (기본값: False)
+
+        Returns:
+            list: [{'sheetId': ..., 'title': ..., 'gridProperties': {...}, ...}, ...]
+        """
+        now = time.monotonic()
+        with self._metadata_cache_lock:
+            cached = self._metadata_cache.get(spreadsheet_id)
+            if not refresh and cached is not None and now - cached[0] < self.metadata_cache_ttl:
+                self._metadata_cache.move_to_end(spreadsheet_id)
+                self.metadata_cache_hits += 1
+                return cached[1]
+            self.metadata_cache_misses += 1
+
+        sheet_metadata = self.service.spreadsheets().get(
+            spreadsheetId=spreadsheet_id,
+            fields='sheets.properties'
+        ).execute()
+        properties = [sheet['properties'] for sheet in sheet_metadata.get('sheets', [])]
+
+        if self.metadata_cache_ttl > 0:
+            with self._metadata_cache_lock:
+                self._metadata_cache[spreadsheet_id] = (now, properties)
+                self._metadata_cache.move_to_end(spreadsheet_id)
+                while len(self._metadata_cache) > self.metadata_cache_size:
+                    self._metadata_cache.popitem(last=False)
+        return properties
+
+    def _get_sheet_properties_with_retry(self, spreadsheet_id, refresh=False):
+        """retry_on_error가 붙지 않은 메서드와 작업 스레드에서 _get_sheet_properties를 재시도 정책에 따라 호출합니다."""
+        return self._run_with_retry(lambda: self._get_sheet_properties(spreadsheet_id, refresh=refresh), '_get_sheet_properties')
+
+    def _get_spreadsheet_version(self, spreadsheet_id):
+        """
+        Drive files.get으로 스프레드시트의 버전(version, modifiedTime)만 조회합니다. (읽기 캐시 확인용)
+
+        Returns:
+            str: '<version>:<modifiedTime>'
+        """
+        metadata = self.request_with_retry(
+            lambda service: self._drive_service().files().get(
+                fileId=spreadsheet_id,
+                fields='version, modifiedTime',
+                supportsAllDrives=True
+            ).execute()
         )
+        return f"{metadata['version']}:{metadata['modifiedTime']}"
+
+    def _drive_service(self):
+        """
+        현재 스레드의 계정으로 만든 Drive v3 서비스 (읽기 캐시의 버전 확인용)
+        시트 서비스와 같은 _create_service로 만들어 같은 HTTP 연결과 요청 훅을 사용하므로 허용량 제한, 재시도, 지표 기록이 똑같이 적용됩니다.
+        계정별로 처음 한 번만 생성합니다.
+        """
+        state = self._thread_state()
+        drive_services = state.__dict__.setdefault('drive_services', {})
+        if state.account_index not in drive_services:
+            drive_services[state.account_index] = self._create_service(state.account_index, state.transport, 'drive', 'v3')[2]
+        return drive_services[state.account_index]
+
+    def invalidate_metadata_cache(self, spreadsheet_url=None):
+        """
+        시트 메타데이터 캐시를 비웁니다.
+
+        Args:
+            spreadsheet_url (str, optional): 비울 스프레드시트 URL 또는 ID. None이면 전체 캐시를 비움
+        """
+        with self._metadata_cache_lock:
+            if spreadsheet_url is None:
+                self._metadata_cache.clear()
+            else:
+                self._metadata_cache.pop(extract_spreadsheet_id(spreadsheet_url), None)
+
+    def batch(self, spreadsheet_url, value_input_option='USER_ENTERED', max_cells=50000, max_requests=500):
+        """
+        값 쓰기와 batchUpdate 요청을 모아 최소한의 API 호출로 전송하는 쓰기 버퍼를 만듭니다.
+        with 블록이 정상 종료되면 모아 둔 요청을 전송하고, 블록에서 예외가 발생하면 전송하지 않고 버립니다.
+
+        Args:
+            spreadsheet_url (str): 구글 스프레드시트 URL 또는 ID
+            value_input_option (str, optional): 값 쓰기의 valueInputOption. 기본값은 'USER_ENTERED'
+            max_cells (int, optional): 모아 둔 값 셀 수가 이 값 이상이면 바로 전송. 기본값은 50000
+            max_requests (int, optional): 모아 둔 batchUpdate 요청 수가 이 값 이상이면 바로 전송. 기본값은 500
+
+        Returns:
+            SheetWriteBatch: 쓰기 버퍼
+
+        * example: 시트 추가, 값 쓰기, 서식 복사를 API 두 번으로 전송\n
+            with sheet_manager.batch(spreadsheet_url) as batch:
+                batch.add_sheet('요약')
+                batch.copy_paste('템플릿', 'A1:F20', '요약', 'A1', paste_type='PASTE_FORMAT')
+                batch.update_values('요약', 'A1', [['항목', '값']])
+                batch.update_values('요약', 'A2', [['매출', 1200]])  # A1 범위와 합쳐서 전송
+        """
+        return SheetWriteBatch(self, extract_spreadsheet_id(spreadsheet_url), value_input_option, max_cells, max_requests)
+
+    def _find_sheet_id(self, spreadsheet_id, sheet_name, refresh=False):
+        """
+        시트 이름으로 sheetId를 찾습니다. 없으면 None을 반환합니다.
+        """
+        for sheet in self._get_sheet_properties(spreadsheet_id, refresh=refresh):
+            if sheet['title'] == sheet_name:
+                return sheet['sheetId']
+        return None
 
     @retry_on_error
     def get_sheet_name_id_dict(self, spreadsheet_id):
@@ -55,9 +697,8 @@ class GoogleSheetManager(GoogleBaseManager):
         Returns:
             dict: {시트이름: sheetId, ...}
         """
-        sheet_metadata = self.service.spreadsheets().get(spreadsheetId=extract_spreadsheet_id(spreadsheet_id)).execute()
-        sheets = sheet_metadata.get('sheets', [])
-        return {sheet['properties']['title']: sheet['properties']['sheetId'] for sheet in sheets}
+        sheets = self._get_sheet_properties(extract_spreadsheet_id(spreadsheet_id))
+        return {sheet['title']: sheet['sheetId'] for sheet in sheets}
 
     @retry_on_error
     def get_sheet_name_list(self, spreadsheet_url):
@@ -68,9 +709,8 @@ class GoogleSheetManager(GoogleBaseManager):
         Returns:
             list: 시트 이름 리스트
         """
-        sheet_metadata = self.service.spreadsheets().get(spreadsheetId=extract_spreadsheet_id(spreadsheet_url)).execute()
-        sheets = sheet_metadata.get('sheets', [])
-        return [sheet['properties']['title'] for sheet in sheets]
+        sheets = self._get_sheet_properties(extract_spreadsheet_id(spreadsheet_url))
+        return [sheet['title'] for sheet in sheets]
 
     @retry_on_error
     def copy_sheet_format(
@@ -88,61 +728,121 @@ class GoogleSheetManager(GoogleBaseManager):
             source_sheet_name (str): 서식을 복사할 시트 이름
             target_sheet_names (list): 서식을 붙여넣을 시트 이름 리스트
             source_range (dict, optional): 복사할 범위 (예: {"startRowIndex":0, "endRowIndex":80, "startColumnIndex":0, "endColumnIndex":50})
+                (없으면 원본 시트의 실제 그리드 전체)
             target_range (dict, optional): 붙여넣을 범위 (없으면 source_range와 동일하게 적용)
         Returns:
             dict: 구글 API 응답
         """
         spreadsheet_id = extract_spreadsheet_id(spreadsheet_url)
         spreadsheet_url = convert_sheetid_to_url(spreadsheet_id)
-        name_to_id = self.get_sheet_name_id_dict(spreadsheet_id)
-        source_sheet_id = name_to_id.get(source_sheet_name)
+        name_to_sheet = {sheet['title']: sheet for sheet in self._get_sheet_properties(spreadsheet_id)}
+        source_sheet = name_to_sheet.get(source_sheet_name)
 
-        if source_sheet_id is None:
+        if source_sheet is None:
             raise ValueError(f"⚠️ {inspect.currentframe().f_code.co_name} | source_sheet_name '{source_sheet_name}'를 찾을 수 없습니다. - URL: {spreadsheet_url}")
-        
-        if source_range is None:
-            source_range = {
-                "sheetId": source_sheet_id,
-                "startRowIndex": 0,
-                "endRowIndex": 1000000,
-                "startColumnIndex": 0,
-                "endColumnIndex": 1000
-            }
-        else:
-            source_range = dict(source_range)
-            source_range["sheetId"] = source_sheet_id
+        source_range = _sheet_grid_range(source_sheet, source_range)
 
-        requests = []
+        target_sheets = []
         for target_name in target_sheet_names:
-            target_sheet_id = name_to_id.get(target_name)
-            if target_sheet_id is None:
-                print(f"⚠️ {inspect.currentframe().f_code.co_name} | target_sheet_name '{target_name}'를 찾을 수 없습니다. - URL: {spreadsheet_url}")
+            if target_name not in name_to_sheet:
+                console_print(f"⚠️ {inspect.currentframe().f_code.co_name} | target_sheet_name '{target_name}'를 찾을 수 없습니다. - URL: {spreadsheet_url}")
                 continue
-
-            if target_range is None:
-                dest_range = {k: v for k, v in source_range.items() if k != "sheetId"}
-            else:
-                dest_range = dict(target_range)
-            
-            dest_range["sheetId"] = target_sheet_id
-            requests.append({
-                "copyPaste": {
-                    "source": source_range,
-                    "destination": dest_range,
-                    "pasteType": "PASTE_FORMAT"
-                }
-            })
-        if not requests:
+            target_sheets.append(name_to_sheet[target_name])
+        if not target_sheets:
             raise ValueError(f"⚠️ {inspect.currentframe().f_code.co_name} | 복사할 대상 시트가 없습니다. - URL: {spreadsheet_url}")
         
-        body = {"requests": requests}
+        body = {"requests": self._paste_requests(source_range, target_sheets, "PASTE_FORMAT", target_range)}
         response = self.service.spreadsheets().batchUpdate(
             spreadsheetId=spreadsheet_id, body=body
         ).execute()
+        self.invalidate_metadata_cache(spreadsheet_id)
         
-        print(f"✅ 구글시트 서식 복사 및 붙여넣기 완료 - {spreadsheet_url}")
+        console_print(f"✅ 구글시트 서식 복사 및 붙여넣기 완료 - {spreadsheet_url}")
         return response
 
+    def copy_sheet_format_to_spreadsheets(
+        self,
+        source_spreadsheet_url: str,
+        source_sheet_name: str,
+        target_spreadsheet_urls: list,
+        target_sheet_names: list = None,
+        source_range: dict = None,
+        target_range: dict = None,
+        max_workers: int = 8,
+    ):
+        """
+        한 시트의 서식을 여러 스프레드시트의 시트에 병렬로 복사합니다.
+        스프레드시트마다 sheets.copyTo로 원본 시트를 임시 시트로 복사한 뒤, 한 번의 batchUpdate로 대상 시트들에 서식을 붙여넣고 임시 시트를 삭제합니다.
+        요청은 request_with_retry로 실행되므로 계정별 쓰기 허용량(write_quota_per_minute) 안에서 max_workers개씩 동시에 처리됩니다.
+
+        Args:
+            source_spreadsheet_url (str): 원본 구글 스프레드시트 URL 또는 ID
+            source_sheet_name (str): 서식을 복사할 시트 이름
+            target_spreadsheet_urls (list): 서식을 붙여넣을 스프레드시트 URL 또는 ID 리스트
+            target_sheet_names (list, optional): 각 스프레드시트에서 서식을 붙여넣을 시트 이름 리스트 (없으면 [source_sheet_name])
+            source_range (dict, optional): 복사할 범위 (없으면 원본 시트의 실제 그리드 전체)
+            target_range (dict, optional): 붙여넣을 범위 (없으면 source_range와 동일하게 적용)
+            max_workers (int, optional): 동시에 처리할 스프레드시트 수. 기본값은 8
+
+        Returns:
+            dict: {'succeeded': [성공한 스프레드시트 URL, ...], 'failed': {실패한 스프레드시트 URL: 오류 메시지}, 'elapsed': 소요 시간(초)}
+
+        * example: 템플릿 서식을 여러 보고서 파일에 적용\n
+            summary = sheet_manager.copy_sheet_format_to_spreadsheets(
+                source_spreadsheet_url="template_spreadsheet_url",
+                source_sheet_name="템플릿",
+                target_spreadsheet_urls=report_urls,
+                target_sheet_names=["보고서"]
+            )
+        """
+        source_spreadsheet_id = extract_spreadsheet_id(source_spreadsheet_url)
+        source_spreadsheet_url = convert_sheetid_to_url(source_spreadsheet_id)
+        if target_sheet_names is None:
+            target_sheet_names = [source_sheet_name]
+
+        source_sheet = next((sheet for sheet in self._get_sheet_properties_with_retry(source_spreadsheet_id) if sheet['title'] == source_sheet_name), None)
+        if source_sheet is None:
+            raise ValueError(f"⚠️ {inspect.currentframe().f_code.co_name} | source_sheet_name '{source_sheet_name}'를 찾을 수 없습니다. - URL: {source_spreadsheet_url}")
+        source_range = _sheet_grid_range(source_sheet, source_range)
+
+        start_time = time.time()
+        summary = {'succeeded': [], 'failed': {}}
+        summary_lock = threading.Lock()
+
+        def copy_format(spreadsheet_url):
+            spreadsheet_id = extract_spreadsheet_id(spreadsheet_url)
+            spreadsheet_url = convert_sheetid_to_url(spreadsheet_id)
+            try:
+                name_to_sheet = {sheet['title']: sheet for sheet in self._get_sheet_properties_with_retry(spreadsheet_id)}
+                target_sheets = [name_to_sheet[name] for name in target_sheet_names if name in name_to_sheet]
+                if not target_sheets:
+                    raise ValueError(f"대상 시트({', '.join(target_sheet_names)})가 없습니다.")
+                if spreadsheet_id == source_spreadsheet_id:
+                    requests = self._paste_requests(source_range, target_sheets, 'PASTE_FORMAT', target_range)
+                    self.request_with_retry(
+                        lambda service: service.spreadsheets().batchUpdate(
+                            spreadsheetId=spreadsheet_id, body={'requests': requests}
+                        ).execute()
+                    )
+                    self.invalidate_metadata_cache(spreadsheet_id)
+                else:
+                    self._paste_across_spreadsheets(source_spreadsheet_id, source_range, spreadsheet_id, target_sheets, 'PASTE_FORMAT', target_range)
+            except Exception as e:
+                console_print(f"⚠️ copy_sheet_format_to_spreadsheets | 서식 복사 실패: {spreadsheet_url} - {e}")
+                with summary_lock:
+                    summary['failed'][spreadsheet_url] = str(e)
+                return
+            with summary_lock:
+                summary['succeeded'].append(spreadsheet_url)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for spreadsheet_url in dict.fromkeys(target_spreadsheet_urls):
+                executor.submit(copy_format, spreadsheet_url)
+
+        summary['elapsed'] = time.time() - start_time
+        console_print(f"✅ 구글시트 서식 일괄 복사 완료 (성공: {len(summary['succeeded'])}, 실패: {len(summary['failed'])}, {summary['elapsed']:.1f}초) - source: {source_spreadsheet_url}")
+        return summary
+
     @retry_on_error
     def copy_sheet_whole_values(
         self,
@@ -150,19 +850,31 @@ class GoogleSheetManager(GoogleBaseManager):
         source_sheet_name: str,
         spreadsheet_target_url: str = None,
         target_sheet_name: str = None,
+        method: str = 'auto',
+        chunk_size: int = 10000,
     ):
         """
-        구글 스프레드시트에서 시트의 전체 값을 여러 시트에 복사합니다.
-        ⚠️ 숫자의 경우 앞뒤에 명, 만, 억 등의 서식이 붙어있을 경우 문자로 복사됩니다.
+        구글 스프레드시트에서 시트의 전체 값을 다른 시트에 복사합니다. (대상 시트가 없으면 생성)
+        같은 스프레드시트는 copyPaste(PASTE_VALUES)로, 다른 스프레드시트는 sheets.copyTo로 복사한 임시 시트에서 copyPaste하여
+        값을 내려받지 않고 서버에서 복사합니다. 서버 복사가 거부된 경우(400 오류)에만 chunk_size 행씩 읽어서 쓰는 방식으로 복사합니다.
+        ⚠️ 서버 복사는 셀의 실제 값을 복사하므로 날짜 등은 대상 셀의 서식에 따라 표시됩니다.
+        ⚠️ 다른 스프레드시트로 복사할 때 원본의 다른 시트를 참조하는 수식은 값이 달라질 수 있으므로 method='client'를 사용하세요.
+        ⚠️ client 방식에서 숫자의 앞뒤에 명, 만, 억 등의 서식이 붙어있을 경우 문자로 복사됩니다.
         Args:
             spreadsheet_source_url (str): 구글 스프레드시트 ID (URL에서 추출)
-            source_sheet_name (str): 서식을 복사할 시트 이름
+            source_sheet_name (str): 값을 복사할 시트 이름
             spreadsheet_target_url (str): 구글 스프레드시트 ID (URL에서 추출)
-            target_sheet_name (str): 서식을 붙여넣을 시트 이름
+            target_sheet_name (str): 값을 붙여넣을 시트 이름
+            method (str, optional): 'auto'(서버 복사 우선) 또는 'client'(항상 읽어서 쓰기). 기본값은 'auto'
+            chunk_size (int, optional): client 방식에서 한 번에 읽고 쓸 행 수. 기본값은 10000
+        Returns:
+            str: 사용한 복사 방식 ('copyPaste', 'copyTo', 'client')
         """
 
         if target_sheet_name == None:
             raise ValueError(f"⚠️ {inspect.currentframe().f_code.co_name} | target_sheet_name이 지정되지 않았습니다.")
+        if method not in ('auto', 'client'):
+            raise ValueError(f"⚠️ {inspect.currentframe().f_code.co_name} | 지원하지 않는 복사 방식입니다: {method} (가능한 방식: auto, client)")
 
         spreadsheet_source_id = extract_spreadsheet_id(spreadsheet_source_url)
         spreadsheet_source_url = convert_sheetid_to_url(spreadsheet_source_id)
@@ -173,27 +885,284 @@ class GoogleSheetManager(GoogleBaseManager):
         spreadsheet_target_id = extract_spreadsheet_id(spreadsheet_target_url)
         spreadsheet_target_url = convert_sheetid_to_url(spreadsheet_target_id)
 
-        # 보고서 복사 붙여넣기
-        result = self.service.spreadsheets().values().get(
-            spreadsheetId=spreadsheet_source_id,
-            range=f'{source_sheet_name}!A1:ZZZ'
+        source_sheet_id = self._find_sheet_id(spreadsheet_source_id, source_sheet_name)
+        if source_sheet_id is None:
+            source_sheet_id = self._find_sheet_id(spreadsheet_source_id, source_sheet_name, refresh=True)
+        if source_sheet_id is None:
+            raise ValueError(f"⚠️ {inspect.currentframe().f_code.co_name} | source_sheet_name '{source_sheet_name}'를 찾을 수 없습니다. - URL: {spreadsheet_source_url}")
+        source_grid = next(sheet for sheet in self._get_sheet_properties(spreadsheet_source_id) if sheet['sheetId'] == source_sheet_id).get('gridProperties', {})
+        row_count = source_grid.get('rowCount', 0)
+        column_count = source_grid.get('columnCount', 0)
+        target_sheet_id = self._get_or_create_sheet_id(spreadsheet_target_id, target_sheet_name)
+
+        copy_method = 'client'
+        if method == 'auto':
+            try:
+                source_range = {'sheetId': source_sheet_id, 'startRowIndex': 0, 'endRowIndex': row_count, 'startColumnIndex': 0, 'endColumnIndex': column_count}
+                target_sheet = next(sheet for sheet in self._get_sheet_properties(spreadsheet_target_id) if sheet['sheetId'] == target_sheet_id)
+                if spreadsheet_source_id == spreadsheet_target_id:
+                    copy_method = 'copyPaste'
+                    requests = self._paste_requests(source_range, [target_sheet], 'PASTE_VALUES')
+                    self.request_with_retry(
+                        lambda service: service.spreadsheets().batchUpdate(
+                            spreadsheetId=spreadsheet_target_id, body={'requests': requests}
+                        ).execute()
+                    )
+                    self.invalidate_metadata_cache(spreadsheet_target_id)
+                else:
+                    copy_method = 'copyTo'
+                    self._paste_across_spreadsheets(spreadsheet_source_id, source_range, spreadsheet_target_id, [target_sheet], 'PASTE_VALUES')
+            except HttpError as e:
+                if e.resp.status != 400:
+                    raise
+                console_print(f"⚠️ {inspect.currentframe().f_code.co_name} | 서버 복사({copy_method})를 할 수 없어 읽어서 쓰는 방식으로 복사합니다: {str(e)}")
+                copy_method = 'client'
+
+        if copy_method == 'client':
+            self._copy_values_by_chunks(
+                spreadsheet_source_id, source_sheet_name, spreadsheet_target_id, target_sheet_id, target_sheet_name,
+                row_count, column_count, chunk_size
+            )
+
+        console_print(f"✅ 구글시트 전체 값 복사 완료 (방식: {copy_method}) - source_sheet_name: {source_sheet_name} => target_sheet_name: {target_sheet_name}, spreadsheet_url: {spreadsheet_target_url}")
+        return copy_method
+
+    def _paste_requests(self, source_range, target_sheets, paste_type, target_range=None):
+        """
+        source_range를 target_sheets 각각에 붙여넣는 copyPaste 요청 리스트를 만듭니다.
+        붙여넣을 범위가 대상 시트 그리드보다 크면 그리드를 늘리는 요청을 앞에 추가합니다.
+
+        Args:
+            source_range (dict): sheetId를 포함한 원본 GridRange
+            target_sheets (list): 대상 시트 속성 리스트 ([{'sheetId': ..., 'gridProperties': {...}}, ...])
+            paste_type (str): copyPaste의 pasteType ('PASTE_VALUES', 'PASTE_FORMAT' 등)
+            target_range (dict, optional): 붙여넣을 범위 (없으면 source_range와 같은 위치)
+        """
+        source_rows = source_range.get('endRowIndex', 0) - source_range.get('startRowIndex', 0)
+        source_columns = source_range.get('endColumnIndex', 0) - source_range.get('startColumnIndex', 0)
+        requests = []
+        for sheet in target_sheets:
+            dest_range = dict(target_range) if target_range is not None else {k: v for k, v in source_range.items() if k != 'sheetId'}
+            dest_range['sheetId'] = sheet['sheetId']
+            grid = sheet.get('gridProperties', {})
+            row_count = max(grid.get('rowCount', 0), dest_range.get('endRowIndex', dest_range.get('startRowIndex', 0) + source_rows))
+            column_count = max(grid.get('columnCount', 0), dest_range.get('endColumnIndex', dest_range.get('startColumnIndex', 0) + source_columns))
+            if (row_count, column_count) != (grid.get('rowCount', 0), grid.get('columnCount', 0)):
+                requests.append({
+                    'updateSheetProperties': {
+                        'properties': {
+                            'sheetId': sheet['sheetId'],
+                            'gridProperties': {'rowCount': row_count, 'columnCount': column_count}
+                        },
+                        'fields': 'gridProperties(rowCount,columnCount)'
+                    }
+                })
+            requests.append({
+                'copyPaste': {
+                    'source': source_range,
+                    'destination': dest_range,
+                    'pasteType': paste_type
+                }
+            })
+        return requests
+
+    def _paste_across_spreadsheets(self, source_id, source_range, target_id, target_sheets, paste_type, target_range=None):
+        """
+        sheets.copyTo로 원본 시트를 대상 스프레드시트에 임시 시트로 복사한 뒤,
+        한 번의 batchUpdate로 임시 시트의 source_range를 target_sheets에 붙여넣고 임시 시트를 삭제합니다.
+        copyTo는 멱등이 아니므로 요청이 적용되지 않은 것이 확실한 오류(허용량 초과, 인증 오류)만 재시도합니다.
+        """
+        def copy_to(service):
+            try:
+                return service.spreadsheets().sheets().copyTo(
+                    spreadsheetId=source_id,
+                    sheetId=source_range['sheetId'],
+                    body={'destinationSpreadsheetId': target_id}
+                ).execute()
+            except Exception as e:
+                if self.retry_policy.classify(e) == RetryPolicy.RETRY:
+                    # 시간 초과/서버 오류는 복사가 이미 적용되었을 수 있어 다시 보내면 임시 시트가 남을 수 있음
+                    raise RuntimeError(f"⚠️ {inspect.currentframe().f_code.co_name} | copyTo 요청 결과를 알 수 없어 재시도하지 않습니다: {str(e)}") from e
+                raise
+
+        copied = self.request_with_retry(copy_to)
+        temp_sheet_id = copied['sheetId']
+        requests = self._paste_requests(dict(source_range, sheetId=temp_sheet_id), target_sheets, paste_type, target_range)
+        requests.append({'deleteSheet': {'sheetId': temp_sheet_id}})
+        try:
+            self.request_with_retry(
+                lambda service: service.spreadsheets().batchUpdate(
+                    spreadsheetId=target_id, body={'requests': requests}
+                ).execute()
+            )
+        except Exception:
+            # batchUpdate는 전부 적용되거나 전부 취소되므로 남은 임시 시트를 삭제
+            try:
+                self.request_with_retry(
+                    lambda service: service.spreadsheets().batchUpdate(
+                        spreadsheetId=target_id, body={'requests': [{'deleteSheet': {'sheetId': temp_sheet_id}}]}
+                    ).execute()
+                )
+            except Exception as cleanup_error:
+                console_print(f"⚠️ {inspect.currentframe().f_code.co_name} | 임시 시트({copied.get('title')}) 삭제 실패: {str(cleanup_error)}")
+            raise
+        finally:
+            self.invalidate_metadata_cache(target_id)
+
+    def _copy_values_by_chunks(self, source_id, source_sheet_name, target_id, target_sheet_id, target_sheet_name, row_count, column_count, chunk_size):
+        """
+        원본 시트 값을 chunk_size 행씩 읽어 숫자로 변환한 뒤 대상 시트의 같은 위치에 씁니다.
+        비어 있는 구간은 건너뛰고, 다음 데이터를 쓸 때 빈 행으로 채워 원본과 같은 위치를 유지합니다.
+        """
+        self._ensure_grid_size(target_id, target_sheet_id, row_count, column_count)
+        next_row = 1  # 아직 쓰지 않은 첫 행 번호
+        for start in range(1, row_count + 1, chunk_size):
+            end = min(start + chunk_size - 1, row_count)
+            result = self.request_with_retry(
+                lambda service: service.spreadsheets().values().get(
+                    spreadsheetId=source_id,
+                    range=f'{source_sheet_name}!A{start}:ZZZ{end}'
+                ).execute()
+            )
+            values = result.get('values', [])
+            if not any(values):
+                continue
+            width = max(len(row) for row in values)
+            block = [[''] * width for _ in range(start - next_row)]
+            block.extend([convert_to_number(cell) for cell in row] + [''] * (width - len(row)) for row in values)
+            self.request_with_retry(
+                lambda service: service.spreadsheets().values().update(
+                    spreadsheetId=target_id,
+                    range=f'{target_sheet_name}!A{next_row}',
+                    valueInputOption='USER_ENTERED',
+                    body={'values': block}
+                ).execute()
+            )
+            next_row = start + len(values)
+
+    def _get_or_create_sheet_id(self, spreadsheet_id, sheet_name):
+        """
+        시트 이름으로 sheetId를 찾고, 없으면 새 시트를 생성하여 sheetId를 반환합니다.
+        """
+        # 캐시에 없으면 최신 메타데이터로 한 번 더 확인
+        sheet_id = self._find_sheet_id(spreadsheet_id, sheet_name)
+        if sheet_id is None:
+            sheet_id = self._find_sheet_id(spreadsheet_id, sheet_name, refresh=True)
+
+        if sheet_id is None:
+            # 새 시트 생성
+            request = {
+                'addSheet': {
+                    'properties': {
+                        'title': sheet_name,
+                        'gridProperties': {
+                            'rowCount': 100,
+                            'columnCount': 10
+                        }
+                    }
+                }
+            }
+            response = self.service.spreadsheets().batchUpdate(
+                spreadsheetId=spreadsheet_id,
+                body={'requests': [request]}
+            ).execute()
+            sheet_id = response['replies'][0]['addSheet']['properties']['sheetId']
+            self.invalidate_metadata_cache(spreadsheet_id)
+        return sheet_id
+
+    def _ensure_grid_size(self, spreadsheet_id, sheet_id, row_count, column_count):
+        """
+        시트 그리드가 row_count 행, column_count 열보다 작으면 한 번의 요청으로 늘립니다.
+        (호출하는 메서드의 재시도 루프 안에서 실행되므로 요청을 따로 재시도하지 않음)
+        """
+        grid = next(sheet for sheet in self._get_sheet_properties(spreadsheet_id) if sheet['sheetId'] == sheet_id).get('gridProperties', {})
+        row_count = max(grid.get('rowCount', 0), row_count)
+        column_count = max(grid.get('columnCount', 0), column_count)
+        if (row_count, column_count) == (grid.get('rowCount'), grid.get('columnCount')):
+            return
+
+        self.service.spreadsheets().batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body={'requests': [{
+                'updateSheetProperties': {
+                    'properties': {
+                        'sheetId': sheet_id,
+                        'gridProperties': {'rowCount': row_count, 'columnCount': column_count}
+                    },
+                    'fields': 'gridProperties(rowCount,columnCount)'
+                }
+            }]}
         ).execute()
-        values = result.get('values', [])
-        values = [[convert_to_number(cell) for cell in row] for row in values]
-        values_fillna = pd.DataFrame(values).values.tolist()
-        # NaN 값을 빈 문자열로 변환
-        values_fillna = [['' if pd.isna(cell) else cell for cell in row] for row in values_fillna]
-        self.service.spreadsheets().values().update(
-                spreadsheetId=spreadsheet_target_id,
-                range=f"{target_sheet_name}!A1",
-                valueInputOption="USER_ENTERED",  # 또는 'RAW'
-                body={"values": values_fillna},
+        self.invalidate_metadata_cache(spreadsheet_id)
+
+    def _write_values_in_chunks(self, spreadsheet_id, sheet_id, sheet_name, df, cell_name, chunk_size, fingerprint):
+        """
+        데이터프레임을 헤더 포함 chunk_size 행 단위로 나누어 values().batchUpdate로 순차 전송합니다.
+        청크는 전송 직전에 변환하므로 전체 값 리스트를 한 번에 만들지 않습니다.
+        그리드 크기 조정과 시트 초기화는 처음 한 번만 수행하고, 완료된 청크는 self._chunk_write_progress에 기록하여
+        같은 데이터로 다시 호출되면(재시도 포함) 실패한 청크부터 이어서 전송합니다.
+        요청은 따로 재시도하지 않고 실패를 그대로 발생시키며, 재시도는 clear_and_set_worksheet의 재시도 루프 한 곳에서만 수행합니다.
+
+        Returns:
+            dict: {'rows': 전송한 행 수, 'chunks': 전송한 청크 수, 'elapsed': 소요 시간(초), 'rows_per_second': 초당 행 수}
+        """
+        column_letter, start_row = _split_cell_name(cell_name)
+        start_column = _column_index(column_letter)
+        row_count = len(df) + 1  # 헤더 포함
+        chunk_count = (row_count + chunk_size - 1) // chunk_size
+
+        key = (spreadsheet_id, sheet_name, cell_name)
+        with self._write_state_lock:
+            progress = self._chunk_write_progress.get(key)
+            if progress is None or progress['fingerprint'] != fingerprint:
+                progress = {'fingerprint': fingerprint, 'prepared': False, 'done': set()}
+                self._chunk_write_progress[key] = progress
+
+        if not progress['prepared']:
+            # 필요한 크기만큼 그리드를 한 번에 늘림
+            self._ensure_grid_size(
+                spreadsheet_id, sheet_id,
+                start_row - 1 + row_count,
+                start_column + len(df.columns)
+            )
+
+            # 시트 전체 초기화
+            self.service.spreadsheets().values().batchClear(
+                spreadsheetId=spreadsheet_id,
+                body={'ranges': [f'{sheet_name}!A:ZZZ']}
             ).execute()
-        
-        print(f"✅ 구글시트 전체 값 복사 완료 - source_sheet_name: {source_sheet_name} => target_sheet_name: {target_sheet_name}, spreadsheet_url: {spreadsheet_target_url}")
+            progress['prepared'] = True
+        else:
+            console_print(f"🔁 이전 전송 이어서 진행 (완료된 청크: {len(progress['done'])}/{chunk_count}, sheet_name: {sheet_name})")
 
-    @retry_on_error
-    def clear_and_set_worksheet(self, spreadsheet_url, sheet_name, df, cell_name='A1'):
+        start_time = time.perf_counter()
+        written_rows = 0
+        written_chunks = 0
+        for index in range(chunk_count):
+            if index in progress['done']:
+                continue
+            # 값 행 번호 기준 [start, stop) 구간 (0번 행은 헤더)
+            start, stop = index * chunk_size, min((index + 1) * chunk_size, row_count)
+            block = _dataframe_to_values(df.iloc[max(start - 1, 0):stop - 1], header=(start == 0))
+            self.service.spreadsheets().values().batchUpdate(
+                spreadsheetId=spreadsheet_id,
+                body={
+                    'valueInputOption': 'USER_ENTERED',
+                    'data': [{'range': f'{sheet_name}!{column_letter}{start_row + index * chunk_size}', 'values': block}]
+                }
+            ).execute()
+            progress['done'].add(index)
+            written_rows += len(block)
+            written_chunks += 1
+
+        elapsed = time.perf_counter() - start_time
+        with self._write_state_lock:
+            self._chunk_write_progress.pop(key, None)
+        rows_per_second = written_rows / elapsed if elapsed > 0 else float('inf')
+        console_print(f"📤 청크 전송 완료 (행: {written_rows}, 청크: {written_chunks}/{chunk_count}, {rows_per_second:,.0f} rows/s)")
+        return {'rows': written_rows, 'chunks': written_chunks, 'elapsed': elapsed, 'rows_per_second': rows_per_second}
+
+    def clear_and_set_worksheet(self, spreadsheet_url, sheet_name, df, cell_name='A1', chunk_size=None):
         """
         워크시트를 초기화하고 주어진 데이터프레임으로 설정합니다.
         워크시트가 없는 경우 새로 생성합니다.
@@ -202,47 +1171,44 @@ class GoogleSheetManager(GoogleBaseManager):
             spreadsheet_url (str): Google 스프레드시트 문서의 URL 또는 ID
             sheet_name (str): 작업할 시트 탭의 이름
             df (pandas.DataFrame): 시트에 설정할 데이터프레임
+            cell_name (str, optional): 데이터를 입력할 시작 셀 (기본값: 'A1')
+            chunk_size (int, optional): 지정하면 chunk_size 행 단위로 나누어 전송하고, 실패 시 실패한 청크부터 이어서 전송 (기본값: None)
+
+        Returns:
+            dict: chunk_size를 지정한 경우 전송 통계 ({'rows', 'chunks', 'elapsed', 'rows_per_second'}), 그 외에는 None
         """
+        try:
+            return self._run_with_retry(
+                lambda: self._clear_and_set_worksheet(spreadsheet_url, sheet_name, df, cell_name, chunk_size),
+                'clear_and_set_worksheet'
+            )
+        except Exception:
+            if chunk_size:
+                # 재시도를 모두 실패하면 진행 상황을 버려 다음 호출은 시트 초기화부터 다시 수행
+                with self._write_state_lock:
+                    self._chunk_write_progress.pop((extract_spreadsheet_id(spreadsheet_url), sheet_name, cell_name), None)
+            raise
+
+    def _clear_and_set_worksheet(self, spreadsheet_url, sheet_name, df, cell_name, chunk_size):
+        """clear_and_set_worksheet의 재시도 단위 (진행 상황이 같으면 완료된 청크는 건너뜀)"""
         # 파일 ID 추출
         spreadsheet_id = extract_spreadsheet_id(spreadsheet_url)
         spreadsheet_url = convert_sheetid_to_url(spreadsheet_id)
         
         try:
-            # 시트 ID 가져오기
-            sheet_metadata = self.service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
-            sheets = sheet_metadata.get('sheets', [])
-            
-            # 시트 존재 여부 확인
-            sheet_id = None
-            for sheet in sheets:
-                if sheet['properties']['title'] == sheet_name:
-                    sheet_id = sheet['properties']['sheetId']
-                    break
-            
-            if sheet_id is None:
-                # 새 시트 생성
-                request = {
-                    'addSheet': {
-                        'properties': {
-                            'title': sheet_name,
-                            'gridProperties': {
-                                'rowCount': 100,
-                                'columnCount': 10
-                            }
-                        }
-                    }
-                }
-                response = self.service.spreadsheets().batchUpdate(
-                    spreadsheetId=spreadsheet_id,
-                    body={'requests': [request]}
-                ).execute()
-                sheet_id = response['replies'][0]['addSheet']['properties']['sheetId']
+            # 시트 ID 가져오기 (없으면 생성)
+            sheet_id = self._get_or_create_sheet_id(spreadsheet_id, sheet_name)
             
+            if chunk_size:
+                stats = self._write_values_in_chunks(
+                    spreadsheet_id, sheet_id, sheet_name, df, cell_name, chunk_size,
+                    fingerprint=(_dataframe_fingerprint(df), chunk_size)
+                )
+                console_print(f"✅ 시트 초기화 및 데이터 입력 완료 (sheet_name: {sheet_name}, spreadsheet_url: {spreadsheet_url})")
+                return stats
+
             # 데이터프레임을 리스트로 변환
-            df = df.apply(lambda col: col.astype(str) if col.apply(lambda x: isinstance(x, datetime.date)).any() else col)
-            df = df.apply(lambda col: col.astype(float) if col.apply(lambda x: isinstance(x, decimal.Decimal)).any() else col)
-            safe_df = df.where(pd.notnull(df), '')
-            values = [safe_df.columns.tolist()] + safe_df.values.tolist()
+            values = _dataframe_to_values(df)
             
             # 데이터 업데이트
             body = {
@@ -264,22 +1230,141 @@ class GoogleSheetManager(GoogleBaseManager):
                 body=body
             ).execute()
             
-            print(f"✅ 시트 초기화 및 데이터 입력 완료 (sheet_name: {sheet_name}, spreadsheet_url: {spreadsheet_url})")
+            console_print(f"✅ 시트 초기화 및 데이터 입력 완료 (sheet_name: {sheet_name}, spreadsheet_url: {spreadsheet_url})")
             
         except Exception as e:
-            print(f"⚠️ {inspect.currentframe().f_code.co_name} | 오류 발생: {str(e)}")
+            console_print(f"⚠️ {inspect.currentframe().f_code.co_name} | 오류 발생: {str(e)}")
             raise
 
     @retry_on_error
-    def get_dataframe_from_sheet(self, spreadsheet_url, sheet_name, skip_rows=0, range_name='A1:ZZZ'):
+    def sync_dataframe_to_sheet(self, spreadsheet_url, sheet_name, df, cell_name='A1', use_snapshot=False):
+        """
+        시트의 현재 값과 데이터프레임을 셀 단위로 비교하여 변경된 범위만 갱신합니다.
+        시트를 비우지 않으므로 갱신 중에도 시트가 빈 상태가 되지 않습니다.
+        변경된 셀, 추가된 행, 줄어든 행/열(빈 값으로 덮어씀)을 한 번의 values().batchUpdate로 전송합니다.
+        워크시트가 없는 경우 새로 생성합니다.
+
+        Args:
+            spreadsheet_url (str): Google 스프레드시트 문서의 URL 또는 ID
+            sheet_name (str): 작업할 시트 탭의 이름
+            df (pandas.DataFrame): 시트에 설정할 데이터프레임
+            cell_name (str, optional): 데이터를 입력할 시작 셀 (기본값: 'A1')
+            use_snapshot (bool, optional): True이면 이 매니저로 마지막에 동기화한 스냅샷과 비교하여 시트 읽기를 생략
+                (그 사이 시트를 직접 수정한 경우 해당 셀은 반영되지 않음, 기본값: False)
+
+        Returns:
+            dict: {'cells_written': 전송한 셀 수, 'cells_skipped': 변경이 없어 건너뛴 셀 수, 'ranges': 전송한 범위 수,
+                   'rows_appended': 추가된 행 수, 'rows_truncated': 비운 행 수}
+        """
+        spreadsheet_id = extract_spreadsheet_id(spreadsheet_url)
+        spreadsheet_url = convert_sheetid_to_url(spreadsheet_id)
+        column_letter, start_row = _split_cell_name(cell_name)
+        start_column = _column_index(column_letter)
+
+        sheet_id = self._get_or_create_sheet_id(spreadsheet_id, sheet_name)
+        new_values = _dataframe_to_values(df)
+
+        key = (spreadsheet_id, sheet_name, cell_name)
+        with self._write_state_lock:
+            old_hashes = self._sync_snapshots.get(key) if use_snapshot else None
+        if old_hashes is None:
+            # 현재 시트 값 읽기 (USER_ENTERED로 저장된 값 그대로: 수식은 수식 문자열, 숫자는 서식 없이, 날짜는 일련번호로)
+            result = self.service.spreadsheets().values().get(
+                spreadsheetId=spreadsheet_id,
+                range=f'{sheet_name}!{cell_name}:ZZZ',
+                valueRenderOption='FORMULA',
+                dateTimeRenderOption='SERIAL_NUMBER'
+            ).execute()
+            old_values = result.get('values', [])
+            old_hashes = _row_hashes(old_values, max([len(row) for row in old_values], default=0))
+
+        old_width = max([len(row) for row in old_hashes], default=0)
+        width = max(old_width, max(len(row) for row in new_values))
+        new_hashes = _row_hashes(new_values, width)
+        empty_row = (_cell_hash(''),) * width
+
+        # 행/셀 단위 비교 -> 행별 변경 구간 [(시작 열, 끝 열), ...]
+        row_count = max(len(old_hashes), len(new_hashes))
+        row_runs = []
+        for r in range(row_count):
+            new_row = new_hashes[r] if r < len(new_hashes) else empty_row
+            old_row = old_hashes[r] + empty_row[len(old_hashes[r]):] if r < len(old_hashes) else empty_row
+            if new_row == old_row:
+                row_runs.append(())
+                continue
+            runs = []
+            for c in range(width):
+                if new_row[c] != old_row[c]:
+                    if runs and runs[-1][1] == c:
+                        runs[-1] = (runs[-1][0], c + 1)
+                    else:
+                        runs.append((c, c + 1))
+            row_runs.append(tuple(runs))
+
+        # 같은 열 구간이 연속된 행은 하나의 범위로 합침
+        blocks = []  # [시작 행, 끝 행(미포함), 시작 열, 끝 열(미포함)]
+        open_blocks = {}
+        for r, runs in enumerate(row_runs):
+            next_open = {}
+            for run in runs:
+                block = open_blocks.get(run)
+                if block is None:
+                    block = [r, r + 1, run[0], run[1]]
+                    blocks.append(block)
+                else:
+                    block[1] = r + 1
+                next_open[run] = block
+            open_blocks = next_open
+
+        data = []
+        cells_written = 0
+        for row_start, row_end, col_start, col_end in blocks:
+            block_values = []
+            for r in range(row_start, row_end):
+                row = new_values[r] if r < len(new_values) else []
+                row = row + [''] * (col_end - len(row))
+                block_values.append(row[col_start:col_end])
+            data.append({
+                'range': (
+                    f'{sheet_name}!{_column_letter(start_column + col_start)}{start_row + row_start}:'
+                    f'{_column_letter(start_column + col_end - 1)}{start_row + row_end - 1}'
+                ),
+                'values': block_values
+            })
+            cells_written += (row_end - row_start) * (col_end - col_start)
+
+        if data:
+            self._ensure_grid_size(spreadsheet_id, sheet_id, start_row - 1 + row_count, start_column + width)
+            self.service.spreadsheets().values().batchUpdate(
+                spreadsheetId=spreadsheet_id,
+                body={'valueInputOption': 'USER_ENTERED', 'data': data}
+            ).execute()
+
+        with self._write_state_lock:
+            self._sync_snapshots[key] = new_hashes
+        stats = {
+            'cells_written': cells_written,
+            'cells_skipped': row_count * width - cells_written,
+            'ranges': len(data),
+            'rows_appended': max(len(new_hashes) - len(old_hashes), 0),
+            'rows_truncated': max(len(old_hashes) - len(new_hashes), 0),
+        }
+        console_print(f"✅ 시트 동기화 완료 (변경: {stats['cells_written']}셀/{stats['ranges']}개 범위, 유지: {stats['cells_skipped']}셀) (sheet_name: {sheet_name}, spreadsheet_url: {spreadsheet_url})")
+        return stats
+
+    @retry_on_error
+    def get_dataframe_from_sheet(self, spreadsheet_url, sheet_name, skip_rows=0, range_name='A1:ZZZ', columnar=False, use_cache=True):
         """
         주어진 Google 스프레드시트 URL과 시트 이름을 사용하여 데이터를 불러와 Pandas DataFrame으로 변환합니다.
+        read_cache_dir를 지정한 매니저는 스프레드시트 버전을 먼저 확인하여 바뀌지 않았으면 디스크 캐시에서 읽습니다.
 
         Args:
             spreadsheet_url (str): Google 스프레드시트 문서의 URL 또는 ID
             sheet_name (str): 데이터를 불러올 시트 탭의 이름
             skip_rows (int, optional): 첫 번째 행을 건너뛸 행 수 (기본값: 0)
             range_name (str, optional): 데이터를 불러올 범위 (기본값: 'A1:ZZZ')
+            columnar (bool, optional): True이면 열 단위 벡터화 연산으로 숫자 변환 (대용량 시트에서 더 빠름, 기본값: False)
+            use_cache (bool, optional): False이면 읽기 캐시를 사용하지 않고 항상 새로 읽음 (기본값: True)
 
         Returns:
             pandas.DataFrame: 시트에서 가져온 데이터를 포함하는 데이터프레임
@@ -287,28 +1372,40 @@ class GoogleSheetManager(GoogleBaseManager):
         # 파일 ID 추출
         spreadsheet_id = extract_spreadsheet_id(spreadsheet_url)
         spreadsheet_url = convert_sheetid_to_url(spreadsheet_id)
+        cache_version = None
+        if use_cache and self.read_cache is not None:
+            cache_version = self._get_spreadsheet_version(spreadsheet_id)
+            cache_key = SheetReadCache.make_key(spreadsheet_id, sheet_name, range_name, skip_rows, columnar)
+            df = self.read_cache.get(cache_key, cache_version)
+            if df is not None:
+                console_print(f"📦 캐시에서 데이터 로드 (행: {len(df)}, 열: {len(df.columns)}) (sheet_name: {sheet_name}, spreadsheet_url: {spreadsheet_url})")
+                return df
         try:
-            # 시트 메타데이터 가져오기
-            sheet_metadata = self.service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
-            sheets = sheet_metadata.get('sheets', [])
-            
-            # 시트 존재 여부 확인
-            sheet_exists = False
-            for sheet in sheets:
-                if sheet['properties']['title'] == sheet_name:
-                    sheet_exists = True
-                    break
+            # 시트 존재 여부 확인 (캐시에 없으면 최신 메타데이터로 한 번 더 확인)
+            sheet_exists = self._find_sheet_id(spreadsheet_id, sheet_name) is not None
+            if not sheet_exists:
+                sheet_exists = self._find_sheet_id(spreadsheet_id, sheet_name, refresh=True) is not None
             
             if not sheet_exists:
                 # 시트1 또는 Sheet1 확인
-                for sheet in sheets:
-                    if sheet['properties']['title'] in ['시트1', 'Sheet1']:
-                        sheet_name = sheet['properties']['title']
+                for sheet in self._get_sheet_properties(spreadsheet_id):
+                    if sheet['title'] in ['시트1', 'Sheet1']:
+                        sheet_name = sheet['title']
                         sheet_exists = True
                         break
             
             if not sheet_exists:
                 raise ValueError(f"⚠️ {inspect.currentframe().f_code.co_name} | 시트 '{sheet_name}'를 찾을 수 없습니다. - URL: {spreadsheet_url}")
+
+            if cache_version is not None:
+                # 캐시는 실제로 읽는 시트 기준 (시트1/Sheet1로 대신 읽는 경우 그 시트의 캐시 사용)
+                resolved_key = SheetReadCache.make_key(spreadsheet_id, sheet_name, range_name, skip_rows, columnar)
+                if resolved_key != cache_key:
+                    cache_key = resolved_key
+                    df = self.read_cache.get(cache_key, cache_version)
+                    if df is not None:
+                        console_print(f"📦 캐시에서 데이터 로드 (행: {len(df)}, 열: {len(df.columns)}) (sheet_name: {sheet_name}, spreadsheet_url: {spreadsheet_url})")
+                        return df
             
             # 데이터 가져오기
             result = self.service.spreadsheets().values().get(
@@ -319,50 +1416,181 @@ class GoogleSheetManager(GoogleBaseManager):
             if not values or len(values) == 1:  # 데이터가 없거나 컬럼명만 있는 경우 빈 데이터프레임 리턴
                 return pd.DataFrame()
             
-            # 첫 행을 컬럼명으로 사용
-            headers = values[skip_rows]
-
-            # 중복된 컬럼명이 있으면 '_1', '_2' 등을 추가하여 유니크하게 만듦
-            header_counts = Counter(headers)
-            unique_headers = []
-            header_seen = {}
-            for h in headers:
-                if header_counts[h] > 1:
-                    header_seen[h] = header_seen.get(h, 0) + 1
-                    unique_headers.append(f"{h}_{header_seen[h]}")
-                else:
-                    unique_headers.append(h)
-
-            # 중복된 컬럼명이 있을 경우 경고 메시지 출력
-            if any(count > 1 for count in header_counts.values()):
-                duplicate_headers = [h for h in header_counts if header_counts[h] > 1]
-                print(f"⚠️ 중복된 컬럼명 발견: {', '.join(duplicate_headers)} (총 {len(duplicate_headers)}개 중복됨)")
-
-            data = values[skip_rows+1:]
-
-            # 각 행의 길이를 헤더에 맞게 조정
-            header_len = len(unique_headers)
-            fixed_data = []
-            max_row_len = max([len(row) for row in data])
-            if max_row_len != header_len:
-                print(f"⚠️ {inspect.currentframe().f_code.co_name} | 데이터와 컬럼명의 열 개수 상이 - sheet_name: {sheet_name}, URL: {spreadsheet_url}")
-
-                for row in data:
-                    # 부족하면 빈 문자열로 채우기
-                    if len(row) < header_len:
-                        row = row + [''] * (header_len - len(row))
-                    # 넘치면 자르기
-                    elif len(row) > header_len:
-                        row = row[:header_len]
-                    fixed_data.append([convert_to_number(cell) for cell in row])
-            else:
-                fixed_data = [[convert_to_number(cell) for cell in row] for row in data]
-
-            # 데이터프레임 생성
-            df = pd.DataFrame(fixed_data, columns=unique_headers)
-            print(f"📩 데이터 로드 완료 (행: {len(df)}, 열: {len(df.columns)}) (sheet_name: {sheet_name}, spreadsheet_url: {spreadsheet_url})")
+            df = _values_to_dataframe(values, skip_rows, columnar, sheet_name, spreadsheet_url)
+            if cache_version is not None:
+                self.read_cache.put(cache_key, cache_version, df)
+            console_print(f"📩 데이터 로드 완료 (행: {len(df)}, 열: {len(df.columns)}) (sheet_name: {sheet_name}, spreadsheet_url: {spreadsheet_url})")
             return df
             
         except Exception as e:
-            print(f"⚠️ {inspect.currentframe().f_code.co_name} | 오류 발생: {str(e)}")
-            raise 
\ No newline at end of file
+            console_print(f"⚠️ {inspect.currentframe().f_code.co_name} | 오류 발생: {str(e)}")
+            raise 
+
+    def iter_sheet_chunks(self, spreadsheet_url, sheet_name, rows_per_chunk=10000, skip_rows=0, columnar=True):
+        """
+        큰 시트를 rows_per_chunk행씩 나누어 읽어 DataFrame 조각을 하나씩 반환하는 제너레이터
+        시트 메타데이터의 격자 크기(rowCount, columnCount)로 읽을 범위를 정하고 행 구간별로 요청하므로,
+        한 번에 메모리에 올라가는 시트 값은 한 구간 분량으로 제한됩니다.
+        모든 조각은 같은 컬럼명을 사용하며, 열 타입은 첫 번째 조각의 타입에 맞춥니다.
+
+        Args:
+            spreadsheet_url (str): Google 스프레드시트 문서의 URL 또는 ID
+            sheet_name (str): 데이터를 불러올 시트 탭의 이름
+            rows_per_chunk (int, optional): 한 번에 읽을 행 수 (기본값: 10000)
+            skip_rows (int, optional): 헤더 앞에서 건너뛸 행 수 (기본값: 0)
+            columnar (bool, optional): True이면 열 단위 벡터화 연산으로 숫자 변환 (기본값: True)
+
+        Yields:
+            pandas.DataFrame: 데이터 조각 (인덱스는 시트 전체 기준 0부터 이어지는 행 번호)
+
+        * example: 100만 행 시트를 일정한 메모리로 집계\n
+            total = 0
+            for chunk in sheet_manager.iter_sheet_chunks(url, 'raw_data', rows_per_chunk=50000):
+                total += chunk['금액'].sum()
+        """
+        spreadsheet_id = extract_spreadsheet_id(spreadsheet_url)
+        spreadsheet_url = convert_sheetid_to_url(spreadsheet_id)
+        properties = next((sheet for sheet in self._get_sheet_properties_with_retry(spreadsheet_id) if sheet['title'] == sheet_name), None)
+        if properties is None:
+            properties = next((sheet for sheet in self._get_sheet_properties_with_retry(spreadsheet_id, refresh=True) if sheet['title'] == sheet_name), None)
+        if properties is None:
+            raise ValueError(f"⚠️ {inspect.currentframe().f_code.co_name} | 시트 '{sheet_name}'를 찾을 수 없습니다. - URL: {spreadsheet_url}")
+        row_count = properties.get('gridProperties', {}).get('rowCount', 0)
+        last_column = _column_letter(properties.get('gridProperties', {}).get('columnCount', 1) - 1)
+
+        # 헤더 행
+        header_row = skip_rows + 1
+        result = self.request_with_retry(
+            lambda service: service.spreadsheets().values().get(
+                spreadsheetId=spreadsheet_id,
+                range=f'{sheet_name}!A{header_row}:{last_column}{header_row}'
+            ).execute()
+        )
+        headers = (result.get('values') or [[]])[0]
+        if not headers:
+            return
+        headers = _unique_headers(headers)
+        header_len = len(headers)
+        last_column = _column_letter(header_len - 1)
+
+        dtypes = None
+        row_offset = 0
+        chunk_count = 0
+        blank_rows = 0
+        for start_row in range(header_row + 1, row_count + 1, rows_per_chunk):
+            end_row = min(start_row + rows_per_chunk - 1, row_count)
+            result = self.request_with_retry(
+                lambda service: service.spreadsheets().values().get(
+                    spreadsheetId=spreadsheet_id,
+                    range=f'{sheet_name}!A{start_row}:{last_column}{end_row}'
+                ).execute()
+            )
+            rows = result.get('values', [])
+            # 구간 끝의 빈 행은 응답에서 생략되므로, 뒤에 데이터가 더 있으면 다음 조각 앞에 빈 행으로 채움
+            # (시트 전체를 한 번에 읽을 때와 같은 행 구성)
+            if not rows:
+                blank_rows += end_row - start_row + 1
+                continue
+            rows = [[] for _ in range(blank_rows)] + rows
+            blank_rows = end_row - start_row + 1 - len(rows) + blank_rows
+            # 첫 행을 헤더 길이로 맞춰 조각마다 열 개수 경고가 출력되지 않게 함 (짧은 행의 빈 칸과 같은 None으로 채움)
+            rows[0] = rows[0] + [None] * (header_len - len(rows[0]))
+            df = _values_to_dataframe([headers] + rows, 0, columnar, sheet_name, spreadsheet_url)
+            if dtypes is None:
+                dtypes = df.dtypes.to_dict()
+            else:
+                mismatched = _align_dtypes(df, dtypes)
+                if mismatched:
+                    console_print(f"⚠️ {inspect.currentframe().f_code.co_name} | 첫 조각과 타입이 다른 열: {', '.join(map(str, mismatched))} (행 {start_row}~{end_row})")
+            df.index = pd.RangeIndex(row_offset, row_offset + len(df))
+            row_offset += len(df)
+            chunk_count += 1
+            yield df
+
+        console_print(f"📩 데이터 로드 완료 (행: {row_offset}, 열: {header_len}, 조각: {chunk_count}개) (sheet_name: {sheet_name}, spreadsheet_url: {spreadsheet_url})")
+
+    def get_dataframes_from_sheets(self, spreadsheet_url, sheet_names, skip_rows=0, range_name='A1:ZZZ', columnar=False, max_ranges_per_request=50, max_range_chars=6000, use_cache=True):
+        """
+        여러 시트 탭의 데이터를 values().batchGet으로 한 번에 불러와 시트 이름별 DataFrame으로 반환합니다.
+        요청 URL 길이 제한을 넘지 않도록 범위를 여러 요청으로 나누어 보내며, 각 요청은 개별적으로 재시도합니다.
+        컬럼명 중복 처리와 행 길이 조정 규칙은 get_dataframe_from_sheet와 동일합니다.
+
+        Args:
+            spreadsheet_url (str): Google 스프레드시트 문서의 URL 또는 ID
+            sheet_names (list): 데이터를 불러올 시트 탭 이름 리스트
+            skip_rows (int, optional): 첫 번째 행을 건너뛸 행 수 (기본값: 0)
+            range_name (str, optional): 각 시트에서 데이터를 불러올 범위 (기본값: 'A1:ZZZ')
+            columnar (bool, optional): True이면 열 단위 벡터화 연산으로 숫자 변환 (기본값: False)
+            max_ranges_per_request (int, optional): 한 번의 batchGet 요청에 담을 최대 범위 수 (기본값: 50)
+            max_range_chars (int, optional): 한 번의 batchGet 요청에 담을 범위 문자열의 URL 인코딩 후 길이 합계 상한 (기본값: 6000)
+                (한글 시트 이름은 인코딩하면 글자당 9자로 늘어남)
+            use_cache (bool, optional): False이면 읽기 캐시를 사용하지 않고 항상 새로 읽음 (기본값: True)
+
+        Returns:
+            dict: {시트이름: pandas.DataFrame, ...} (찾을 수 없는 시트는 제외)
+        """
+        spreadsheet_id = extract_spreadsheet_id(spreadsheet_url)
+        spreadsheet_url = convert_sheetid_to_url(spreadsheet_id)
+
+        # 버전 확인 한 번으로 모든 시트의 캐시 사용 여부를 결정하고, 캐시에 없는 시트만 요청
+        dataframes = {}
+        cache_version = None
+        if use_cache and self.read_cache is not None:
+            cache_version = self._get_spreadsheet_version(spreadsheet_id)
+            for sheet_name in dict.fromkeys(sheet_names):
+                df = self.read_cache.get(SheetReadCache.make_key(spreadsheet_id, sheet_name, range_name, skip_rows, columnar), cache_version)
+                if df is not None:
+                    dataframes[sheet_name] = df
+            if dataframes:
+                console_print(f"📦 캐시에서 데이터 로드 (시트: {len(dataframes)}개) (spreadsheet_url: {spreadsheet_url})")
+            sheet_names = [sheet_name for sheet_name in sheet_names if sheet_name not in dataframes]
+            if not sheet_names:
+                return dataframes
+
+        # 존재하는 시트만 요청 (없는 시트가 섞이면 batchGet 전체가 실패함)
+        name_to_id = self.get_sheet_name_id_dict(spreadsheet_id)
+        if any(sheet_name not in name_to_id for sheet_name in sheet_names):
+            # 캐시된 메타데이터에 없는 시트가 있으면 최신 메타데이터로 한 번 더 확인
+            name_to_id = {sheet['title']: sheet['sheetId'] for sheet in self._get_sheet_properties_with_retry(spreadsheet_id, refresh=True)}
+        found_sheet_names = []
+        for sheet_name in dict.fromkeys(sheet_names):
+            if sheet_name not in name_to_id:
+                console_print(f"⚠️ {inspect.currentframe().f_code.co_name} | 시트 '{sheet_name}'를 찾을 수 없습니다. - URL: {spreadsheet_url}")
+                continue
+            found_sheet_names.append(sheet_name)
+
+        if not found_sheet_names:
+            raise ValueError(f"⚠️ {inspect.currentframe().f_code.co_name} | 불러올 시트가 없습니다. - URL: {spreadsheet_url}")
+
+        # 요청 크기 제한에 맞게 범위를 나눔
+        chunks = []
+        chunk, chunk_chars = [], 0
+        for sheet_name in found_sheet_names:
+            # 쿼리 문자열에 실제로 들어가는 길이 ('&ranges=' + URL 인코딩한 범위)
+            range_chars = len('&ranges=') + len(urllib.parse.quote(f'{sheet_name}!{range_name}', safe=''))
+            if chunk and (len(chunk) >= max_ranges_per_request or chunk_chars + range_chars > max_range_chars):
+                chunks.append(chunk)
+                chunk, chunk_chars = [], 0
+            chunk.append(sheet_name)
+            chunk_chars += range_chars
+        chunks.append(chunk)
+
+        for chunk in chunks:
+            result = self.request_with_retry(
+                lambda service: service.spreadsheets().values().batchGet(
+                    spreadsheetId=spreadsheet_id,
+                    ranges=[f'{sheet_name}!{range_name}' for sheet_name in chunk]
+                ).execute()
+            )
+            # valueRanges는 요청한 ranges 순서대로 반환됨
+            for sheet_name, value_range in zip(chunk, result.get('valueRanges', [])):
+                values = value_range.get('values', [])
+                if not values or len(values) == 1:  # 데이터가 없거나 컬럼명만 있는 경우 빈 데이터프레임
+                    dataframes[sheet_name] = pd.DataFrame()
+                    continue
+                dataframes[sheet_name] = _values_to_dataframe(values, skip_rows, columnar, sheet_name, spreadsheet_url)
+                if cache_version is not None:
+                    self.read_cache.put(SheetReadCache.make_key(spreadsheet_id, sheet_name, range_name, skip_rows, columnar), cache_version, dataframes[sheet_name])
+
+        console_print(f"📩 데이터 로드 완료 (시트: {len(dataframes)}개, 요청: {len(chunks)}회) (spreadsheet_url: {spreadsheet_url})")
+        return dataframes
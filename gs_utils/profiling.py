@@ -0,0 +1,423 @@
+import cProfile
+import collections
+import contextvars
+import functools
+import inspect
+import io
+import pstats
+import random
+import threading
+import time
+import tracemalloc
+
+CAPTURE_MODES = ('cprofile', 'tracemalloc')
+
+
+class ProfileRegistry:
+    """
+    profile로 측정한 실행 시간을 이름별로 집계하는 저장소
+    이름마다 호출 수, 합계, 최대값과 최근 reservoir_size개 이내의 표본(reservoir sampling)을 보관하여 p50/p95를 계산하고,
+    slow_threshold를 넘은 호출의 cProfile/tracemalloc 결과를 최근 max_slow_calls개까지 보관합니다.
+    """
+
+    def __init__(self, reservoir_size=1024, max_slow_calls=100):
+        """
+        집계 저장소 초기화
+
+        Args:
+            reservoir_size (int, optional): 이름별로 백분위 계산에 보관할 최대 표본 수. 기본값은 1024
+            max_slow_calls (int, optional): 보관할 느린 호출 기록 수. 기본값은 100
+        """
+        self.reservoir_size = reservoir_size
+        self.slow_calls = collections.deque(maxlen=max_slow_calls)
+        self._stats = {}  # {이름: {'count', 'total_ns', 'max_ns', 'samples', 'sample_rate'}}
+        self._lock = threading.Lock()
+
+    def record(self, name, duration_ns, sample_rate=1.0):
+        """
+        측정한 실행 시간 하나를 기록합니다.
+
+        Args:
+            name (str): 측정 이름
+            duration_ns (int): 실행 시간(나노초)
+            sample_rate (float, optional): 측정한 표본 비율 (추정 호출 수 계산용). 기본값은 1.0
+        """
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = {'count': 0, 'total_ns': 0, 'max_ns': 0, 'samples': [], 'sample_rate': sample_rate}
+            stats['count'] += 1
+            stats['total_ns'] += duration_ns
+            stats['max_ns'] = max(stats['max_ns'], duration_ns)
+            samples = stats['samples']
+            if len(samples) < self.reservoir_size:
+                samples.append(duration_ns)
+            else:
+                index = random.randrange(stats['count'])
+                if index < self.reservoir_size:
+                    samples[index] = duration_ns
+
+    def add_slow_call(self, record):
+        """slow_threshold를 넘은 호출의 기록(dict)을 보관합니다."""
+        with self._lock:
+            self.slow_calls.append(record)
+
+    def stats(self):
+        """
+        이름별 집계 결과를 반환합니다. (시간 단위: 초)
+
+        Returns:
+            dict: {이름: {'count': 측정한 호출 수, 'estimated_calls': 표본 비율로 추정한 전체 호출 수,
+                          'total': 합계, 'mean': 평균, 'p50': 중앙값, 'p95': 95백분위, 'max': 최대값}}
+        """
+        with self._lock:
+            snapshot = {name: dict(stats, samples=sorted(stats['samples'])) for name, stats in self._stats.items()}
+        result = {}
+        for name, stats in snapshot.items():
+            samples = stats['samples']
+            result[name] = {
+                'count': stats['count'],
+                'estimated_calls': round(stats['count'] / stats['sample_rate']),
+                'total': stats['total_ns'] / 1e9,
+                'mean': stats['total_ns'] / stats['count'] / 1e9,
+                'p50': _percentile(samples, 0.50) / 1e9,
+                'p95': _percentile(samples, 0.95) / 1e9,
+                'max': stats['max_ns'] / 1e9,
+            }
+        return result
+
+    def report(self):
+        """
+        집계 결과를 합계 시간 순으로 정렬한 표 문자열을 반환합니다.
+        """
+        stats = self.stats()
+        lines = [f"{'name':<40} | {'count':>8} | {'total (s)':>10} | {'p50 (ms)':>9} | {'p95 (ms)':>9} | {'max (ms)':>9}", '-' * 98]
+        for name, item in sorted(stats.items(), key=lambda entry: entry[1]['total'], reverse=True):
+            lines.append(
+                f"{name[-40:]:<40} | {item['count']:>8,} | {item['total']:>10.3f} | "
+                f"{item['p50'] * 1e3:>9.2f} | {item['p95'] * 1e3:>9.2f} | {item['max'] * 1e3:>9.2f}"
+            )
+        return '\n'.join(lines)
+
+    def reset(self):
+        """집계 결과와 느린 호출 기록을 모두 지웁니다."""
+        with self._lock:
+            self._stats.clear()
+            self.slow_calls.clear()
+
+
+# profile에서 registry를 지정하지 않으면 사용하는 기본 저장소
+profile_registry = ProfileRegistry()
+
+
+class profile:
+    """
+    함수, 코루틴 함수, 제너레이터 함수의 실행 시간을 측정하여 ProfileRegistry에 집계하는 데코레이터 겸 컨텍스트 매니저
+    출력하지 않고 perf_counter_ns로 측정하며, sample_rate로 일부 호출만 측정하여 운영 환경에서도 켜 둘 수 있습니다.
+    제너레이터는 값을 만드는 데 걸린 시간(소비하는 쪽에서 기다린 시간 제외)을 측정합니다.
+
+    * example 1: 데코레이터\n
+        @profile
+        def load(): ...
+
+        @profile(sample_rate=0.01, slow_threshold=2.0, capture='cprofile')
+        async def fetch(): ...
+
+    * example 2: 컨텍스트 매니저\n
+        with profile('sheet upload'):
+            sheet_manager.clear_and_set_worksheet(...)
+
+        print(profile_registry.report())
+    """
+
+    def __init__(self, name=None, sample_rate=1.0, registry=None, slow_threshold=None, capture=None):
+        """
+        측정 설정
+
+        Args:
+            name (str | callable, optional): 집계 이름. 기본값은 None (데코레이터는 '모듈.함수' 이름 사용)
+                (@profile처럼 인자 없이 함수에 바로 붙이면 그 함수)
+            sample_rate (float, optional): 측정할 호출 비율 (0~1). 기본값은 1.0 (모든 호출 측정)
+            registry (ProfileRegistry, optional): 집계할 저장소. 기본값은 None (profile_registry)
+            slow_threshold (float, optional): 이 시간(초) 이상 걸린 호출을 registry.slow_calls에 기록. 기본값은 None (기록 안 함)
+            capture (str, optional): 느린 호출 기록에 함께 남길 정보 ('cprofile': 함수별 실행 시간, 'tracemalloc': 메모리 할당 상위 위치).
+                측정하는 호출마다 수집하므로 sample_rate를 낮춰서 사용. 기본값은 None
+        """
+        function = None
+        if callable(name):
+            function, name = name, None
+        if capture is not None and capture not in CAPTURE_MODES:
+            raise ValueError(f"⚠️ profile | 지원하지 않는 capture입니다: {capture} (가능한 값: {', '.join(CAPTURE_MODES)})")
+        self.name = name
+        self.sample_rate = sample_rate
+        self.registry = registry if registry is not None else profile_registry
+        self.slow_threshold_ns = int(slow_threshold * 1e9) if slow_threshold is not None else None
+        self.capture = capture
+        # with/async with로 측정 중인 _Measurement 스택 (스레드와 asyncio 작업마다 따로 관리되도록 ContextVar 사용)
+        self._active = contextvars.ContextVar(f'profile_{id(self)}', default=())
+        self._wrapped = self._wrap(function) if function is not None else None
+
+    def __call__(self, *args, **kwargs):
+        if self._wrapped is not None:
+            # @profile로 바로 감싼 함수 호출
+            return self._wrapped(*args, **kwargs)
+        return self._wrap(args[0])
+
+    def __get__(self, instance, owner):
+        # @profile로 감싼 메서드가 인스턴스에 바인딩되도록 처리
+        if instance is None or self._wrapped is None:
+            return self
+        return functools.partial(self._wrapped, instance)
+
+    def _sampled(self):
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+    def _wrap(self, func):
+        name = self.name or f"{func.__module__}.{func.__qualname__}"
+
+        if inspect.isasyncgenfunction(func):
+            @functools.wraps(func)
+            async def async_gen_wrapper(*args, **kwargs):
+                if not self._sampled():
+                    async for item in func(*args, **kwargs):
+                        yield item
+                    return
+                measurement = _Measurement(self, name)
+                try:
+                    iterator = func(*args, **kwargs).__aiter__()
+                    while True:
+                        measurement.resume()
+                        try:
+                            item = await iterator.__anext__()
+                        except StopAsyncIteration:
+                            return
+                        finally:
+                            measurement.pause()
+                        yield item
+                finally:
+                    measurement.finish()
+            return async_gen_wrapper
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not self._sampled():
+                    return await func(*args, **kwargs)
+                # 기다리는 동안의 시간도 포함한 호출 전체 시간
+                measurement = _Measurement(self, name)
+                measurement.resume()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    measurement.pause()
+                    measurement.finish()
+            return async_wrapper
+
+        if inspect.isgeneratorfunction(func):
+            @functools.wraps(func)
+            def gen_wrapper(*args, **kwargs):
+                if not self._sampled():
+                    return (yield from func(*args, **kwargs))
+                return (yield from _measure_generator(func(*args, **kwargs), _Measurement(self, name)))
+            return gen_wrapper
+
+        if self.capture is None and self.slow_threshold_ns is None:
+            # 수집할 정보가 없으면 측정 객체 없이 시간만 기록
+            record, sample_rate, perf_counter_ns = self.registry.record, self.sample_rate, time.perf_counter_ns
+
+            @functools.wraps(func)
+            def fast_wrapper(*args, **kwargs):
+                if sample_rate < 1.0 and random.random() >= sample_rate:
+                    return func(*args, **kwargs)
+                start = perf_counter_ns()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    record(name, perf_counter_ns() - start, sample_rate)
+            return fast_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self._sampled():
+                return func(*args, **kwargs)
+            measurement = _Measurement(self, name)
+            measurement.resume()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                measurement.pause()
+                measurement.finish()
+        return wrapper
+
+    def __enter__(self):
+        if self.name is None:
+            raise ValueError("⚠️ profile | 컨텍스트 매니저로 사용할 때는 name이 필요합니다.")
+        measurement = _Measurement(self, self.name) if self._sampled() else None
+        # 작업이 블록 안에서 만든 하위 작업은 컨텍스트를 복사하므로 리스트를 공유하지 않도록 튜플로 교체
+        self._active.set(self._active.get() + (measurement,))
+        if measurement is not None:
+            measurement.resume()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        stack = self._active.get()
+        measurement = stack[-1]
+        self._active.set(stack[:-1])
+        if measurement is not None:
+            measurement.pause()
+            measurement.finish()
+        return False
+
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return self.__exit__(exc_type, exc, tb)
+
+
+# tracemalloc은 프로세스 전역이므로 동시에 실행 중인 측정 수를 세어 마지막 측정이 끝날 때만 멈춥니다.
+_tracemalloc_lock = threading.Lock()
+_tracemalloc_users = 0
+_tracemalloc_started = False  # profile이 직접 start()했는지 여부 (외부에서 켠 추적은 멈추지 않음)
+
+# cProfile은 스레드마다 하나만 활성화될 수 있으므로 스레드별로 사용 중인 측정을 기록합니다.
+_profiler_owner = threading.local()
+
+
+def _acquire_tracemalloc():
+    global _tracemalloc_users, _tracemalloc_started
+    with _tracemalloc_lock:
+        if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracemalloc_started = True
+        _tracemalloc_users += 1
+
+
+def _release_tracemalloc():
+    global _tracemalloc_users, _tracemalloc_started
+    with _tracemalloc_lock:
+        _tracemalloc_users -= 1
+        if _tracemalloc_users == 0 and _tracemalloc_started:
+            _tracemalloc_started = False
+            tracemalloc.stop()
+
+
+class _Measurement:
+    """
+    측정하는 호출 하나의 실행 시간 누적과 cProfile/tracemalloc 수집
+    수집 중 발생한 오류는 호출 결과에 영향을 주지 않고 느린 호출 기록의 capture_error에 남깁니다.
+    """
+
+    __slots__ = ('config', 'name', 'elapsed_ns', '_start', '_profiler', '_tracing', '_tracemalloc_start', '_capture_error')
+
+    def __init__(self, config, name):
+        self.config = config
+        self.name = name
+        self.elapsed_ns = 0
+        self._start = 0
+        self._profiler = None
+        self._tracing = False
+        self._tracemalloc_start = None
+        self._capture_error = None
+        if config.capture == 'cprofile':
+            self._profiler = cProfile.Profile()
+        elif config.capture == 'tracemalloc':
+            try:
+                _acquire_tracemalloc()
+                self._tracing = True
+                self._tracemalloc_start = tracemalloc.take_snapshot()
+            except Exception as e:
+                self._capture_error = f"tracemalloc: {e}"
+
+    def resume(self):
+        if self._profiler is not None:
+            owner = getattr(_profiler_owner, 'measurement', None)
+            if owner is not None and owner is not self:
+                # 같은 스레드의 다른 측정(동시에 실행 중인 코루틴 등)이 cProfile을 사용 중이면 수집 생략
+                self._drop_profiler("다른 측정이 같은 스레드에서 cProfile을 사용 중입니다.")
+            else:
+                try:
+                    self._profiler.enable()
+                    _profiler_owner.measurement = self
+                except ValueError as e:
+                    # 다른 프로파일러가 이미 실행 중이면 수집 생략
+                    self._drop_profiler(str(e))
+        self._start = time.perf_counter_ns()
+
+    def pause(self):
+        self.elapsed_ns += time.perf_counter_ns() - self._start
+        if self._profiler is not None and getattr(_profiler_owner, 'measurement', None) is self:
+            _profiler_owner.measurement = None
+            try:
+                self._profiler.disable()
+            except Exception as e:
+                self._drop_profiler(str(e))
+
+    def _drop_profiler(self, reason):
+        self._profiler = None
+        self._capture_error = f"cprofile: {reason}"
+
+    def finish(self):
+        config = self.config
+        config.registry.record(self.name, self.elapsed_ns, config.sample_rate)
+        try:
+            if config.slow_threshold_ns is None or self.elapsed_ns < config.slow_threshold_ns:
+                return
+            record = {'name': self.name, 'duration': self.elapsed_ns / 1e9, 'finished_at': time.time()}
+            try:
+                if self._profiler is not None:
+                    stream = io.StringIO()
+                    pstats.Stats(self._profiler, stream=stream).sort_stats('cumulative').print_stats(20)
+                    record['profile'] = stream.getvalue()
+                if self._tracemalloc_start is not None:
+                    top_stats = tracemalloc.take_snapshot().compare_to(self._tracemalloc_start, 'lineno')
+                    record['memory'] = [str(stat) for stat in top_stats[:10]]
+            except Exception as e:
+                self._capture_error = f"{config.capture}: {e}"
+            if self._capture_error is not None:
+                record['capture_error'] = self._capture_error
+            config.registry.add_slow_call(record)
+        finally:
+            if self._tracing:
+                self._tracing = False
+                try:
+                    _release_tracemalloc()
+                except Exception:
+                    pass
+
+
+def _measure_generator(generator, measurement):
+    """제너레이터가 값을 만드는 동안의 시간만 측정하며 send/throw/close를 그대로 전달합니다."""
+    send_value = None
+    error = None
+    try:
+        while True:
+            measurement.resume()
+            try:
+                if error is not None:
+                    item = generator.throw(error)
+                else:
+                    item = generator.send(send_value)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                measurement.pause()
+                error = None
+            try:
+                send_value = yield item
+            except GeneratorExit:
+                raise
+            except BaseException as e:
+                error = e
+                send_value = None
+    finally:
+        generator.close()
+        measurement.finish()
+
+
+def _percentile(sorted_samples, fraction):
+    """정렬된 표본의 백분위 값 (nearest-rank, 표본이 없으면 0)"""
+    if not sorted_samples:
+        return 0
+    index = min(len(sorted_samples) - 1, max(0, int(round(fraction * len(sorted_samples) + 0.5)) - 1))
+    return sorted_samples[index]
@@ -22,6 +22,9 @@ setup(
         'pyautogui>=0.9.50',
         'pywinauto>=0.6.8',
     ],
+    extras_require={
+        'parquet': ['pyarrow>=7.0.0'],
+    },
     python_requires='>=3.7',
     classifiers=[
         'Development Status :: 4 - Beta',